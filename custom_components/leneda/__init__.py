@@ -9,17 +9,21 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 import voluptuous as vol
 import homeassistant.helpers.config_validation as cv
 
 from .api import LenedaApiClient
-from .const import CONF_API_KEY, CONF_ENERGY_ID, CONF_METERING_POINT_ID, DOMAIN
+from .const import CONF_API_KEY, CONF_ENERGY_ID, CONF_METERING_POINT_ID, CONF_REFERENCE_POWER_ENTITY, DATA_PEAK_SUMMARIES, DOMAIN, SHARED_DATA_KEYS
 from .coordinator import LenedaDataUpdateCoordinator
+from .routes import invalidate_route_index
 from .storage import LenedaStorage
-from .http_api import async_register_api_views
+from .summaries import PeakSummaryStore
+from .http_api import async_invalidate_response_cache, async_register_api_views
+from .tracing import async_setup_tracing
 from .panel import LenedaPanelView, LenedaStaticView
 
 _LOGGER = logging.getLogger(__name__)
@@ -52,6 +56,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         storage = LenedaStorage(hass)
         await storage.async_load()
         hass.data[DOMAIN]["storage"] = storage
+        summaries = PeakSummaryStore(hass)
+        await summaries.async_load()
+        hass.data[DOMAIN][DATA_PEAK_SUMMARIES] = summaries
+        async_setup_tracing(hass)
 
     # ── Coordinator ──
     coordinator = LenedaDataUpdateCoordinator(
@@ -59,10 +67,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     await coordinator.async_config_entry_first_refresh()
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    invalidate_route_index(hass)
+
+    # Cached live-range API responses are stale once fresh data arrives
+    entry.async_on_unload(
+        coordinator.async_add_listener(lambda: async_invalidate_response_cache(hass))
+    )
+
+    # Recompute exceedance in place when the reference power entity changes
+    if ref_entity := entry.data.get(CONF_REFERENCE_POWER_ENTITY):
+
+        @callback
+        def _reference_changed(event: Event) -> None:
+            old_state, new_state = event.data.get("old_state"), event.data.get("new_state")
+            if old_state is not None and new_state is not None and old_state.state == new_state.state:
+                return  # attribute-only change
+            coordinator.async_recompute_derived()
+
+        entry.async_on_unload(
+            async_track_state_change_event(hass, [ref_entity], _reference_changed)
+        )
 
     # ── Sensor platform ──
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Reload when the options (additional meters) change
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     # ── Service: request_data_access ──
     async def handle_data_access_request(call):
         """Handle the data access request service call."""
@@ -112,16 +143,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry after its options were updated."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        invalidate_route_index(hass)
         hass.services.async_remove(DOMAIN, "request_data_access")
 
         # If this was the last entry, remove the sidebar panel
         remaining = [
             eid for eid in hass.data.get(DOMAIN, {})
-            if eid not in ("storage", "views_registered")
+            if eid not in SHARED_DATA_KEYS
         ]
         if not remaining:
             try:
@@ -34,17 +34,29 @@ class NoDataError(LenedaApiError):
 
 from homeassistant.util import dt as dt_util
 
-from .const import API_BASE_URL, GAS_OBIS_CODES, OBIS_CODES
+from .const import API_BASE_URL, GAS_OBIS_CODES, MAX_CONCURRENT_REQUESTS, OBIS_CODES
+from .tracing import trace_payload
 
 
 class LenedaApiClient:
     """A simple API client for the Leneda API."""
 
-    def __init__(self, session: aiohttp.ClientSession, api_key: str, energy_id: str):
-        """Initialize the API client."""
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        api_key: str,
+        energy_id: str,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ):
+        """Initialize the API client.
+
+        At most *max_concurrency* requests are in flight at once, so large
+        meter fan-outs queue here instead of flooding the Leneda API.
+        """
         self._session = session
         self._api_key = api_key
         self._energy_id = energy_id
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
     async def async_get_metering_data(
         self,
@@ -81,10 +93,13 @@ class LenedaApiClient:
         url = f"{API_BASE_URL}/api/metering-points/{metering_point_id}/time-series"
         _LOGGER.debug("Requesting Leneda metering data from %s with params %s", url, params)
 
-        async with self._session.get(url, headers=headers, params=params) as response:
+        async with self._semaphore, self._session.get(url, headers=headers, params=params) as response:
             response.raise_for_status()
             json_response = await response.json()
-            _LOGGER.debug("Leneda metering data response: %s", json_response)
+            trace_payload(
+                _LOGGER, "Leneda metering data response", json_response,
+                metering_point_id, obis_code, size=response.content_length,
+            )
             return json_response
 
     async def async_get_aggregated_metering_data(
@@ -125,10 +140,13 @@ class LenedaApiClient:
         url = f"{API_BASE_URL}/api/metering-points/{metering_point_id}/time-series/aggregated"
         _LOGGER.debug("Requesting Leneda aggregated data from %s with params %s", url, params)
 
-        async with self._session.get(url, headers=headers, params=params) as response:
+        async with self._semaphore, self._session.get(url, headers=headers, params=params) as response:
             response.raise_for_status()
             json_response = await response.json()
-            _LOGGER.debug("Leneda aggregated data response: %s", json_response)
+            trace_payload(
+                _LOGGER, "Leneda aggregated data response", json_response,
+                metering_point_id, obis_code, aggregation_level, size=response.content_length,
+            )
             return json_response
 
     async def test_credentials(self, metering_point_id: str) -> bool:
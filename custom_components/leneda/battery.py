@@ -0,0 +1,192 @@
+"""Home-battery simulation over 15-minute consumption and production.
+
+The battery state of charge depends on every previous interval, so the
+dispatch itself is a sequential walk. It runs over plain Python floats (a
+year is ~35k steps, tens of milliseconds); everything around it — aligning
+production, reference lookups, exceedance and pricing — reuses the
+vectorized exceedance and billing engines, so the baseline and the battery
+case are evaluated exactly like a real bill.
+
+Strategies:
+- ``self_consumption``: charge from solar surplus, discharge to cover any
+  grid draw.
+- ``peak_shaving``: charge from solar surplus, discharge only the draw
+  above the reference power (keeps energy for peaks).
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import tzinfo
+from typing import Any
+
+import numpy as np
+
+from .billing import compute_invoice, price_consumption
+from .exceedance import INTERVAL_HOURS, IntervalSeries, align_to, overage_kwh, peak_kw
+from .models import BillingConfig
+
+STRATEGIES = ("self_consumption", "peak_shaving")
+
+
+@dataclass(frozen=True)
+class BatteryModel:
+    """Battery parameters."""
+
+    capacity_kwh: float
+    power_kw: float
+    efficiency: float = 0.9  # round trip
+    strategy: str = "self_consumption"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BatteryModel:
+        """Build and validate a model from request parameters.
+
+        Raises ValueError for missing or out-of-range values.
+        """
+        model = cls(
+            capacity_kwh=float(data["capacity_kwh"]),
+            power_kw=float(data["power_kw"]),
+            efficiency=float(data.get("efficiency", 0.9)),
+            strategy=str(data.get("strategy", "self_consumption")),
+        )
+        if model.capacity_kwh <= 0 or model.power_kw <= 0 or not 0 < model.efficiency <= 1:
+            raise ValueError("capacity_kwh and power_kw must be > 0, efficiency in (0, 1]")
+        if model.strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {', '.join(STRATEGIES)}")
+        return model
+
+
+def dispatch(
+    model: BatteryModel,
+    balance_kw: np.ndarray,
+    reference_kw: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """Run the battery over signed load-minus-solar *balance_kw*.
+
+    Returns the battery power per interval (positive = discharge, negative
+    = charge, in kW at the household side), the state of charge at the end
+    of each interval (kWh) and the energy lost to conversion (kWh).
+    """
+    leg = math.sqrt(model.efficiency)  # split round-trip losses over both legs
+    capacity = model.capacity_kwh
+    max_kw = model.power_kw
+    peak_shaving = model.strategy == "peak_shaving"
+
+    balance = balance_kw.tolist()
+    reference = reference_kw.tolist()
+    power = [0.0] * len(balance)
+    soc_trace = [0.0] * len(balance)
+    soc = 0.0
+    losses = 0.0
+    for i, net in enumerate(balance):
+        if net < 0:
+            charge = min(-net, max_kw, (capacity - soc) / (leg * INTERVAL_HOURS))
+            soc += charge * leg * INTERVAL_HOURS
+            losses += charge * (1 - leg) * INTERVAL_HOURS
+            power[i] = -charge
+        elif net > 0 and soc > 0:
+            if peak_shaving:
+                ref = reference[i]
+                target = net - ref if ref == ref and net > ref else 0.0  # NaN: no reference
+            else:
+                target = net
+            discharge = min(target, max_kw, soc * leg / INTERVAL_HOURS)
+            if discharge > 0:
+                soc -= discharge / leg * INTERVAL_HOURS
+                losses += discharge * (1 / leg - 1) * INTERVAL_HOURS
+                power[i] = discharge
+        soc_trace[i] = soc
+    return np.array(power), np.array(soc_trace), losses
+
+
+def _grid_summary(
+    config: BillingConfig,
+    epoch: np.ndarray,
+    grid_import: np.ndarray,
+    grid_export: np.ndarray,
+    produced_kwh: float,
+    reference_kw: np.ndarray,
+    proration: float,
+    feed_in_rate: float,
+    tz: tzinfo | None,
+) -> dict[str, Any]:
+    """Import/export totals, exceedance and bill for one grid profile."""
+    import_kwh = float(grid_import.sum() * INTERVAL_HOURS)
+    export_kwh = float(grid_export.sum() * INTERVAL_HOURS)
+    exceedance = overage_kwh(grid_import, reference_kw)
+    priced = price_consumption(config, IntervalSeries(epoch, grid_import), tz) if config.consumption_rate_windows else None
+    invoice = compute_invoice(
+        config,
+        {
+            "consumption": import_kwh,
+            "exported": export_kwh,
+            "self_consumed": max(0.0, produced_kwh - export_kwh),
+            "exceedance_kwh": exceedance,
+        },
+        proration,
+        feed_in_rate,
+        priced,
+    )
+    return {
+        "grid_import_kwh": round(import_kwh, 4),
+        "grid_export_kwh": round(export_kwh, 4),
+        "peak_import_kw": round(peak_kw(grid_import), 3),
+        "exceedance_kwh": round(exceedance, 4),
+        "cost": invoice["net_total"],
+        "invoice": invoice,
+    }
+
+
+def simulate_battery(
+    model: BatteryModel,
+    config: BillingConfig,
+    consumption: IntervalSeries,
+    production: IntervalSeries | None,
+    reference_kw: np.ndarray,
+    proration: float,
+    feed_in_rate: float,
+    tz: tzinfo | None = None,
+) -> dict[str, Any]:
+    """Compare the grid profile and bill with and without *model*.
+
+    *reference_kw* holds the reference power per consumption reading (NaN
+    where none applies), e.g. from ``ReferenceSchedule.lookup``.
+    """
+    known = consumption.epoch >= 0
+    epoch = consumption.epoch[known]
+    load = consumption.values[known]
+    solar = align_to(consumption, production)[known]
+    reference = reference_kw[known]
+    order = np.argsort(epoch, kind="stable")
+    epoch, load, solar, reference = epoch[order], load[order], solar[order], reference[order]
+
+    balance = load - solar
+    produced_kwh = float(solar.sum() * INTERVAL_HOURS)
+    battery_kw, soc, losses = dispatch(model, balance, reference)
+    after = balance - battery_kw
+
+    args = (produced_kwh, reference, proration, feed_in_rate, tz)
+    baseline = _grid_summary(config, epoch, np.maximum(balance, 0.0), np.maximum(-balance, 0.0), *args)
+    with_battery = _grid_summary(config, epoch, np.maximum(after, 0.0), np.maximum(-after, 0.0), *args)
+
+    discharged = float(battery_kw[battery_kw > 0].sum() * INTERVAL_HOURS)
+    return {
+        "battery": {
+            "capacity_kwh": model.capacity_kwh,
+            "power_kw": model.power_kw,
+            "efficiency": model.efficiency,
+            "strategy": model.strategy,
+            "discharged_kwh": round(discharged, 4),
+            "equivalent_cycles": round(discharged / model.capacity_kwh, 2),
+            "losses_kwh": round(losses, 4),
+            "final_soc_kwh": round(float(soc[-1]), 4) if len(soc) else 0.0,
+        },
+        "baseline": baseline,
+        "with_battery": with_battery,
+        "savings": round(baseline["cost"] - with_battery["cost"], 4),
+        "delta": {
+            key: round(with_battery[key] - baseline[key], 4)
+            for key in ("grid_import_kwh", "grid_export_kwh", "peak_import_kw", "exceedance_kwh", "cost")
+        },
+    }
@@ -0,0 +1,302 @@
+"""Server-side billing engine for the Leneda integration.
+
+The invoice model mirrors the dashboard's cost estimate (fixed fees prorated
+to the period, network charges, exceedance surcharge, levies, VAT, feed-in
+revenue and gas).
+
+Time-of-use supplier pricing (``BillingConfig.consumption_rate_windows``)
+is compiled into the same weekly 15-minute slot table used for the
+reference-power schedule (see ``schedule.py``). Pricing a period is then a
+single vectorized pass: look up each reading's slot rate, multiply by its
+energy and accumulate per window with ``bincount``.
+
+Tariff comparison goes one step further: consumption is binned once into
+kWh per weekly slot, so every scenario's supplier cost is a row of a single
+matrix-vector product, and exceedance for all scenarios comes from one
+broadcast against the stacked reference-power tables.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import tzinfo
+from typing import Any
+
+import numpy as np
+
+from .exceedance import INTERVAL_HOURS, IntervalSeries
+from .models import BillingConfig
+from .schedule import SLOTS_PER_WEEK, compile_window_table, week_slots, windows_key
+
+BASE_TARIFF_LABEL = "Base tariff"
+
+
+@dataclass
+class RateTable:
+    """Compiled time-of-use rates for one billing config."""
+
+    rates: np.ndarray  # rate per weekly slot
+    window_index: np.ndarray  # matching window per slot, -1 for the base rate
+    labels: list[str]  # label per window (index-aligned with the config windows)
+    window_rates: list[float]
+    base_rate: float
+
+    @classmethod
+    def from_config(cls, config: BillingConfig) -> RateTable:
+        """Compile ``consumption_rate_windows`` (first match wins)."""
+        windows = [w for w in (config.consumption_rate_windows or []) if isinstance(w, dict)]
+        base_rate = float(config.energy_variable_rate)
+        rates, window_index = compile_window_table(windows_key(windows, "rate"), base_rate)
+        labels = [str(w.get("label") or "").strip() or f"Window {i + 1}" for i, w in enumerate(windows)]
+        window_rates = []
+        for w in windows:
+            try:
+                window_rates.append(float(w.get("rate")))
+            except (TypeError, ValueError):
+                window_rates.append(base_rate)
+        return cls(rates, window_index, labels, window_rates, base_rate)
+
+
+def price_consumption(
+    config: BillingConfig,
+    series: IntervalSeries,
+    tz: tzinfo | None = None,
+    table: RateTable | None = None,
+) -> dict[str, Any]:
+    """Price a 15-min consumption series with the configured time-of-use rates.
+
+    Returns total kWh, supplier energy cost and a per-window breakdown
+    (``label``, ``rate``, ``kwh``, ``cost``) sorted by label. Readings without
+    a timestamp are ignored, as in the invoice view.
+    """
+    table = table or RateTable.from_config(config)
+    known = series.epoch >= 0
+    epoch = series.epoch[known]
+    kwh = series.values[known] * INTERVAL_HOURS
+
+    slots = week_slots(epoch, tz)
+    rates = table.rates[slots]
+    window = table.window_index[slots].astype(np.int64) + 1  # 0 = base tariff
+
+    n_bins = len(table.labels) + 1
+    kwh_per_window = np.bincount(window, weights=kwh, minlength=n_bins)
+    cost_per_window = np.bincount(window, weights=kwh * rates, minlength=n_bins)
+
+    # Merge windows that share label and rate, like the invoice breakdown does
+    merged: dict[tuple[str, float], dict[str, Any]] = {}
+    for idx in range(n_bins):
+        if kwh_per_window[idx] == 0 and idx > 0:
+            continue
+        label = BASE_TARIFF_LABEL if idx == 0 else table.labels[idx - 1]
+        rate = table.base_rate if idx == 0 else table.window_rates[idx - 1]
+        entry = merged.setdefault((label, rate), {"label": label, "rate": rate, "kwh": 0.0, "cost": 0.0})
+        entry["kwh"] += float(kwh_per_window[idx])
+        entry["cost"] += float(cost_per_window[idx])
+
+    breakdown = [
+        {**entry, "kwh": round(entry["kwh"], 4), "cost": round(entry["cost"], 4)}
+        for entry in sorted(merged.values(), key=lambda e: e["label"])
+        if entry["kwh"] or entry["label"] == BASE_TARIFF_LABEL
+    ]
+    return {
+        "energy_kwh": round(float(kwh.sum()), 4),
+        "energy_cost": round(float(cost_per_window.sum()), 4),
+        "uses_windows": bool(table.labels),
+        "breakdown": breakdown,
+    }
+
+
+def average_feed_in_rate(
+    config: BillingConfig,
+    production_meter_ids: list[str],
+    sensor_values: dict[str, float | None],
+) -> float:
+    """Return the mean feed-in rate across production meters.
+
+    Per-meter ``feed_in_rates`` entries win; sensor-mode entries use the
+    resolved *sensor_values* and fall back to their fixed tariff. Meters
+    without an entry use the global ``feed_in_tariff``.
+    """
+    by_meter = {
+        r.get("meter_id"): r for r in (config.feed_in_rates or []) if isinstance(r, dict)
+    }
+    rates: list[float] = []
+    for meter_id in production_meter_ids:
+        entry = by_meter.get(meter_id)
+        if entry is None:
+            rates.append(float(config.feed_in_tariff))
+            continue
+        sensor_value = sensor_values.get(entry.get("sensor_entity", ""))
+        if entry.get("mode") == "sensor" and sensor_value is not None and np.isfinite(sensor_value):
+            rates.append(float(sensor_value))
+            continue
+        try:
+            rates.append(float(entry.get("tariff")))
+        except (TypeError, ValueError):
+            rates.append(float(config.feed_in_tariff))
+
+    valid = [r for r in rates if np.isfinite(r) and r > 0]
+    return sum(valid) / len(valid) if valid else float(config.feed_in_tariff)
+
+
+def compute_invoice(
+    config: BillingConfig,
+    usage: dict[str, Any],
+    proration: float,
+    feed_in_rate: float,
+    priced_energy: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Return the full bill for one period (Luxembourg billing model).
+
+    *usage* carries the period totals produced by the data endpoints
+    (consumption, exported, self_consumed, gas_energy, exceedance_kwh, ...).
+    Monthly fixed fees are scaled by *proration* (period days / month days).
+    When *priced_energy* (from ``price_consumption``) is given, time-of-use
+    supplier pricing replaces the flat variable rate. Gas only counts towards
+    the combined total when the period has gas usage.
+    """
+    consumption = float(usage.get("consumption") or 0)
+    exported = float(usage.get("exported") or 0)
+    self_consumed = float(usage.get("self_consumed") or 0)
+    exceedance = float(usage.get("exceedance_kwh") or 0)
+    gas_energy = float(usage.get("gas_energy") or 0)
+    has_gas = gas_energy > 0 or float(usage.get("gas_volume") or 0) > 0
+
+    uses_windows = bool(priced_energy and priced_energy.get("uses_windows"))
+    energy_cost = priced_energy["energy_cost"] if uses_windows else consumption * config.energy_variable_rate
+    meter_fees = sum(float(f.get("fee") or 0) for f in (config.meter_monthly_fees or []) if isinstance(f, dict))
+
+    electricity = {
+        "energy_fixed_fee": config.energy_fixed_fee * proration,
+        "energy_variable": energy_cost,
+        "network_metering": config.network_metering_rate * proration,
+        "network_power_reference": config.network_power_ref_rate * proration,
+        "network_variable": consumption * config.network_variable_rate,
+        "exceedance": exceedance * config.exceedance_rate,
+        "meter_fees": meter_fees * proration,
+        "compensation_fund": consumption * config.compensation_fund_rate,
+        "electricity_tax": consumption * config.electricity_tax_rate,
+        "connect_discount": -max(0.0, config.connect_discount or 0.0) * proration,
+    }
+    subtotal = sum(electricity.values())
+    vat = subtotal * config.vat_rate
+    total = subtotal + vat
+    feed_in_revenue = exported * feed_in_rate
+
+    self_consumed_savings = self_consumed * (
+        config.energy_variable_rate + config.network_variable_rate
+        + config.electricity_tax_rate + config.compensation_fund_rate
+    ) * (1 + config.vat_rate)
+
+    gas = {
+        "fixed_fee": config.gas_fixed_fee * proration,
+        "variable": gas_energy * config.gas_variable_rate,
+        "network_fee": config.gas_network_fee * proration,
+        "network_variable": gas_energy * config.gas_network_variable_rate,
+        "tax": gas_energy * config.gas_tax_rate,
+    }
+    gas_subtotal = sum(gas.values())
+    gas_vat = gas_subtotal * config.gas_vat_rate
+    gas_total = gas_subtotal + gas_vat
+    net_total = total - feed_in_revenue
+
+    def _r(values: dict[str, float]) -> dict[str, float]:
+        return {k: round(v, 4) for k, v in values.items()}
+
+    return {
+        "proration": round(proration, 4),
+        "electricity": _r(electricity),
+        "electricity_subtotal": round(subtotal, 4),
+        "electricity_vat": round(vat, 4),
+        "electricity_total": round(total, 4),
+        "energy_breakdown": priced_energy.get("breakdown", []) if uses_windows else [],
+        "feed_in_rate": round(feed_in_rate, 6),
+        "feed_in_revenue": round(feed_in_revenue, 4),
+        "self_consumed_savings": round(self_consumed_savings, 4),
+        "solar_value": round(self_consumed_savings + feed_in_revenue, 4),
+        "net_total": round(net_total, 4),
+        "has_gas": has_gas,
+        "gas": _r(gas),
+        "gas_subtotal": round(gas_subtotal, 4),
+        "gas_vat": round(gas_vat, 4),
+        "gas_total": round(gas_total, 4),
+        "combined_total": round(net_total + (gas_total if has_gas else 0.0), 4),
+    }
+
+
+@dataclass
+class TariffScenario:
+    """One tariff to evaluate in ``compare_tariffs``."""
+
+    name: str
+    config: BillingConfig
+    reference_kw: float | None  # base reference power (windows may override it)
+    feed_in_rate: float
+
+
+def compare_tariffs(
+    scenarios: list[TariffScenario],
+    consumption: IntervalSeries,
+    exceedance_kw: np.ndarray,
+    totals: dict[str, float],
+    proration: float,
+    tz: tzinfo | None = None,
+) -> list[dict[str, Any]]:
+    """Evaluate every scenario over the same 15-min data, cheapest first.
+
+    *exceedance_kw* is the power series aligned with *consumption* that
+    exceedance is measured on. Pass the metered consumption (as the invoice
+    endpoint does) so a scenario matching the current config reproduces the
+    invoice's exceedance charge; *totals* carries the period's ``exported`` and
+    ``self_consumed`` kWh. Fixed monthly fees are scaled by *proration*
+    (number of months covered).
+    """
+    if not scenarios:
+        return []
+    known = consumption.epoch >= 0
+    slots = week_slots(consumption.epoch[known], tz)
+    kwh = consumption.values[known] * INTERVAL_HOURS
+    net = exceedance_kw[known]
+    kwh_per_slot = np.bincount(slots, weights=kwh, minlength=SLOTS_PER_WEEK)
+
+    rate_matrix = np.stack([RateTable.from_config(s.config).rates for s in scenarios])
+    energy_cost = rate_matrix @ kwh_per_slot
+
+    reference_matrix = np.stack([
+        compile_window_table(
+            windows_key(s.config.reference_power_windows, "reference_power_kw"), s.reference_kw
+        )[0]
+        for s in scenarios
+    ])
+    # Only distinct reference tables need the per-interval broadcast
+    unique_refs, ref_of = np.unique(reference_matrix, axis=0, return_inverse=True)
+    over = net[np.newaxis, :] - unique_refs[:, slots]
+    exceedance = np.where(over > 0, over, 0.0).sum(axis=1)[ref_of.reshape(-1)] * INTERVAL_HOURS
+
+    usage = {
+        "consumption": float(kwh.sum()),
+        "exported": totals.get("exported", 0.0),
+        "self_consumed": totals.get("self_consumed", 0.0),
+    }
+    results = []
+    for idx, scenario in enumerate(scenarios):
+        invoice = compute_invoice(
+            scenario.config,
+            {**usage, "exceedance_kwh": float(exceedance[idx])},
+            proration,
+            scenario.feed_in_rate,
+            {"uses_windows": True, "energy_cost": float(energy_cost[idx])},
+        )
+        results.append({
+            "name": scenario.name,
+            "energy_cost": round(float(energy_cost[idx]), 4),
+            "exceedance_kwh": round(float(exceedance[idx]), 4),
+            "total": invoice["net_total"],
+            "invoice": invoice,
+        })
+
+    results.sort(key=lambda r: r["total"])
+    cheapest = results[0]["total"]
+    for rank, result in enumerate(results, start=1):
+        result["rank"] = rank
+        result["difference"] = round(result["total"] - cheapest, 4)
+    return results
@@ -0,0 +1,127 @@
+"""Compact encodings for 15-minute timeseries responses.
+
+The default timeseries payload repeats ``value``, ``startedAt`` (a full ISO
+string), ``type``, ``version`` and ``calculated`` for every reading. Raw
+readings sit on a regular grid, so they can be sent as a start timestamp,
+an interval and one value per slot:
+
+- ``format=columnar``: JSON with ``start``/``interval_seconds``/``count``, a
+  ``values`` array (``null`` for slots without a reading) and the flags
+  bitmap as base64;
+- ``format=binary``: ``application/octet-stream`` laid out as::
+
+      offset  size  field
+      0       4     magic b"LNDA"
+      4       1     format version (1)
+      5       1     bytes per value (4 = Float32, 8 = Float64)
+      6       1     1 when a flags bitmap follows the values
+      7       1     reserved (0)
+      8       8     start, int64 epoch seconds
+      16      4     interval, uint32 seconds
+      20      4     count, uint32
+      24      n*w   values, little-endian floats (NaN = no reading)
+      ...     ⌈n/8⌉ flags bitmap (optional)
+
+The 24-byte header keeps the value array aligned for ``Float64Array``. In
+the flags bitmap, bit ``i % 8`` of byte ``i // 8`` (LSB first) is set when
+reading ``i`` is not a plain measurement (calculated or estimated).
+"""
+from __future__ import annotations
+
+import base64
+import struct
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from .exceedance import parse_timestamps
+
+FORMATS = ("json", "columnar", "binary")
+DTYPES = {"float32": "<f4", "float64": "<f8"}
+BINARY_CONTENT_TYPE = "application/octet-stream"
+MAGIC = b"LNDA"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBBqII")
+
+
+@dataclass
+class Grid:
+    """Readings placed on a regular time grid."""
+
+    start: int  # epoch seconds of slot 0
+    interval: int  # seconds per slot
+    values: np.ndarray  # float64, NaN where no reading
+    flags: np.ndarray  # bool, True where the reading is not a plain measurement
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def is_flagged(item: dict[str, Any]) -> bool:
+    """Return True when a Leneda item is calculated or not ``measured``."""
+    return bool(item.get("calculated")) or item.get("type", "measured") != "measured"
+
+
+def to_grid(
+    stamps: list[Any], values: list[float] | np.ndarray, interval: int, flags: list[bool] | None = None
+) -> Grid:
+    """Place readings (ISO timestamps and values) on a regular grid.
+
+    Readings sharing a slot are summed (as when merging meters); readings
+    without a timestamp are dropped.
+    """
+    epoch = parse_timestamps(list(stamps))
+    values = np.asarray(values, dtype=np.float64)
+    flagged = np.asarray(flags if flags is not None else np.zeros(len(values)), dtype=bool)
+    known = epoch >= 0
+    epoch, values, flagged = epoch[known], values[known], flagged[known]
+    if not len(epoch):
+        return Grid(0, interval, np.empty(0, dtype=np.float64), np.empty(0, dtype=bool))
+
+    start = int(epoch.min())
+    slot = (epoch - start) // interval
+    count = int(slot.max()) + 1
+    grid = np.bincount(slot, weights=values, minlength=count)
+    present = np.bincount(slot, minlength=count) > 0
+    grid[~present] = np.nan
+    grid_flags = np.bincount(slot, weights=flagged, minlength=count) > 0
+    return Grid(start, interval, grid, grid_flags)
+
+
+def grid_from_items(items: list[dict[str, Any]], interval: int) -> Grid:
+    """Convert Leneda timeseries items to a ``Grid``."""
+    items = [item for item in items if isinstance(item, dict) and item.get("value") is not None]
+    return to_grid(
+        [item.get("startedAt") for item in items],
+        [item["value"] for item in items],
+        interval,
+        [is_flagged(item) for item in items],
+    )
+
+
+def _bitmap(flags: np.ndarray) -> bytes:
+    return np.packbits(flags, bitorder="little").tobytes()
+
+
+def encode_binary(grid: Grid, dtype: str = "float32", with_flags: bool = True) -> bytes:
+    """Encode a grid in the binary layout described in the module docstring."""
+    packed = grid.values.astype(DTYPES[dtype]).tobytes()
+    header = HEADER.pack(
+        MAGIC, VERSION, np.dtype(DTYPES[dtype]).itemsize, int(with_flags), 0, grid.start, grid.interval, len(grid)
+    )
+    return header + packed + (_bitmap(grid.flags) if with_flags else b"")
+
+
+def encode_columnar(grid: Grid, with_flags: bool = True) -> dict[str, Any]:
+    """Return the columnar JSON fields for a grid."""
+    values = np.round(grid.values, 4)
+    columns: dict[str, Any] = {
+        "start": grid.start,
+        "interval_seconds": grid.interval,
+        "count": len(grid),
+        "values": [None if np.isnan(v) else v for v in values.tolist()],
+    }
+    if with_flags:
+        columns["flags"] = base64.b64encode(_bitmap(grid.flags)).decode("ascii")
+    return columns
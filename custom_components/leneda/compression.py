@@ -0,0 +1,104 @@
+"""Accept-Encoding negotiated compression for large API responses.
+
+Year-long timeseries payloads are multi-megabyte JSON with repetitive keys
+and compress by an order of magnitude. Bodies above ``COMPRESS_MIN_BYTES``
+are compressed with brotli (when the optional ``brotli`` module is
+installed) or gzip; bodies above ``COMPRESS_EXECUTOR_BYTES`` are compressed
+in the executor so the event loop is not blocked.
+"""
+from __future__ import annotations
+
+import gzip
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.core import HomeAssistant
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+COMPRESS_MIN_BYTES = 4096
+COMPRESS_EXECUTOR_BYTES = 256 * 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+class CompressionStats:
+    """Raw versus compressed byte counters (exposed in diagnostics)."""
+
+    def __init__(self) -> None:
+        self.responses = 0
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self.by_encoding: dict[str, int] = {}
+
+    def record(self, encoding: str, raw: int, compressed: int) -> None:
+        self.responses += 1
+        self.raw_bytes += raw
+        self.compressed_bytes += compressed
+        self.by_encoding[encoding] = self.by_encoding.get(encoding, 0) + 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "responses": self.responses,
+            "raw_bytes": self.raw_bytes,
+            "compressed_bytes": self.compressed_bytes,
+            "ratio": round(self.compressed_bytes / self.raw_bytes, 4) if self.raw_bytes else None,
+            "by_encoding": dict(self.by_encoding),
+        }
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Pick ``br`` or ``gzip`` from an Accept-Encoding header, or None."""
+    if not accept_encoding:
+        return None
+    accepted = set()
+    for token in accept_encoding.split(","):
+        name, _, params = token.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """Compress *body* with *encoding* (``br`` or ``gzip``)."""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+async def async_compress_response(
+    hass: HomeAssistant, request: Any, response: web.StreamResponse, stats: CompressionStats
+) -> web.StreamResponse:
+    """Compress a buffered response in place when the client accepts it."""
+    if not isinstance(response, web.Response) or response.status != 200:
+        return response
+    body = response.body
+    if not isinstance(body, bytes) or len(body) < COMPRESS_MIN_BYTES or "Content-Encoding" in response.headers:
+        return response
+    encoding = negotiate_encoding(request.headers.get("Accept-Encoding"))
+    if encoding is None:
+        return response
+
+    if len(body) >= COMPRESS_EXECUTOR_BYTES:
+        compressed = await hass.async_add_executor_job(compress_body, body, encoding)
+    else:
+        compressed = compress_body(body, encoding)
+
+    response.body = compressed
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        # The encoded bytes differ from the identity body the tag describes
+        response.headers["ETag"] = f"W/{etag}"
+    response.headers["Content-Encoding"] = encoding
+    response.headers["Vary"] = "Accept-Encoding"
+    stats.record(encoding, len(body), len(compressed))
+    return response
@@ -2,6 +2,7 @@
 import logging
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers import selector as sel
 
@@ -11,11 +12,13 @@ from .const import (
     CONF_ENERGY_ID,
     CONF_METERING_POINT_ID,
     CONF_METERING_POINT_1_TYPES,
+    CONF_METERS,
     CONF_REFERENCE_POWER_ENTITY,
     CONF_REFERENCE_POWER_STATIC,
     EXTRA_METER_SLOTS,
     DOMAIN,
 )
+from .meters import format_meter_lines, parse_meter_lines
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +28,12 @@ class LenedaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow handler."""
+        return LenedaOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
         _LOGGER.debug("Leneda config flow started.")
@@ -109,3 +118,40 @@ class LenedaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=vol.Schema(schema_fields),
             errors=errors,
         )
+
+
+class LenedaOptionsFlow(config_entries.OptionsFlow):
+    """Manage additional metering points beyond the setup slots.
+
+    Meters are entered one per line as ``<metering point ID>: type[, type]``
+    and there is no limit on how many can be added.
+    """
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        """Edit the additional meter list."""
+        errors = {}
+
+        if user_input is not None:
+            try:
+                meters = parse_meter_lines(user_input.get(CONF_METERS, ""))
+            except ValueError:
+                errors["base"] = "invalid_meter_list"
+            else:
+                return self.async_create_entry(
+                    title="", data={**self._entry.options, CONF_METERS: meters}
+                )
+
+        default = format_meter_lines(self._entry.options.get(CONF_METERS, []))
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Optional(CONF_METERS, default=default): sel.TextSelector(
+                    sel.TextSelectorConfig(multiline=True),
+                ),
+            }),
+            errors=errors,
+        )
@@ -2,6 +2,28 @@
 
 DOMAIN = "leneda"
 
+# Keys in hass.data[DOMAIN] that are shared state rather than config entries
+DATA_STORAGE = "storage"
+DATA_VIEWS_REGISTERED = "views_registered"
+DATA_INVOICE_CACHE = "invoice_cache"
+DATA_FEED_IN_CACHE = "feed_in_cache"
+DATA_PEAK_SUMMARIES = "peak_summaries"
+DATA_RESPONSE_CACHE = "response_cache"
+DATA_ROUTE_INDEX = "route_index"
+DATA_COMBINED_MEMO = "combined_memo"
+DATA_COMPRESSION_STATS = "compression_stats"
+SHARED_DATA_KEYS = (
+    DATA_STORAGE,
+    DATA_VIEWS_REGISTERED,
+    DATA_INVOICE_CACHE,
+    DATA_FEED_IN_CACHE,
+    DATA_PEAK_SUMMARIES,
+    DATA_RESPONSE_CACHE,
+    DATA_ROUTE_INDEX,
+    DATA_COMBINED_MEMO,
+    DATA_COMPRESSION_STATS,
+)
+
 API_BASE_URL = "https://api.leneda.eu"
 
 CONF_API_KEY = "api_key"
@@ -39,10 +61,29 @@ EXTRA_METER_SLOTS = [
     (CONF_METERING_POINT_9, CONF_METERING_POINT_9_TYPES),
     (CONF_METERING_POINT_10, CONF_METERING_POINT_10_TYPES),
 ]
+# Unbounded list of additional meters ([{id, types}]) kept in the entry options
+CONF_METERS = "meters"
 CONF_REFERENCE_POWER_ENTITY = "reference_power_entity"
 CONF_REFERENCE_POWER_STATIC = "reference_power_static"
 CONF_METER_HAS_GAS = "meter_has_gas"  # legacy, kept for backward compat
 
+# Number of refresh timelines kept per coordinator for diagnostics
+REFRESH_TIMELINE_HISTORY = 20
+
+# Upper bound on concurrent requests per API client (fan-out across many meters)
+MAX_CONCURRENT_REQUESTS = 8
+# Refresh timeout: base budget plus an allowance per additional production meter
+UPDATE_TIMEOUT_BASE = 30
+UPDATE_TIMEOUT_PER_METER = 2
+
+# Days before today whose 15-min data may still be revised by Leneda; their
+# peak/exceedance summaries are recomputed rather than served from storage
+SUMMARY_REVISION_DAYS = 3
+
+# Live-range API responses: entries kept and seconds before they expire
+RESPONSE_CACHE_SIZE = 64
+RESPONSE_CACHE_TTL = 300
+
 # Meter type constants
 METER_TYPE_CONSUMPTION = "consumption"
 METER_TYPE_PRODUCTION = "production"
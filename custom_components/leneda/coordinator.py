@@ -12,13 +12,17 @@ from __future__ import annotations
 
 import asyncio
 import async_timeout
-from datetime import timedelta
+from collections import deque
+from datetime import date, datetime, timedelta
+import itertools
 import logging
 import json
 import os
+from typing import Any
 import aiohttp
+import numpy as np
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -29,15 +33,41 @@ from .api import LenedaApiClient
 from .const import (
     DOMAIN,
     OBIS_CODES,
-    CONF_METERING_POINT_1_TYPES,
-    EXTRA_METER_SLOTS,
     CONF_METER_HAS_GAS,
+    METER_TYPE_GAS,
+    METER_TYPE_PRODUCTION,
+    REFRESH_TIMELINE_HISTORY,
+    UPDATE_TIMEOUT_BASE,
+    UPDATE_TIMEOUT_PER_METER,
 )
-from .storage import get_effective_reference_power
+from .exceedance import net_grid_draw, overage_kwh, series_from_items
+from .meters import MeterRegistry, meter_type_for_obis
+from .rollup import daily_totals
+from .schedule import get_reference_schedule
+from .tracing import RefreshTimeline, summarize_payload, trace_payload
 
 _LOGGER = logging.getLogger(__name__)
 
+# Process-wide, so a reloaded coordinator never repeats an earlier generation
+_DATA_GENERATIONS = itertools.count(1)
 
+OVERAGE_KEYS = (
+    "yesterdays_power_usage_over_reference",
+    "current_month_power_usage_over_reference",
+    "last_month_power_usage_over_reference",
+)
+
+
+def _sum_days(totals: dict[date, float], start: datetime, end: datetime) -> float:
+    """Sum daily totals for the days from *start* to *end* (inclusive).
+
+    ``start.date()``/``end.date()`` are the dates an aggregated request for
+    the same range sends, and ``daily_totals`` keys each Day bucket by
+    Leneda's calendar day, so these totals cover the same days (on
+    Leneda's day boundaries) as the primary meter's aggregated totals.
+    """
+    first, last = start.date(), end.date()
+    return sum(value for day, value in totals.items() if first <= day <= last)
 
 
 class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
@@ -55,16 +85,21 @@ class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
         self.metering_point_id = metering_point_id
         self.entry = entry
         self.version = version
+        # Most recent refresh timelines (newest last) for diagnostics
+        self.timelines: deque[dict] = deque(maxlen=REFRESH_TIMELINE_HISTORY)
+        # Advanced whenever listeners are notified, i.e. whenever data may have
+        # changed; unique across all coordinators and reloads
+        self.data_generation = next(_DATA_GENERATIONS)
+        # Retained (epoch, net draw kW) series per overage sensor key
+        self._overage_inputs: dict[str, tuple[Any, Any]] = {}
+        # Whether a reference power applied at the last refresh / recompute
+        self._had_reference = False
 
         # ── Build per-purpose routing table from meter type config ──
-        # Each meter can be tagged as consumption, production, gas (or any combo)
-        meters = [
-            (metering_point_id, entry.data.get(CONF_METERING_POINT_1_TYPES, ["consumption"])),
-        ]
-        for id_key, types_key in EXTRA_METER_SLOTS:
-            mid = (entry.data.get(id_key) or "").strip()
-            if mid:
-                meters.append((mid, entry.data.get(types_key, [])))
+        # Each meter can be tagged as consumption, production, gas (or any combo).
+        # The registry merges the setup slots with the unbounded options list.
+        self.registry = MeterRegistry.from_entry(entry)
+        meters = self.registry.as_tuples() or [(metering_point_id, ["consumption"])]
 
         # Default all to primary meter, then override per type
         self.consumption_meter = metering_point_id
@@ -100,61 +135,106 @@ class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
         self.meters = meters
 
     def _meter_for_obis(self, obis_code: str) -> str:
-        """Return the correct metering point ID for a given OBIS code.
-
-        Production codes (1-1:2.*, 1-1:4.*, 1-65:2.*) → production meter
-        Gas codes (7-*) → gas meter
-        Everything else → consumption meter
-        """
-        if obis_code.startswith("7-"):
+        """Return the correct metering point ID for a given OBIS code."""
+        meter_type = meter_type_for_obis(obis_code)
+        if meter_type == METER_TYPE_GAS:
             return self.gas_meter
-        if (obis_code.startswith("1-1:2.") or
-            obis_code.startswith("1-1:4.") or
-            obis_code.startswith("1-65:2.")):
+        if meter_type == METER_TYPE_PRODUCTION:
             return self.production_meter
         return self.consumption_meter
 
-    def _calculate_power_overage(self, items: list[dict], ref_power_kw: float, production_items: list[dict] | None = None) -> float:
-        """Calculate total kWh consumed over a reference power.
+    def _store_overage_input(self, key: str, consumption_result: Any, production_result: Any) -> None:
+        """Retain the solar-adjusted net draw series behind an overage sensor.
 
-        When *production_items* is provided, solar production is subtracted
-        from consumption at each 15-min interval so only the **net grid draw**
-        is evaluated against the reference limit.
+        A successful fetch without readings (e.g. the 1st of the month) is
+        retained as an empty series; on fetch errors the previously retained
+        series is kept.
+        """
+        if isinstance(consumption_result, dict):
+            consumption = series_from_items(consumption_result.get("items"))
+            production_items = production_result.get("items") if isinstance(production_result, dict) else None
+            production = series_from_items(production_items) if production_items else None
+            self._overage_inputs[key] = (consumption.epoch, net_grid_draw(consumption, production))
+        elif isinstance(consumption_result, Exception):
+            _LOGGER.error("Error fetching power over reference data for %s: %s", key, consumption_result)
+
+    def _apply_overage(self, data: dict[str, Any]) -> None:
+        """Compute the power-over-reference sensors from the retained series.
+
+        Uses the compiled reference schedule, so configured reference windows
+        apply per 15-min interval (readings without a timestamp use the base).
         """
-        total_overage_kwh = 0.0
-        if not items:
-            return total_overage_kwh
-
-        # Build a lookup of production kW by timestamp for O(1) access
-        prod_by_ts: dict[str, float] = {}
-        if production_items:
-            for p in production_items:
-                try:
-                    prod_by_ts[p["startedAt"]] = float(p["value"])
-                except (ValueError, TypeError, KeyError):
-                    continue
-
-        for item in items:
+        schedule = get_reference_schedule(self.hass, self.entry)
+        if schedule.base_kw is None:
+            # No reference power (removed or entity unavailable): nothing is over it
+            for key in OVERAGE_KEYS:
+                data[key] = None
+            return
+        for key, (epoch, net_kw) in self._overage_inputs.items():
+            if schedule.is_constant:
+                reference = schedule.base_kw
+            else:
+                reference = np.where(epoch >= 0, schedule.lookup(np.maximum(epoch, 0)), schedule.base_kw)
+            data[key] = round(overage_kwh(net_kw, reference), 4)
+            _LOGGER.debug("Calculated %.4f kWh over reference for %s (solar-adjusted).", data[key], key)
+
+    @staticmethod
+    def _apply_self_consumption(data: dict[str, Any]) -> None:
+        """Derive self-consumed energy (production - export) for every period."""
+        pairs = {
+            "p_12_yesterday_self_consumed": ("p_04_yesterday_production", "p_09_yesterday_exported"),
+            "p_13_last_week_self_consumed": ("p_06_last_week_production", "p_10_last_week_exported"),
+            "p_18_weekly_self_consumed": ("p_05_weekly_production", "p_17_weekly_exported"),
+            "p_16_monthly_self_consumed": ("p_07_monthly_production", "p_15_monthly_exported"),
+            "p_14_last_month_self_consumed": ("p_08_previous_month_production", "p_11_last_month_exported"),
+        }
+        for key, (prod_key, export_key) in pairs.items():
+            production = data.get(prod_key)
+            exported = data.get(export_key)
+            if production is None or exported is None:
+                continue
             try:
-                consumption_kw = float(item["value"])
-                # Subtract concurrent solar production if available
-                solar_kw = prod_by_ts.get(item.get("startedAt", ""), 0.0)
-                net_kw = max(0.0, consumption_kw - solar_kw)
-                if net_kw > ref_power_kw:
-                    # Energy for a 15-minute interval = Power (kW) * 0.25 (h)
-                    overage_energy = (net_kw - ref_power_kw) * 0.25
-                    total_overage_kwh += overage_energy
-            except (ValueError, TypeError):
-                continue  # Skip if value is not a valid number
-        return round(total_overage_kwh, 4)
+                data[key] = round(production - exported, 4)
+            except (TypeError, ValueError) as e:
+                _LOGGER.error("Could not calculate self-consumption value %s: %s", key, e)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Advance the data generation, then notify listeners."""
+        self.data_generation = next(_DATA_GENERATIONS)
+        super().async_update_listeners()
+
+    @callback
+    def async_recompute_derived(self) -> None:
+        """Recompute overage and self-consumption from cached data.
+
+        Called when the billing config or the reference-power entity changes;
+        sensors update immediately without any API call.
+        """
+        if not self.data:
+            return
+        data = dict(self.data)
+        self._apply_self_consumption(data)
+        self._apply_overage(data)
+        self.data = data
+        self.async_update_listeners()
+        # Monthly series are not fetched without a reference power; fetch them
+        # once when a reference is first set (not on every recompute)
+        has_reference = get_reference_schedule(self.hass, self.entry).base_kw is not None
+        if has_reference and not self._had_reference:
+            self.hass.async_create_task(self.async_request_refresh())
+        self._had_reference = has_reference
 
     async def _async_update_data(self) -> dict[str, float | None]:
         """Fetch data from the Leneda API concurrently."""
         _LOGGER.debug("--- Starting Leneda Data Update ---")
         now = dt_util.utcnow()
+        timeline = RefreshTimeline()
+        timeline.begin("plan")
 
         try:
-            async with async_timeout.timeout(30):
+            update_timeout = UPDATE_TIMEOUT_BASE + UPDATE_TIMEOUT_PER_METER * (len(self.production_meters) - 1)
+            async with async_timeout.timeout(update_timeout):
                 # Define date ranges
                 today_start_dt = now.replace(hour=0, minute=0, second=0, microsecond=0)
                 yesterday_start_dt = today_start_dt - timedelta(days=1)
@@ -195,27 +275,31 @@ class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
 
                 # Tasks for fetching detailed 15-min data for power-over-reference calculations
                 # We fetch both consumption AND production so exceedance considers solar offset.
-                power_over_ref_tasks = []
-                if get_effective_reference_power(self.hass, self.entry) is not None:
-                    _LOGGER.debug("Setting up tasks for monthly power over reference data...")
-                    power_over_ref_tasks = [
-                        # Current month consumption (so far)
-                        self.api_client.async_get_metering_data(
-                            self._meter_for_obis(CONSUMPTION_CODE), CONSUMPTION_CODE, month_start_dt, effective_month_end
-                        ),
-                        # Previous month consumption
-                        self.api_client.async_get_metering_data(
-                            self._meter_for_obis(CONSUMPTION_CODE), CONSUMPTION_CODE, start_of_last_month, end_of_last_month
-                        ),
-                        # Current month production (so far) — for solar offset
-                        self.api_client.async_get_metering_data(
-                            self._meter_for_obis(PRODUCTION_CODE), PRODUCTION_CODE, month_start_dt, effective_month_end
-                        ),
-                        # Previous month production — for solar offset
-                        self.api_client.async_get_metering_data(
-                            self._meter_for_obis(PRODUCTION_CODE), PRODUCTION_CODE, start_of_last_month, end_of_last_month
-                        ),
-                    ]
+                # Skipped without a reference power; setting one later triggers a refresh.
+                _LOGGER.debug("Setting up tasks for monthly power over reference data...")
+                has_reference = get_reference_schedule(self.hass, self.entry).base_kw is not None
+                self._had_reference = has_reference
+                if not has_reference:
+                    self._overage_inputs.pop("current_month_power_usage_over_reference", None)
+                    self._overage_inputs.pop("last_month_power_usage_over_reference", None)
+                power_over_ref_tasks = [] if not has_reference else [
+                    # Current month consumption (so far)
+                    self.api_client.async_get_metering_data(
+                        self._meter_for_obis(CONSUMPTION_CODE), CONSUMPTION_CODE, month_start_dt, effective_month_end
+                    ),
+                    # Previous month consumption
+                    self.api_client.async_get_metering_data(
+                        self._meter_for_obis(CONSUMPTION_CODE), CONSUMPTION_CODE, start_of_last_month, end_of_last_month
+                    ),
+                    # Current month production (so far) — for solar offset
+                    self.api_client.async_get_metering_data(
+                        self._meter_for_obis(PRODUCTION_CODE), PRODUCTION_CODE, month_start_dt, effective_month_end
+                    ),
+                    # Previous month production — for solar offset
+                    self.api_client.async_get_metering_data(
+                        self._meter_for_obis(PRODUCTION_CODE), PRODUCTION_CODE, start_of_last_month, end_of_last_month
+                    ),
+                ]
 
                 # Tasks for aggregated historical data only
                 _LOGGER.debug("Setting up tasks for aggregated historical data...")
@@ -272,28 +356,32 @@ class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
                     ),
                 ]
 
-                # Extra tasks for additional production meters (multi-solar summing)
+                # Extra tasks for additional production meters (multi-solar summing).
+                # A single Day-aggregated request per meter and code spans every
+                # period below; per-period totals are summed locally afterwards.
+                # That keeps the fan-out at 2 requests per extra meter.
+                period_ranges = [
+                    (yesterday_start_dt, yesterday_end_dt, "p_04_yesterday_production", "p_09_yesterday_exported"),
+                    (week_start_dt, effective_week_end, "p_05_weekly_production", "p_17_weekly_exported"),
+                    (last_week_start_dt, last_week_end_dt, "p_06_last_week_production", "p_10_last_week_exported"),
+                    (month_start_dt, effective_month_end, "p_07_monthly_production", "p_15_monthly_exported"),
+                    (start_of_last_month, end_of_last_month, "p_08_previous_month_production", "p_11_last_month_exported"),
+                ]
+                span_start = min(start for start, _end, _p, _e in period_ranges)
+                span_end = max(end for _start, end, _p, _e in period_ranges)
                 extra_prod_tasks = []
-                extra_prod_map = []  # maps each extra task result to its data key
+                extra_prod_map = []  # index into (prod_key, export_key) for each task
                 if len(self.production_meters) > 1:
                     _LOGGER.debug("Setting up extra tasks for %d additional production meters", len(self.production_meters) - 1)
-                    period_ranges = [
-                        (yesterday_start_dt, yesterday_end_dt, "p_04_yesterday_production", "p_09_yesterday_exported"),
-                        (week_start_dt, effective_week_end, "p_05_weekly_production", "p_17_weekly_exported"),
-                        (last_week_start_dt, last_week_end_dt, "p_06_last_week_production", "p_10_last_week_exported"),
-                        (month_start_dt, effective_month_end, "p_07_monthly_production", "p_15_monthly_exported"),
-                        (start_of_last_month, end_of_last_month, "p_08_previous_month_production", "p_11_last_month_exported"),
-                    ]
                     for meter_id in self.production_meters[1:]:
-                        for start, end, prod_key, export_key in period_ranges:
-                            extra_prod_tasks.append(self.api_client.async_get_aggregated_metering_data(
-                                meter_id, PRODUCTION_CODE, start, end
-                            ))
-                            extra_prod_map.append(prod_key)
-                            extra_prod_tasks.append(self.api_client.async_get_aggregated_metering_data(
-                                meter_id, EXPORT_CODE, start, end
-                            ))
-                            extra_prod_map.append(export_key)
+                        extra_prod_tasks.append(self.api_client.async_get_aggregated_metering_data(
+                            meter_id, PRODUCTION_CODE, span_start, span_end, "Day"
+                        ))
+                        extra_prod_map.append(0)
+                        extra_prod_tasks.append(self.api_client.async_get_aggregated_metering_data(
+                            meter_id, EXPORT_CODE, span_start, span_end, "Day"
+                        ))
+                        extra_prod_map.append(1)
 
                 # Tasks for fetching detailed 15-min gas data for manual aggregation
                 _LOGGER.debug("Setting up tasks for detailed gas data...")
@@ -357,11 +445,21 @@ class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
                 # To preserve order for slicing, we'll keep aggregated_tasks separate for now
                 # In a future refactor, we could move all to a dictionary-based system
 
-                task_list = obis_tasks + aggregated_tasks + power_over_ref_tasks + list(all_tasks.values()) + extra_prod_tasks
-                results = await asyncio.gather(*task_list, return_exceptions=True)
+                # Each group is gathered (and timed) separately but all run concurrently
+                timeline.begin("fetch")
+                grouped_results = await asyncio.gather(
+                    timeline.gather("fetch_obis", obis_tasks),
+                    timeline.gather("fetch_aggregated", aggregated_tasks),
+                    timeline.gather("fetch_power_over_ref", power_over_ref_tasks),
+                    timeline.gather("fetch_gas", list(all_tasks.values())),
+                    timeline.gather("fetch_extra_production", extra_prod_tasks),
+                )
+                results = [r for group in grouped_results for r in group]
                 _LOGGER.debug("All API tasks gathered.")
+                timeline.begin("reduction")
 
                 obis_results = results[:len(obis_tasks)]
+                obis_results_by_code = dict(zip(non_gas_obis_codes.keys(), obis_results))
                 aggregated_results = results[len(obis_tasks):len(obis_tasks) + len(aggregated_tasks)]
                 power_over_ref_results = results[len(obis_tasks) + len(aggregated_tasks):len(obis_tasks) + len(aggregated_tasks) + len(power_over_ref_tasks)]
 
@@ -393,13 +491,13 @@ class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
                 # Process OBIS code results (yesterday's data)
                 for obis_code, result in zip(non_gas_obis_codes.keys(), obis_results):
                     if isinstance(result, dict) and result.get("items"):
-                        _LOGGER.debug(f"Processing peak data for {obis_code}, result: {result}")
+                        trace_payload(_LOGGER, "Processing peak data", result, obis_code)
                         # Find the item with the maximum value for the day (peak)
                         peak_item = max(result["items"], key=lambda x: x["value"])
                         value = peak_item["value"]
                         data[obis_code] = value
                         data[f"{obis_code}_peak_timestamp"] = peak_item["startedAt"]
-                        _LOGGER.debug(f"Peak item for {obis_code}: {peak_item}")
+                        _LOGGER.debug("Peak item for %s: %s", obis_code, peak_item)
                     elif isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError)):
                         # Network errors: preserve previous values
                         _LOGGER.error("Error fetching time-series data for %s: %s", obis_code, result)
@@ -429,7 +527,7 @@ class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
                 # Process aggregated results
                 for key, result in zip(aggregated_keys, aggregated_results):
                     if isinstance(result, dict):
-                        _LOGGER.debug(f"Processing aggregated data for {key}, result: {result}")
+                        trace_payload(_LOGGER, "Processing aggregated data", result, key)
                         series = result.get("aggregatedTimeSeries")
                         if series:
                             if key.startswith("c_02_") or key.startswith("p_02_"):  # Hourly - get latest hour
@@ -441,16 +539,16 @@ class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
 
                             if val is not None:
                                 data[key] = val
-                                _LOGGER.debug(f"Processed aggregated data for {key}: {data[key]}")
+                                _LOGGER.debug("Processed aggregated data for %s: %s", key, data[key])
                             else:
                                 if key not in data or data[key] is None:
                                     data[key] = 0.0
-                                _LOGGER.debug(f"Aggregated data for {key} has no value, keeping previous value: {data.get(key)}")
+                                _LOGGER.debug("Aggregated data for %s has no value, keeping previous value: %s", key, data.get(key))
                         else:
                             # Keep previous value if available, otherwise set to 0.0 for energy sensors
                             if key not in data or data[key] is None:
                                 data[key] = 0.0
-                            _LOGGER.debug(f"No aggregated time series for {key}, keeping previous value: {data.get(key)}")
+                            _LOGGER.debug("No aggregated time series for %s, keeping previous value: %s", key, data.get(key))
                     elif isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError)):
                         # Network errors: preserve previous values
                         _LOGGER.error("Error fetching aggregated data for %s: %s", key, result)
@@ -469,7 +567,7 @@ class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
                         items = result["items"]
                         total_value = sum(item.get("value", 0) for item in items if item.get("value") is not None)
                         data[key] = round(total_value, 4)
-                        _LOGGER.debug(f"Successfully processed gas data for {key}: {data[key]}")
+                        _LOGGER.debug("Successfully processed gas data for %s: %s", key, data[key])
 
                         # Also calculate peak values for yesterday's gas sensors
                         if "yesterday" in key:
@@ -485,10 +583,10 @@ class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
                                 data["7-1:99.23.17_peak_timestamp"] = peak_item.get("startedAt")
 
                     elif isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError)):
-                        _LOGGER.error(f"Error fetching gas data for {key}: {result}")
+                        _LOGGER.error("Error fetching gas data for %s: %s", key, result)
                         data.setdefault(key, 0.0) # Preserve old value on error
                     else:
-                        _LOGGER.warning(f"No items found or error for gas data {key}: {result}")
+                        _LOGGER.warning("No items found or error for gas data %s: %s", key, summarize_payload(result))
                         data.setdefault(key, 0.0) # Set to 0 if no data
 
 
@@ -496,44 +594,24 @@ class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
                 if extra_prod_tasks:
                     extra_start = len(obis_tasks) + len(aggregated_tasks) + len(power_over_ref_tasks) + len(all_tasks)
                     extra_results = results[extra_start:]
-                    for key, result in zip(extra_prod_map, extra_results):
+                    for key_index, result in zip(extra_prod_map, extra_results):
                         if isinstance(result, dict):
-                            series = result.get("aggregatedTimeSeries")
-                            if series and series[0].get("value") is not None:
+                            daily = daily_totals(result)
+                            for start, end, *keys in period_ranges:
+                                key = keys[key_index]
                                 current = data.get(key, 0.0) or 0.0
-                                data[key] = round(current + series[0]["value"], 4)
-                                _LOGGER.debug("Added extra production meter data for %s: %s", key, data[key])
+                                data[key] = round(current + _sum_days(daily, start, end), 4)
                         elif isinstance(result, Exception):
-                            _LOGGER.error("Error fetching extra production data for %s: %s", key, result)
+                            _LOGGER.error("Error fetching extra production data: %s", result)
 
                 # ─── Process Shared Energy (All Ranges) ───
-                # We need to fetch and sum layers 1-4 for both Sent (Production Shared) and Received (Consumption Shared)
-                # for every supported time range: Yesterday, Week, Last Week, Month, Last Month.
-                
-                # Helper to perform ad-hoc fetches for sharing layers (since we didn't add them to the main task list earlier to keep it clean)
-                # This adds some serial overhead but keeps the logic isolated and safe.
-                # Given update_interval is 1h, this is acceptable.
-                
-                async def _fetch_sum_sharing(meter_id, code_prefix, start, end):
-                    """Fetch layers 1-4 and return the sum."""
-                    layers = ["1", "2", "3", "4"]
-                    tasks = [
-                        self.api_client.async_get_aggregated_metering_data(
-                            meter_id, f"{code_prefix}.{l}", start, end
-                        ) for l in layers
-                    ]
-                    res = await asyncio.gather(*tasks, return_exceptions=True)
-                    total = 0.0
-                    for r in res:
-                        if isinstance(r, dict) and r.get("aggregatedTimeSeries"):
-                            total += sum(item.get("value", 0) for item in r["aggregatedTimeSeries"] if item.get("value") is not None)
-                    return total
-
-                # Consumption meter for Shared With Me
+                # Sum layers 1-4 for both Sent (Production Shared, every production
+                # meter) and Received (Consumption Shared) for every supported range:
+                # Yesterday, Week, Last Week, Month, Last Month. As above, one
+                # Day-aggregated request per meter and layer covers all ranges and
+                # all requests go out as one (client-bounded) concurrent batch.
+                timeline.begin("sharing")
                 c_meter = self._meter_for_obis("1-1:1.29.0")
-                
-                # Production meter(s) for Shared (Sent)
-                # Note: If multiple production meters exist, we should sum them all.
                 p_meters = self.production_meters
 
                 sharing_periods = [
@@ -543,106 +621,59 @@ class LenedaDataUpdateCoordinator(DataUpdateCoordinator):
                     ("monthly", month_start_dt, effective_month_end),
                     ("last_month", start_of_last_month, end_of_last_month),
                 ]
-
-                for p_name, p_start, p_end in sharing_periods:
-                    # 1. Received (Shared With Me) - prefix 1-65:1.29
-                    try:
-                        received_val = await _fetch_sum_sharing(c_meter, "1-65:1.29", p_start, p_end)
-                        data[f"s_received_{p_name}"] = round(received_val, 4)
-                    except Exception as e:
-                        _LOGGER.error(f"Error calculating Shared With Me for {p_name}: {e}")
-                        data[f"s_received_{p_name}"] = 0.0
-
-                    # 2. Sent (Shared) - prefix 1-65:2.29
-                    # Sum across all production meters
-                    try:
-                        sent_total = 0.0
-                        for pm in p_meters:
-                            sent_total += await _fetch_sum_sharing(pm, "1-65:2.29", p_start, p_end)
-                        data[f"s_sent_{p_name}"] = round(sent_total, 4)
-                    except Exception as e:
-                        _LOGGER.error(f"Error calculating Shared (Sent) for {p_name}: {e}")
-                        data[f"s_sent_{p_name}"] = 0.0
+                sharing_jobs: list[tuple[str, Any]] = []
+                for layer in ("1", "2", "3", "4"):
+                    sharing_jobs.append(("s_received", self.api_client.async_get_aggregated_metering_data(
+                        c_meter, f"1-65:1.29.{layer}", span_start, span_end, "Day"
+                    )))
+                    for pm in p_meters:
+                        sharing_jobs.append(("s_sent", self.api_client.async_get_aggregated_metering_data(
+                            pm, f"1-65:2.29.{layer}", span_start, span_end, "Day"
+                        )))
+                sharing_results = await timeline.gather("fetch_sharing", [job for _prefix, job in sharing_jobs])
+
+                sharing_totals = {
+                    prefix: {p_name: 0.0 for p_name, _s, _e in sharing_periods}
+                    for prefix in ("s_received", "s_sent")
+                }
+                for (prefix, _job), result in zip(sharing_jobs, sharing_results):
+                    if isinstance(result, dict):
+                        daily = daily_totals(result)
+                        for p_name, p_start, p_end in sharing_periods:
+                            sharing_totals[prefix][p_name] += _sum_days(daily, p_start, p_end)
+                    elif isinstance(result, Exception):
+                        _LOGGER.error("Error fetching sharing data (%s): %s", prefix, result)
+                for prefix, totals in sharing_totals.items():
+                    for p_name, total in totals.items():
+                        data[f"{prefix}_{p_name}"] = round(total, 4)
 
                 # Calculate self-consumption values
-                try:
-                    # Yesterday
-                    prod_yesterday = data.get("p_04_yesterday_production")
-                    export_yesterday = data.get("p_09_yesterday_exported")
-                    if prod_yesterday is not None and export_yesterday is not None:
-                        data["p_12_yesterday_self_consumed"] = round(prod_yesterday - export_yesterday, 4)
+                timeline.begin("self_consumption")
+                self._apply_self_consumption(data)
+
+                # Calculate power usage over reference (solar-adjusted). The net
+                # draw series are retained so config changes can recompute in place.
+                timeline.begin("overage")
+                consumption_result = obis_results_by_code.get(CONSUMPTION_CODE)
+                production_result = obis_results_by_code.get(PRODUCTION_CODE)
+                self._store_overage_input("yesterdays_power_usage_over_reference", consumption_result, production_result)
+                # power_over_ref_results: [cur_month_cons, last_month_cons, cur_month_prod, last_month_prod]
+                if len(power_over_ref_results) == 4:
+                    self._store_overage_input(
+                        "current_month_power_usage_over_reference", power_over_ref_results[0], power_over_ref_results[2]
+                    )
+                    self._store_overage_input(
+                        "last_month_power_usage_over_reference", power_over_ref_results[1], power_over_ref_results[3]
+                    )
+                self._apply_overage(data)
 
-                    # Last Week
-                    prod_last_week = data.get("p_06_last_week_production")
-                    export_last_week = data.get("p_10_last_week_exported")
-                    if prod_last_week is not None and export_last_week is not None:
-                        data["p_13_last_week_self_consumed"] = round(prod_last_week - export_last_week, 4)
-
-                    # This Week
-                    prod_weekly = data.get("p_05_weekly_production")
-                    export_weekly = data.get("p_17_weekly_exported")
-                    if prod_weekly is not None and export_weekly is not None:
-                        data["p_18_weekly_self_consumed"] = round(prod_weekly - export_weekly, 4)
-
-                    # Current Month
-                    prod_monthly = data.get("p_07_monthly_production")
-                    export_monthly = data.get("p_15_monthly_exported")
-                    if prod_monthly is not None and export_monthly is not None:
-                        data["p_16_monthly_self_consumed"] = round(prod_monthly - export_monthly, 4)
-
-                    # Last Month
-                    prod_last_month = data.get("p_08_previous_month_production")
-                    export_last_month = data.get("p_11_last_month_exported")
-                    if prod_last_month is not None and export_last_month is not None:
-                        data["p_14_last_month_self_consumed"] = round(prod_last_month - export_last_month, 4)
-                except (TypeError, ValueError) as e:
-                    _LOGGER.error("Could not calculate self-consumption values: %s", e)
-
-                # Calculate power usage over reference
-                ref_power_kw = get_effective_reference_power(self.hass, self.entry)
-
-                if ref_power_kw is not None:
-                    try:
-                        # Yesterday's calculation — also fetch yesterday's production for solar offset
-                        consumption_result = next((res for obis, res in zip(OBIS_CODES.keys(), obis_results) if obis == CONSUMPTION_CODE), None)
-                        production_result = next((res for obis, res in zip(OBIS_CODES.keys(), obis_results) if obis == PRODUCTION_CODE), None)
-                        prod_items_yesterday = production_result.get("items") if isinstance(production_result, dict) else None
-                        if isinstance(consumption_result, dict) and consumption_result.get("items"):
-                            overage = self._calculate_power_overage(consumption_result["items"], ref_power_kw, prod_items_yesterday)
-                            data["yesterdays_power_usage_over_reference"] = overage
-                            _LOGGER.debug(f"Calculated {overage:.4f} kWh over reference for yesterday (solar-adjusted).")
-
-                        # Process results for monthly power over reference
-                        # power_over_ref_results: [cur_month_cons, last_month_cons, cur_month_prod, last_month_prod]
-                        if power_over_ref_results:
-                            # Current month's calculation (solar-adjusted)
-                            current_month_cons = power_over_ref_results[0]
-                            current_month_prod = power_over_ref_results[2] if len(power_over_ref_results) > 2 else None
-                            prod_items_cur = current_month_prod.get("items") if isinstance(current_month_prod, dict) else None
-                            if isinstance(current_month_cons, dict) and current_month_cons.get("items"):
-                                overage = self._calculate_power_overage(current_month_cons["items"], ref_power_kw, prod_items_cur)
-                                data["current_month_power_usage_over_reference"] = overage
-                                _LOGGER.debug(f"Calculated {overage:.4f} kWh over reference for current month (solar-adjusted).")
-                            elif isinstance(current_month_cons, Exception):
-                                _LOGGER.error("Error fetching current month power over reference data: %s", current_month_cons)
-
-                                # Last month's calculation (solar-adjusted)
-                                last_month_cons = power_over_ref_results[1]
-                                last_month_prod = power_over_ref_results[3] if len(power_over_ref_results) > 3 else None
-                                prod_items_last = last_month_prod.get("items") if isinstance(last_month_prod, dict) else None
-                                if isinstance(last_month_cons, dict) and last_month_cons.get("items"):
-                                    overage = self._calculate_power_overage(last_month_cons["items"], ref_power_kw, prod_items_last)
-                                    data["last_month_power_usage_over_reference"] = overage
-                                    _LOGGER.debug(f"Calculated {overage:.4f} kWh over reference for last month (solar-adjusted).")
-                                elif isinstance(last_month_cons, Exception):
-                                    _LOGGER.error("Error fetching last month power over reference data: %s", last_month_cons)
-                    except (ValueError, TypeError) as e:
-                        _LOGGER.error(f"Could not calculate power usage over reference: {e}")
-
-
-                _LOGGER.debug("--- Leneda Data Update Finished ---")
+                timeline.finish()
+                self.timelines.append(timeline.as_dict())
+                _LOGGER.debug("--- Leneda Data Update Finished in %.0f ms ---", timeline.duration_ms)
                 _LOGGER.debug("Final coordinated data: %s", data)
                 return data
         except (asyncio.TimeoutError, Exception) as err:
+            timeline.finish("error")
+            self.timelines.append(timeline.as_dict())
             _LOGGER.error("Fatal error during Leneda data fetch: %s", err, exc_info=True)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
@@ -0,0 +1,44 @@
+"""Diagnostics support for the Leneda integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_KEY, CONF_ENERGY_ID, CONF_METERING_POINT_ID, DOMAIN, EXTRA_METER_SLOTS
+
+# Credentials and metering point IDs (setup slots and the "id" of meter dicts)
+TO_REDACT = {
+    CONF_API_KEY,
+    CONF_ENERGY_ID,
+    CONF_METERING_POINT_ID,
+    *(id_key for id_key, _types_key in EXTRA_METER_SLOTS),
+    "api_key",
+    "energy_id",
+    "id",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    diagnostics: dict[str, Any] = {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+    }
+    if coordinator is None:
+        return diagnostics
+
+    diagnostics.update({
+        "version": coordinator.version,
+        "meters": async_redact_data(
+            [{"id": mid, "types": types} for mid, types in coordinator.meters], TO_REDACT
+        ),
+        "last_update_success": coordinator.last_update_success,
+        "data_keys": sorted((coordinator.data or {}).keys()),
+        "refresh_timelines": list(coordinator.timelines),
+    })
+    return diagnostics
@@ -0,0 +1,199 @@
+"""Vectorized interval engine for peak power and reference-power exceedance.
+
+Leneda delivers 15-minute power readings (kW) as lists of
+``{"value", "startedAt", ...}`` dicts. Instead of walking those items in
+Python and aligning production by string timestamp, this module converts a
+series to NumPy arrays once and addresses every reading by its interval
+index (seconds since epoch // 900). Consumption and production are aligned
+on that index, and net grid draw, peak and overage are computed in
+vectorized passes.
+
+Overage for one interval is ``max(0, net_kw - reference_kw) * 0.25`` kWh.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+INTERVAL_SECONDS = 900
+INTERVAL_HOURS = 0.25
+
+
+@dataclass
+class IntervalSeries:
+    """A power series addressed by epoch seconds (NaN-free values)."""
+
+    epoch: np.ndarray  # int64 seconds since epoch, -1 where the timestamp is unknown
+    values: np.ndarray  # float64 kW
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def interval_index(self) -> np.ndarray:
+        """Return the 15-min interval index of each reading (-1 when unknown)."""
+        return np.where(self.epoch >= 0, self.epoch // INTERVAL_SECONDS, -1)
+
+
+def _parse_timestamp(value: Any) -> int:
+    """Parse a single ISO timestamp to epoch seconds, or -1."""
+    try:
+        return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+    except (AttributeError, TypeError, ValueError):
+        return -1
+
+
+def parse_timestamps(stamps: list[Any]) -> np.ndarray:
+    """Parse ISO-8601 UTC timestamps to int64 epoch seconds (-1 if invalid).
+
+    Uses NumPy's datetime parser for the usual ``...Z`` format and falls back
+    to per-item parsing for explicit offsets or malformed values.
+    """
+    if not stamps:
+        return np.empty(0, dtype=np.int64)
+    if all(isinstance(s, str) and s.endswith("Z") for s in stamps):
+        try:
+            parsed = np.array([s[:-1] for s in stamps], dtype="datetime64[s]")
+            epoch = parsed.astype(np.int64)
+            return np.where(np.isnat(parsed), -1, epoch)
+        except ValueError:
+            pass
+    return np.fromiter((_parse_timestamp(s) for s in stamps), dtype=np.int64, count=len(stamps))
+
+
+def _to_float_array(values: list[Any]) -> np.ndarray:
+    """Convert raw values to float64, mapping invalid entries to NaN."""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.empty(len(values), dtype=np.float64)
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except (TypeError, ValueError):
+                out[i] = np.nan
+        return out
+
+
+def series_from_items(items: list[dict] | None) -> IntervalSeries:
+    """Convert Leneda time-series items to an ``IntervalSeries``.
+
+    Items without a numeric value are dropped, mirroring the previous
+    per-item ``float(item["value"])`` / ``continue`` handling.
+    """
+    items = [item for item in (items or []) if isinstance(item, dict)]
+    values = _to_float_array([item.get("value") for item in items])
+    epoch = parse_timestamps([item.get("startedAt") for item in items])
+    valid = ~np.isnan(values)
+    if not valid.all():
+        values = values[valid]
+        epoch = epoch[valid]
+    return IntervalSeries(epoch=epoch, values=values)
+
+
+def merge_series(parts: list[IntervalSeries]) -> IntervalSeries:
+    """Sum several series by timestamp (e.g. the same OBIS code across meters).
+
+    The result is sorted by time; readings without a timestamp are dropped.
+    """
+    parts = [p for p in parts if len(p)]
+    if not parts:
+        return IntervalSeries(epoch=np.empty(0, dtype=np.int64), values=np.empty(0, dtype=np.float64))
+    epoch = np.concatenate([p.epoch for p in parts])
+    values = np.concatenate([p.values for p in parts])
+    known = epoch >= 0
+    epoch, values = epoch[known], values[known]
+    if len(parts) == 1 and (len(epoch) < 2 or bool(np.all(np.diff(epoch) > 0))):
+        return IntervalSeries(epoch=epoch, values=values)
+    unique, inverse = np.unique(epoch, return_inverse=True)
+    return IntervalSeries(epoch=unique, values=np.bincount(inverse, weights=values, minlength=len(unique)))
+
+
+def align_to(consumption: IntervalSeries, production: IntervalSeries | None) -> np.ndarray:
+    """Return the production reading concurrent with each consumption reading.
+
+    Production is aligned by interval index; readings without concurrent
+    production (or without a timestamp) get 0.
+    """
+    solar = np.zeros(len(consumption), dtype=np.float64)
+    if production is None or not len(production) or not len(consumption):
+        return solar
+
+    c_idx = consumption.interval_index
+    p_idx = production.interval_index
+    p_known = p_idx >= 0
+    p_idx = p_idx[p_known]
+    p_val = production.values[p_known]
+    if not len(p_idx):
+        return solar
+
+    base = p_idx.min()
+    dense = np.zeros(int(p_idx.max() - base) + 1, dtype=np.float64)
+    dense[p_idx - base] = p_val
+
+    offset = c_idx - base
+    in_range = (c_idx >= 0) & (offset >= 0) & (offset < len(dense))
+    solar[in_range] = dense[offset[in_range]]
+    return solar
+
+
+def net_grid_draw(consumption: IntervalSeries, production: IntervalSeries | None = None) -> np.ndarray:
+    """Return net grid draw (kW, >= 0) for each consumption reading.
+
+    Readings without concurrent production are left unchanged.
+    """
+    return np.maximum(consumption.values - align_to(consumption, production), 0.0)
+
+
+def overage_kwh(power_kw: np.ndarray, reference_kw: float | np.ndarray) -> float:
+    """Return the energy (kWh) drawn above *reference_kw*.
+
+    *reference_kw* may be a scalar or one value per reading; NaN references
+    (no reference configured for that interval) never count as exceedance.
+    """
+    if not len(power_kw):
+        return 0.0
+    over = power_kw - reference_kw
+    over = over[over > 0]
+    return float(over.sum() * INTERVAL_HOURS)
+
+
+def overage_curve(power_kw: np.ndarray, candidates_kw: np.ndarray) -> np.ndarray:
+    """Return the overage (kWh) for every candidate reference at once.
+
+    For a threshold ``c`` the overage is ``sum(v > c) - c * count(v > c)``
+    (times the interval length). With the readings sorted once, both terms
+    come from a suffix cumulative sum and a ``searchsorted`` per candidate,
+    i.e. O((n + k) log n) instead of one pass per candidate.
+    """
+    candidates_kw = np.asarray(candidates_kw, dtype=np.float64)
+    values = np.sort(power_kw[np.isfinite(power_kw)])
+    if not len(values):
+        return np.zeros(len(candidates_kw), dtype=np.float64)
+    suffix = np.append(np.cumsum(values[::-1])[::-1], 0.0)  # suffix[i] == values[i:].sum()
+    first_above = np.searchsorted(values, candidates_kw, side="right")
+    above = len(values) - first_above
+    return np.maximum(suffix[first_above] - candidates_kw * above, 0.0) * INTERVAL_HOURS
+
+
+def peak_kw(power_kw: np.ndarray) -> float:
+    """Return the highest reading, or 0.0 for an empty series."""
+    if not len(power_kw):
+        return 0.0
+    return max(0.0, float(power_kw.max()))
+
+
+def calculate_power_overage(
+    items: list[dict] | None,
+    ref_power_kw: float,
+    production_items: list[dict] | None = None,
+) -> float:
+    """Return kWh above *ref_power_kw*, solar-adjusted when production is given."""
+    if not items:
+        return 0.0
+    consumption = series_from_items(items)
+    production = series_from_items(production_items) if production_items else None
+    return round(overage_kwh(net_grid_draw(consumption, production), ref_power_kw), 4)
@@ -0,0 +1,146 @@
+"""Feed-in revenue valued at the price in force at export time.
+
+A ``feed_in_rates`` entry in ``sensor`` mode points at a price entity. Its
+recorder history for the requested period is loaded in one query and turned
+into a step function (change time → price). Each 15-minute export reading
+(``1-65:2.29.9``) is then matched to the price active at its start with a
+single ``searchsorted`` join, and revenue is accumulated per local day.
+
+Days past Leneda's revision window (``SUMMARY_REVISION_DAYS``) no longer
+change, so their per-day totals are cached on the ``FeedInRevenueCache``
+and only recent or unseen days are fetched again.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any
+
+import numpy as np
+
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+from .const import SUMMARY_REVISION_DAYS
+from .exceedance import INTERVAL_HOURS, IntervalSeries
+from .schedule import local_epoch
+
+
+def price_steps(states: list[State]) -> tuple[np.ndarray, np.ndarray]:
+    """Return (change epoch seconds, price) arrays from recorder states.
+
+    Non-numeric states (unknown, unavailable) become NaN so the fallback
+    tariff applies while the sensor had no value.
+    """
+    epoch = np.empty(len(states), dtype=np.int64)
+    prices = np.empty(len(states), dtype=np.float64)
+    for i, state in enumerate(states):
+        epoch[i] = int(state.last_changed.timestamp())
+        try:
+            prices[i] = float(state.state)
+        except (TypeError, ValueError):
+            prices[i] = np.nan
+    order = np.argsort(epoch, kind="stable")
+    return epoch[order], prices[order]
+
+
+def price_at(epoch: np.ndarray, steps: tuple[np.ndarray, np.ndarray], fallback: float) -> np.ndarray:
+    """Return the price in force at each epoch second (*fallback* if none)."""
+    change_epoch, prices = steps
+    if not len(change_epoch):
+        return np.full(len(epoch), fallback, dtype=np.float64)
+    idx = np.searchsorted(change_epoch, epoch, side="right") - 1
+    price = prices[np.maximum(idx, 0)]
+    return np.where((idx >= 0) & np.isfinite(price), price, fallback)
+
+
+def daily_revenue(
+    exports: IntervalSeries,
+    steps: tuple[np.ndarray, np.ndarray],
+    fallback: float,
+) -> dict[date, tuple[float, float]]:
+    """Return ``{local day: (exported kWh, revenue)}`` for an export series."""
+    known = exports.epoch >= 0
+    epoch = exports.epoch[known]
+    if not len(epoch):
+        return {}
+    kwh = exports.values[known] * INTERVAL_HOURS
+    revenue = kwh * price_at(epoch, steps, fallback)
+    day_number = local_epoch(epoch) // 86400
+    days, inverse = np.unique(day_number, return_inverse=True)
+    kwh_per_day = np.bincount(inverse, weights=kwh, minlength=len(days))
+    revenue_per_day = np.bincount(inverse, weights=revenue, minlength=len(days))
+    epoch_date = date(1970, 1, 1)
+    return {
+        epoch_date + timedelta(days=int(day)): (float(kwh_per_day[i]), float(revenue_per_day[i]))
+        for i, day in enumerate(days)
+    }
+
+
+async def async_load_price_steps(
+    hass: HomeAssistant, entity_id: str, start: datetime, end: datetime
+) -> tuple[np.ndarray, np.ndarray]:
+    """Load the recorder history of *entity_id* as price steps (one query)."""
+    from homeassistant.components.recorder import get_instance, history
+
+    states = await get_instance(hass).async_add_executor_job(
+        lambda: history.state_changes_during_period(
+            hass, start, end, entity_id, include_start_time_state=True
+        )
+    )
+    return price_steps(states.get(entity_id, []))
+
+
+class FeedInRevenueCache:
+    """Per-day feed-in totals for closed days, keyed by meter and price source."""
+
+    def __init__(self) -> None:
+        self._days: dict[tuple[str, str, date], tuple[float, float]] = {}
+
+    def missing_days(self, meter_id: str, source: str, days: list[date]) -> list[date]:
+        """Return the days that still need data."""
+        return [day for day in days if (meter_id, source, day) not in self._days]
+
+    def get(self, meter_id: str, source: str, day: date) -> tuple[float, float] | None:
+        """Return cached (kWh, revenue) for a closed day."""
+        return self._days.get((meter_id, source, day))
+
+    def store(self, meter_id: str, source: str, totals: dict[date, tuple[float, float]], today: date) -> None:
+        """Remember the totals of days that can no longer be revised."""
+        closed_before = today - timedelta(days=SUMMARY_REVISION_DAYS)
+        for day, value in totals.items():
+            if day < closed_before:
+                self._days[(meter_id, source, day)] = value
+
+    def clear(self) -> None:
+        """Drop all cached days."""
+        self._days.clear()
+
+
+def local_days(start: datetime, end: datetime) -> list[date]:
+    """Return every local calendar day touched by [start, end]."""
+    first = dt_util.as_local(start).date()
+    last = dt_util.as_local(end).date()
+    return [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+
+def day_start(day: date) -> datetime:
+    """Return local midnight of *day* as an aware datetime."""
+    return dt_util.start_of_local_day(day)
+
+
+def summarize(days: list[date], totals: dict[date, tuple[float, float]]) -> dict[str, Any]:
+    """Build the per-meter response block from per-day totals."""
+    daily = []
+    for day in days:
+        if day not in totals:
+            continue
+        kwh, revenue = totals[day]
+        daily.append({"date": day.isoformat(), "exported_kwh": round(kwh, 4), "revenue": round(revenue, 4)})
+    exported = sum(totals[day][0] for day in days if day in totals)
+    revenue = sum(totals[day][1] for day in days if day in totals)
+    return {
+        "exported_kwh": round(exported, 4),
+        "revenue": round(revenue, 4),
+        "average_price": round(revenue / exported, 6) if exported else None,
+        "daily": daily,
+    }
@@ -0,0 +1,67 @@
+"""Multi-OBIS frames aligned on one shared time axis.
+
+Charts comparing consumption, production and sharing layers need their
+series side by side. ``align_frame`` places each merged series on the
+union of all timestamps (one ``searchsorted`` per column) so every column
+is index-aligned with the shared axis; readings missing from a series are
+NaN. Derived columns are computed on the aligned arrays.
+"""
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+from .exceedance import IntervalSeries
+
+CONSUMPTION = "1-1:1.29.0"
+PRODUCTION = "1-1:2.29.0"
+EXPORTED = "1-65:2.29.9"
+
+
+def _net_grid_draw(columns: dict[str, np.ndarray]) -> np.ndarray:
+    """Consumption minus concurrent production, never below zero."""
+    return np.maximum(columns[CONSUMPTION] - np.nan_to_num(columns[PRODUCTION]), 0.0)
+
+
+def _self_consumption(columns: dict[str, np.ndarray]) -> np.ndarray:
+    """Production not exported to the grid, never below zero."""
+    return np.maximum(columns[PRODUCTION] - np.nan_to_num(columns[EXPORTED]), 0.0)
+
+
+# Derived column -> (required OBIS codes, function of the aligned columns)
+DERIVED: dict[str, tuple[tuple[str, ...], Callable[[dict[str, np.ndarray]], np.ndarray]]] = {
+    "net_grid_draw": ((CONSUMPTION, PRODUCTION), _net_grid_draw),
+    "self_consumption": ((PRODUCTION, EXPORTED), _self_consumption),
+}
+
+
+def required_obis(obis_codes: list[str], derived: list[str]) -> list[str]:
+    """Return the requested codes plus those the derived columns need, without duplicates."""
+    needed = list(dict.fromkeys(obis_codes))
+    for name in derived:
+        for code in DERIVED[name][0]:
+            if code not in needed:
+                needed.append(code)
+    return needed
+
+
+def align_frame(series: dict[str, IntervalSeries]) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """Align sorted, de-duplicated series (see ``merge_series``) on their shared time axis.
+
+    Returns the axis (epoch seconds) and one float64 column per key.
+    """
+    parts = [s.epoch for s in series.values() if len(s)]
+    axis = np.unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+    columns: dict[str, np.ndarray] = {}
+    for key, part in series.items():
+        column = np.full(len(axis), np.nan, dtype=np.float64)
+        if len(part):
+            column[np.searchsorted(axis, part.epoch)] = part.values
+        columns[key] = column
+    return axis, columns
+
+
+def add_derived(columns: dict[str, np.ndarray], derived: list[str]) -> dict[str, np.ndarray]:
+    """Return *columns* with the requested derived columns appended."""
+    return {**columns, **{name: DERIVED[name][1](columns) for name in derived}}
@@ -6,24 +6,61 @@ All endpoints require Home Assistant authentication (session cookie from iframe)
 Endpoints:
   GET  /api/leneda/data?range=yesterday|this_week|last_week|this_month|last_month
   GET  /api/leneda/data/custom?start=YYYY-MM-DD&end=YYYY-MM-DD
-  GET  /api/leneda/data/timeseries?obis=1-1:1.29.0&start=ISO&end=ISO
+  GET  /api/leneda/data/timeseries?obis=1-1:1.29.0&start=ISO&end=ISO[&max_points=N&downsample=minmax|lttb]
   GET  /api/leneda/sensors
   GET  /api/leneda/config
+  GET  /leneda_api/diagnostics/timings
+  GET  /leneda_api/costs?start=ISO&end=ISO
+  GET  /leneda_api/invoice?month=YYYY-MM&months=N
+  GET  /leneda_api/reference-power/optimize?start=ISO&end=ISO&step=0.1&capacity_rate=
+  GET  /leneda_api/feed-in/revenue?start=ISO&end=ISO
+  GET  /leneda_api/battery/simulate?capacity_kwh=&power_kw=&efficiency=&strategy=&start=ISO&end=ISO
+  POST /leneda_api/batch  {queries: [{id, type, params}], stream: bool}
+  POST /leneda_api/tariffs/compare  {start, end, scenarios: [{name, config}]}
   POST /api/leneda/config
   POST /api/leneda/config/reset
 """
 from __future__ import annotations
 
+import asyncio
+import calendar
+import functools
+import hashlib
+import json
 import logging
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
 from typing import Any
 
+import numpy as np
 from aiohttp import web
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
-
-from .const import DOMAIN, CONF_API_KEY, CONF_ENERGY_ID, CONF_METER_HAS_GAS, CONF_METERING_POINT_ID, CONF_METERING_POINT_1_TYPES, CONF_REFERENCE_POWER_ENTITY, CONF_REFERENCE_POWER_STATIC, EXTRA_METER_SLOTS, OBIS_CODES
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, DATA_COMBINED_MEMO, DATA_COMPRESSION_STATS, DATA_FEED_IN_CACHE, DATA_INVOICE_CACHE, DATA_PEAK_SUMMARIES, DATA_RESPONSE_CACHE, RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL, SUMMARY_REVISION_DAYS, CONF_API_KEY, CONF_ENERGY_ID, CONF_METER_HAS_GAS, CONF_METERING_POINT_ID, CONF_METERING_POINT_1_TYPES, CONF_REFERENCE_POWER_ENTITY, CONF_REFERENCE_POWER_STATIC, EXTRA_METER_SLOTS, OBIS_CODES
+from .battery import BatteryModel, simulate_battery
+from .columnar import BINARY_CONTENT_TYPE, DTYPES, FORMATS, encode_binary, encode_columnar, grid_from_items, is_flagged, to_grid
+from .compression import CompressionStats, async_compress_response
+from .billing import TariffScenario, average_feed_in_rate, compare_tariffs, compute_invoice, price_consumption
+from .exceedance import INTERVAL_HOURS, IntervalSeries, merge_series, net_grid_draw, overage_kwh, peak_kw, series_from_items
+from .feed_in import (
+    FeedInRevenueCache,
+    async_load_price_steps,
+    daily_revenue,
+    day_start,
+    local_days,
+    summarize,
+)
+from .frame import DERIVED, add_derived, align_frame, required_obis
+from .downsample import METHODS as DOWNSAMPLE_METHODS, MIN_POINTS, downsample_items
+from .meters import MeterRegistry
+from .rollup import DAILY_RESOLUTIONS, RESOLUTIONS, daily_totals, interval_hours, is_whole_days, rollup_days, rollup_series
+from .routes import get_route_index
 from .models import BillingConfig
+from .optimizer import optimize_reference_power
+from .schedule import get_reference_schedule
 from .storage import get_effective_reference_power
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,119 +79,300 @@ class LenedaModeView(HomeAssistantView):
 
 def _get_first_coordinator(hass: HomeAssistant):
     """Return the first active coordinator, or None."""
-    for key, val in hass.data.get(DOMAIN, {}).items():
-        if key not in ("storage", "views_registered") and hasattr(val, "data"):
-            return val
-    return None
+    return get_route_index(hass).first
 
 
 def _get_coordinators(hass: HomeAssistant) -> list[Any]:
     """Return all active Leneda coordinators."""
-    return [
-        val
-        for key, val in hass.data.get(DOMAIN, {}).items()
-        if key not in ("storage", "views_registered") and hasattr(val, "data")
-    ]
+    return get_route_index(hass).coordinators
 
 
 def _get_preferred_coordinator(hass: HomeAssistant, meter_type: str | None = None) -> Any | None:
     """Return a coordinator that has the requested meter type, or the first one."""
-    coordinators = _get_coordinators(hass)
-    if not coordinators:
-        return None
-    if meter_type is None:
-        return coordinators[0]
-
-    for coordinator in coordinators:
-        for _mid, types in getattr(coordinator, "meters", []):
-            if meter_type in (types or []):
-                return coordinator
-    return coordinators[0]
+    return get_route_index(hass).preferred(meter_type)
 
 
 def _iter_entry_meters(entry: Any) -> list[dict[str, Any]]:
     """Extract all configured meters from a config entry."""
-    meters: list[dict[str, Any]] = []
-    m1_id = (entry.data.get(CONF_METERING_POINT_ID) or "").strip()
-    m1_types = entry.data.get(CONF_METERING_POINT_1_TYPES, ["consumption"])
-    if m1_id:
-        meters.append({"id": m1_id, "types": m1_types})
-
-    for id_key, types_key in EXTRA_METER_SLOTS:
-        mid = (entry.data.get(id_key) or "").strip()
-        mtypes = entry.data.get(types_key, [])
-        if mid:
-            meters.append({"id": mid, "types": mtypes})
-    return meters
+    return MeterRegistry.from_entry(entry).as_dicts()
 
 
 def _get_meter_routes(hass: HomeAssistant) -> dict[str, list[dict[str, Any]]]:
-    """Build a de-duplicated map of meter routes across all coordinators."""
-    routes: dict[str, list[dict[str, Any]]] = {
-        "consumption": [],
-        "production": [],
-        "gas": [],
-    }
-    seen: set[tuple[str, str]] = set()
+    """Return the de-duplicated map of meter routes across all coordinators."""
+    return get_route_index(hass).routes
+
+
+def _routes_for_obis(hass: HomeAssistant, obis: str) -> list[dict[str, Any]]:
+    """Return all meter routes that can serve a given OBIS code."""
+    return get_route_index(hass).for_obis(obis)
+
 
+def _recompute_coordinators(hass: HomeAssistant) -> None:
+    """Refresh derived sensor values after a billing config change (no API calls)."""
+    async_invalidate_response_cache(hass)
     for coordinator in _get_coordinators(hass):
-        for mid, types in getattr(coordinator, "meters", []):
-            meter_id = (mid or "").strip()
-            if not meter_id:
-                continue
-            for meter_type in (types or []):
-                if meter_type not in routes:
-                    continue
-                key = (meter_type, meter_id)
-                if key in seen:
-                    continue
-                seen.add(key)
-                routes[meter_type].append(
-                    {
-                        "meter_id": meter_id,
-                        "api_client": coordinator.api_client,
-                        "coordinator": coordinator,
-                    }
-                )
+        if hasattr(coordinator, "async_recompute_derived"):
+            coordinator.async_recompute_derived()
 
-    preferred = _get_preferred_coordinator(hass)
-    if preferred:
-        if not routes["consumption"] and getattr(preferred, "consumption_meter", ""):
-            routes["consumption"].append(
-                {
-                    "meter_id": preferred.consumption_meter,
-                    "api_client": preferred.api_client,
-                    "coordinator": preferred,
-                }
-            )
-        if not routes["production"] and getattr(preferred, "production_meter", ""):
-            routes["production"].append(
-                {
-                    "meter_id": preferred.production_meter,
-                    "api_client": preferred.api_client,
-                    "coordinator": preferred,
-                }
-            )
-        if not routes["gas"] and getattr(preferred, "has_gas", False) and getattr(preferred, "gas_meter", ""):
-            routes["gas"].append(
-                {
-                    "meter_id": preferred.gas_meter,
-                    "api_client": preferred.api_client,
-                    "coordinator": preferred,
-                }
-            )
 
-    return routes
+async def _fetch_merged_series(
+    hass: HomeAssistant, obis: str, start_dt: datetime, end_dt: datetime, errors: list[str] | None = None
+) -> IntervalSeries:
+    """Fetch 15-min data for *obis* from every matching meter and sum by interval.
 
+    Failed meters are logged, left out and, when given, appended to *errors*.
+    """
+    routes = _routes_for_obis(hass, obis)
+    results = await asyncio.gather(*[
+        route["api_client"].async_get_metering_data(route["meter_id"], obis, start_dt, end_dt)
+        for route in routes
+    ], return_exceptions=True)
+    parts = []
+    for result in results:
+        if isinstance(result, dict):
+            parts.append(series_from_items(result.get("items", [])))
+        elif isinstance(result, Exception):
+            _LOGGER.error("Error fetching timeseries for %s: %s", obis, result)
+            if errors is not None:
+                errors.append(f"{obis}: {result}")
+    return merge_series(parts)
+
+
+def _parse_iso_range(start_str: str | None, end_str: str | None) -> tuple[datetime, datetime] | None:
+    """Parse ISO start/end query values, or return None if missing/invalid."""
+    if not start_str or not end_str:
+        return None
+    try:
+        start_dt = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
+        end_dt = datetime.fromisoformat(end_str.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if end_dt < start_dt:
+        return None
+    return start_dt, end_dt
+
+
+class ResponseCache:
+    """Bounded TTL/LRU cache for live-range responses.
+
+    Entries are dropped after ``ttl`` seconds, the least recently used entry
+    is evicted beyond ``maxsize``, and everything is invalidated when a
+    coordinator refreshes or the billing config is saved.
+    """
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: tuple) -> dict[str, Any] | None:
+        """Return a cached payload, or None on a miss or expiry."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: tuple, payload: dict[str, Any]) -> None:
+        """Store a payload, evicting the least recently used entries."""
+        self._entries[key] = (time.monotonic(), payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop every entry."""
+        if self._entries:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters for diagnostics."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+def _get_response_cache(hass: HomeAssistant) -> ResponseCache:
+    """Return the shared live-range response cache."""
+    return hass.data.setdefault(DOMAIN, {}).setdefault(DATA_RESPONSE_CACHE, ResponseCache())
+
+
+def async_invalidate_response_cache(hass: HomeAssistant) -> None:
+    """Invalidate cached live-range responses (coordinator refresh, config save)."""
+    cache = hass.data.get(DOMAIN, {}).get(DATA_RESPONSE_CACHE)
+    if cache is not None:
+        cache.invalidate()
+
+
+def _response_cache_key(hass: HomeAssistant, *range_key: Any) -> tuple:
+    """Key a live-range response by range, meter set and billing-config hash."""
+    storage = hass.data.get(DOMAIN, {}).get("storage")
+    meters = get_route_index(hass).meter_ids()
+    return (*range_key, meters, storage.config_hash if storage else None)
+
+
+def _etag(*parts: Any, weak: bool = False) -> str:
+    """Return an entity tag derived from *parts* (generations, hashes, ...)."""
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:24]
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def _etag_matches(request: web.Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match matches *etag* (weak comparison)."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") == opaque
+        for candidate in (c.strip() for c in header.split(","))
+    )
+
+
+def _not_modified(etag: str) -> web.Response:
+    """Return a 304 carrying *etag*."""
+    return web.Response(status=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+
+
+def _with_etag(request: web.Request, response: web.Response, etag: str | None = None) -> web.Response:
+    """Attach *etag* (or a hash of the body) to a 200 response, or answer 304."""
+    if response.status != 200:
+        return response
+    if etag is None:
+        etag = _etag(hashlib.sha1(response.body).hexdigest())
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _get_compression_stats(hass: HomeAssistant) -> CompressionStats:
+    """Return the shared response-compression counters."""
+    return hass.data.setdefault(DOMAIN, {}).setdefault(DATA_COMPRESSION_STATS, CompressionStats())
+
+
+def _compressible(handler):
+    """Compress the handler's JSON response when large and accepted by the client."""
+
+    @functools.wraps(handler)
+    async def wrapper(self, request: web.Request, *args: Any, **kwargs: Any) -> web.StreamResponse:
+        response = await handler(self, request, *args, **kwargs)
+        hass = request.app["hass"]
+        return await async_compress_response(hass, request, response, _get_compression_stats(hass))
+
+    return wrapper
 
-def _routes_for_obis(hass: HomeAssistant, obis: str) -> list[dict[str, Any]]:
-    """Return all meter routes that can serve a given OBIS code."""
-    routes = _get_meter_routes(hass)
-    if obis.startswith("7-"):
-        return routes["gas"]
-    if obis.startswith("1-1:2.") or obis.startswith("1-1:4.") or obis.startswith("1-65:2."):
-        return routes["production"]
-    return routes["consumption"]
+
+def _parse_downsampling(query: Any) -> tuple[int | None, str]:
+    """Parse ``max_points``/``points`` and ``downsample``; raise ValueError if invalid."""
+    raw = query.get("max_points") or query.get("points")
+    method = query.get("downsample", "minmax")
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"downsample must be one of {', '.join(DOWNSAMPLE_METHODS)}")
+    if raw is None:
+        return None, method
+    max_points = int(raw)
+    if max_points < MIN_POINTS:
+        raise ValueError(f"max_points must be at least {MIN_POINTS}")
+    return max_points, method
+
+
+def _parse_encoding(query: Any, allow_binary: bool = True) -> tuple[str, str, bool]:
+    """Parse ``format``, ``dtype`` and ``flags``; raise ValueError if invalid.
+
+    Compact formats describe raw readings on a regular grid, so they cannot
+    be combined with downsampling or rollups.
+    """
+    fmt = query.get("format", "json")
+    dtype = query.get("dtype", "float32")
+    if fmt not in FORMATS or (fmt == "binary" and not allow_binary):
+        allowed = FORMATS if allow_binary else tuple(f for f in FORMATS if f != "binary")
+        raise ValueError(f"format must be one of {', '.join(allowed)}")
+    if dtype not in DTYPES:
+        raise ValueError(f"dtype must be one of {', '.join(DTYPES)}")
+    if fmt != "json" and (query.get("max_points") or query.get("points") or query.get("resolution") not in (None, "raw")):
+        raise ValueError(f"format={fmt} cannot be combined with max_points or resolution")
+    return fmt, dtype, query.get("flags", "1").lower() not in ("0", "false", "no")
+
+
+def _parse_resolution(query: Any) -> str | None:
+    """Parse the ``resolution`` rollup parameter; raise ValueError if invalid."""
+    resolution = query.get("resolution")
+    if resolution is None or resolution == "raw":
+        return None
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"resolution must be one of {', '.join(RESOLUTIONS)}")
+    return resolution
+
+
+async def _fetch_route_rollup(
+    hass: HomeAssistant,
+    route: dict[str, Any],
+    obis: str,
+    start_dt: datetime,
+    end_dt: datetime,
+    resolution: str,
+) -> dict[str, Any]:
+    """Return kWh rollups for one meter on local bucket boundaries.
+
+    Day/week/month rollups over whole local days come from one Day-aggregated
+    request (~1 value per day instead of 96 readings); hourly or partial-day
+    ranges are rolled up from the raw 15-min readings. Results are kept in
+    the shared response cache.
+    """
+    cache = _get_response_cache(hass)
+    key = _response_cache_key(
+        hass, "rollup", route["meter_id"], obis, resolution,
+        int(start_dt.timestamp()), int(end_dt.timestamp()),
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    if resolution in DAILY_RESOLUTIONS and is_whole_days(start_dt, end_dt):
+        local_start = dt_util.as_local(start_dt)
+        local_end = dt_util.as_local(end_dt)
+        result = await route["api_client"].async_get_aggregated_metering_data(
+            route["meter_id"], obis, local_start, local_end, "Day"
+        )
+        first_day, last_day = local_start.date(), local_end.date()
+        days = {day: value for day, value in daily_totals(result).items() if first_day <= day <= last_day}
+        payload = {
+            "unit": (result or {}).get("unit") or "kWh",
+            "source": "aggregated",
+            "items": rollup_days(days, resolution),
+        }
+    else:
+        result = await route["api_client"].async_get_metering_data(route["meter_id"], obis, start_dt, end_dt)
+        unit = (result or {}).get("unit") or "kW"
+        # Power readings become energy per interval; energy/volume readings sum as-is
+        factor = interval_hours((result or {}).get("intervalLength")) if unit in ("kW", "kVAR") else 1.0
+        payload = {
+            "unit": {"kW": "kWh", "kVAR": "kVARh"}.get(unit, unit),
+            "source": "raw",
+            "items": rollup_series(series_from_items((result or {}).get("items", [])), resolution, factor),
+        }
+    # Fetch errors raise before this point; an unusable payload is not kept either
+    if isinstance(result, dict):
+        cache.set(key, payload)
+    return payload
 
 
 def _sum_aggregated_timeseries(result: dict[str, Any]) -> float:
@@ -187,62 +405,52 @@ def _combine_cached_data(coordinators: list[Any]) -> dict[str, Any]:
     return combined
 
 
-def _time_to_minutes(value: str) -> int:
-    """Convert HH:MM to minutes since midnight."""
-    try:
-        hour, minute = value.split(":", 1)
-        return int(hour) * 60 + int(minute)
-    except (AttributeError, TypeError, ValueError):
-        return 0
-
-
-def _matches_day_group(dt: datetime, day_group: str) -> bool:
-    """Return True when the datetime matches the configured day group."""
-    if day_group == "weekdays":
-        return dt.weekday() < 5
-    if day_group == "weekends":
-        return dt.weekday() >= 5
-    return True
+def _data_generations(coordinators: list[Any]) -> tuple:
+    """Return the data generation of every coordinator (memo/ETag key).
 
+    Generations are drawn from one process-wide counter, so a reloaded
+    coordinator can never match a key built for its predecessor.
+    """
+    return tuple(getattr(c, "data_generation", 0) for c in coordinators)
 
-def _matches_window(dt: datetime, day_group: str, start_time: str, end_time: str) -> bool:
-    """Check whether a datetime falls within a configured time window."""
-    if not _matches_day_group(dt, day_group):
-        return False
 
-    now_minutes = dt.hour * 60 + dt.minute
-    start_minutes = _time_to_minutes(start_time)
-    end_minutes = _time_to_minutes(end_time)
+def _get_combined_memo(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the combined-data memo, rebuilt only when a generation moved.
 
-    if start_minutes == end_minutes:
-        return True
-    if start_minutes < end_minutes:
-        return start_minutes <= now_minutes < end_minutes
-    return now_minutes >= start_minutes or now_minutes < end_minutes
+    The memo holds ``combined`` (merged coordinator data) and lazily the
+    ``sensors`` list payload; callers must treat both as read-only.
+    """
+    coordinators = _get_coordinators(hass)
+    generations = _data_generations(coordinators)
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    memo = domain_data.get(DATA_COMBINED_MEMO)
+    if memo is None or memo["generations"] != generations:
+        memo = domain_data[DATA_COMBINED_MEMO] = {
+            "generations": generations,
+            "combined": _combine_cached_data(coordinators),
+        }
+    return memo
 
 
-def _get_reference_power_for_dt(hass: HomeAssistant, entry: Any, dt: datetime) -> float | None:
-    """Return the scheduled reference power for a timestamp, or the base reference."""
-    base_ref = get_effective_reference_power(hass, entry)
-    storage = hass.data.get(DOMAIN, {}).get("storage")
-    if not storage:
-        return base_ref
-
-    windows = getattr(storage.billing_config, "reference_power_windows", []) or []
-    for window in windows:
-        if not isinstance(window, dict):
-            continue
-        if _matches_window(
-            dt,
-            window.get("day_group", "all"),
-            window.get("start_time", "00:00"),
-            window.get("end_time", "00:00"),
-        ):
-            try:
-                return float(window.get("reference_power_kw"))
-            except (TypeError, ValueError):
-                return base_ref
-    return base_ref
+def _get_sensor_list(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Return the memoized sensor list payload built from the combined data."""
+    memo = _get_combined_memo(hass)
+    if "sensors" not in memo:
+        data = memo["combined"]
+        sensors = []
+        for key, value in data.items():
+            if key.endswith("_peak_timestamp"):
+                continue
+            meta = OBIS_CODES.get(key, {})
+            sensors.append({
+                "key": key,
+                "value": value,
+                "name": meta.get("name", key),
+                "unit": meta.get("unit", "kWh"),
+                "peak_timestamp": data.get(f"{key}_peak_timestamp"),
+            })
+        memo["sensors"] = sensors
+    return memo["sensors"]
 
 
 def _has_reference_power_windows(hass: HomeAssistant) -> bool:
@@ -254,32 +462,43 @@ def _has_reference_power_windows(hass: HomeAssistant) -> bool:
     return any(isinstance(window, dict) for window in windows)
 
 
-async def _fetch_peak_and_exceedance(coordinator, start_dt: datetime, end_dt: datetime) -> dict[str, float]:
-    """Compute peak power and exceedance using the active reference-power schedule."""
+async def _fetch_peak_and_exceedance(
+    coordinator, start_dt: datetime, end_dt: datetime, errors: list[str] | None = None
+) -> dict[str, float]:
+    """Compute peak power and exceedance using the active reference-power schedule.
+
+    Closed days are served from the materialized peak summaries; raw 15-min
+    consumption is only downloaded for the days that are not stored yet. On
+    failure both values are 0 and the error is appended to *errors*.
+    """
     peak_power_kw = 0.0
     exceedance_kwh = 0.0
 
     try:
         c_meter = coordinator._meter_for_obis("1-1:1.29.0")
-        ts_data = await coordinator.api_client.async_get_metering_data(
-            c_meter, "1-1:1.29.0", start_dt, end_dt
-        )
-        items = ts_data.get("items", []) if isinstance(ts_data, dict) else []
-        for item in items:
-            try:
-                kw = float(item["value"])
-                if kw > peak_power_kw:
-                    peak_power_kw = kw
-
-                started_at = item.get("startedAt")
-                item_dt = datetime.fromisoformat(started_at.replace("Z", "+00:00")) if started_at else start_dt
-                ref_power = _get_reference_power_for_dt(coordinator.hass, coordinator.entry, item_dt)
-                if ref_power is not None and kw > ref_power:
-                    exceedance_kwh += (kw - ref_power) * 0.25
-            except (ValueError, TypeError, KeyError):
-                continue
-    except Exception:
-        pass
+        schedule = get_reference_schedule(coordinator.hass, coordinator.entry)
+
+        async def _fetch(fetch_start: datetime, fetch_end: datetime) -> IntervalSeries:
+            ts_data = await coordinator.api_client.async_get_metering_data(
+                c_meter, "1-1:1.29.0", fetch_start, fetch_end
+            )
+            return series_from_items(ts_data.get("items", []) if isinstance(ts_data, dict) else [])
+
+        summaries = coordinator.hass.data.get(DOMAIN, {}).get(DATA_PEAK_SUMMARIES)
+        if summaries is not None:
+            peak_power_kw, exceedance_kwh = await summaries.async_peak_and_exceedance(
+                c_meter, schedule, start_dt, end_dt, _fetch
+            )
+        else:
+            series = await _fetch(start_dt, end_dt)
+            # Readings without a timestamp are evaluated at the start of the range
+            epoch = np.where(series.epoch >= 0, series.epoch, int(start_dt.timestamp()))
+            peak_power_kw = peak_kw(series.values)
+            exceedance_kwh = overage_kwh(series.values, schedule.lookup(epoch))
+    except Exception as exc:
+        _LOGGER.error("Error computing peak/exceedance: %s", exc)
+        if errors is not None:
+            errors.append(f"peak/exceedance: {exc}")
 
     return {
         "peak_power_kw": round(peak_power_kw, 2),
@@ -296,6 +515,7 @@ class LenedaDataView(HomeAssistantView):
     name = "api:leneda:data"
     requires_auth = True
 
+    @_compressible
     async def get(self, request: web.Request) -> web.Response:
         hass: HomeAssistant = request.app["hass"]
         range_type = request.query.get("range", "yesterday")
@@ -305,7 +525,19 @@ class LenedaDataView(HomeAssistantView):
         if not coordinator or not coordinators or not any(getattr(c, "data", None) for c in coordinators):
             return self.json({"error": "no_data"}, status_code=503)
 
-        cd = _combine_cached_data(coordinators)
+        # Cached preset ranges only change with coordinator data or config; the
+        # tag is weak because open ranges end at "now"
+        storage = hass.data.get(DOMAIN, {}).get("storage")
+        etag = None
+        if range_type in ("yesterday", "this_week", "last_week", "this_month", "last_month") and not _has_reference_power_windows(hass):
+            etag = _etag(
+                "data", range_type, dt_util.now().date().isoformat(), _data_generations(coordinators),
+                storage.config_hash if storage else None, weak=True,
+            )
+            if _etag_matches(request, etag):
+                return _not_modified(etag)
+
+        cd = _get_combined_memo(hass)["combined"]
 
         # Mapping determines which coordinator keys to use for preset ranges.
         # If a range is not in this mapping (like this_year), we skip coordinator data and fetch live.
@@ -368,7 +600,6 @@ class LenedaDataView(HomeAssistantView):
         }
 
         # Determine bounds using Home Assistant's time utilities
-        from homeassistant.util import dt as dt_util
         now = dt_util.now()
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         
@@ -429,8 +660,15 @@ class LenedaDataView(HomeAssistantView):
                 response.update(await _fetch_peak_and_exceedance(coordinator, s, e))
         elif range_type in ("this_year", "last_year"):
             # Fetch live data for yearly ranges
+            cache = _get_response_cache(hass)
+            cache_key = _response_cache_key(hass, "range", range_type, s.date().isoformat())
             try:
-                live_data = await _fetch_live_aggregated_data(hass, s, e)
+                live_data = cache.get(cache_key)
+                if live_data is None:
+                    errors: list[str] = []
+                    live_data = await _fetch_live_aggregated_data(hass, s, e, errors)
+                    if not errors:  # never keep a partial result for the whole TTL
+                        cache.set(cache_key, live_data)
                 response.update(live_data)
             except Exception as exc:
                 _LOGGER.error("Error fetching live yearly data: %s", exc)
@@ -439,7 +677,7 @@ class LenedaDataView(HomeAssistantView):
             # Fallback for unknown ranges (should not happen with standard UI)
             return self.json({"error": f"Unsupported range: {range_type}"}, status_code=400)
 
-        return self.json(response)
+        return _with_etag(request, self.json(response), etag)
 
 
 class LenedaCustomDataView(HomeAssistantView):
@@ -449,6 +687,7 @@ class LenedaCustomDataView(HomeAssistantView):
     name = "api:leneda:data:custom"
     requires_auth = True
 
+    @_compressible
     async def get(self, request: web.Request) -> web.Response:
         hass: HomeAssistant = request.app["hass"]
         start_str = request.query.get("start")
@@ -464,26 +703,37 @@ class LenedaCustomDataView(HomeAssistantView):
             return self.json({"error": "Invalid date format"}, status_code=400)
 
         coordinator = _get_preferred_coordinator(hass, "consumption") or _get_first_coordinator(hass)
-        routes = _routes_for_obis(hass, obis)
+        routes = _routes_for_obis(hass, "1-1:1.29.0")
         if not coordinator or not routes:
             return self.json({"error": "no_data"}, status_code=503)
 
+        cache = _get_response_cache(hass)
+        cache_key = _response_cache_key(hass, "custom", int(start_dt.timestamp()), int(end_dt.timestamp()))
         try:
-            live_data = await _fetch_live_aggregated_data(hass, start_dt, end_dt)
+            live_data = cache.get(cache_key)
+            if live_data is None:
+                errors: list[str] = []
+                live_data = await _fetch_live_aggregated_data(hass, start_dt, end_dt, errors)
+                if not errors:  # never keep a partial result for the whole TTL
+                    cache.set(cache_key, live_data)
             response = {
                 "start": start_str,
                 "end": end_str,
                 **live_data
             }
-            return self.json(response)
+            return _with_etag(request, self.json(response))
         except Exception as exc:
             _LOGGER.error("Error fetching custom range data: %s", exc)
             return self.json({"error": str(exc)}, status_code=500)
 
-async def _fetch_live_aggregated_data(hass: HomeAssistant, start_dt, end_dt):
-    """Fetch and sum aggregated data for any arbitrary date range."""
-    import asyncio as _aio
+async def _fetch_live_aggregated_data(hass: HomeAssistant, start_dt, end_dt, errors: list[str] | None = None):
+    """Fetch and sum aggregated data for any arbitrary date range.
 
+    Every OBIS sum and the peak/exceedance lookup are issued as one
+    concurrent batch; each API client's semaphore keeps the fan-out within
+    its request budget. Failed fetches count as 0 and are appended to
+    *errors*, so callers can avoid caching a partial result.
+    """
     # Use Month aggregation for ranges longer than 35 days to avoid Infinite issues
     agg_level = "Infinite"
     if (end_dt - start_dt).days > 35:
@@ -492,7 +742,7 @@ async def _fetch_live_aggregated_data(hass: HomeAssistant, start_dt, end_dt):
     async def _fetch_sum(routes: list[dict[str, Any]], obis: str) -> float:
         if not routes:
             return 0.0
-        results = await _aio.gather(*[
+        results = await asyncio.gather(*[
             route["api_client"].async_get_aggregated_metering_data(
                 route["meter_id"], obis, start_dt, end_dt, agg_level
             )
@@ -504,36 +754,48 @@ async def _fetch_live_aggregated_data(hass: HomeAssistant, start_dt, end_dt):
                 total += _sum_aggregated_timeseries(result)
             elif isinstance(result, Exception):
                 _LOGGER.error("Error fetching aggregated data for %s: %s", obis, result)
+                if errors is not None:
+                    errors.append(f"{obis}: {result}")
         return total
 
-    consumption_routes = _get_meter_routes(hass)["consumption"]
-    production_routes = _get_meter_routes(hass)["production"]
-    gas_routes = _get_meter_routes(hass)["gas"]
+    routes = _get_meter_routes(hass)
+    consumption_routes = routes["consumption"]
+    production_routes = routes["production"]
+    gas_routes = routes["gas"]
 
     # Shared layers (1-4)
     SHARING_LAYERS = ["1", "2", "3", "4"]
 
-    c_val = await _fetch_sum(consumption_routes, "1-1:1.29.0")
-    p_val = await _fetch_sum(production_routes, "1-1:2.29.0")
-    e_val = await _fetch_sum(production_routes, "1-65:2.29.9")
-    gas_energy = await _fetch_sum(gas_routes, "7-20:99.33.17")
-    gas_volume = await _fetch_sum(gas_routes, "7-1:99.23.15")
-
-    swm_val = 0.0
+    sums = {
+        "consumption": (consumption_routes, "1-1:1.29.0"),
+        "production": (production_routes, "1-1:2.29.0"),
+        "exported": (production_routes, "1-65:2.29.9"),
+        "gas_energy": (gas_routes, "7-20:99.33.17"),
+        "gas_volume": (gas_routes, "7-1:99.23.15"),
+    }
     for layer in SHARING_LAYERS:
-        swm_val += await _fetch_sum(consumption_routes, f"1-65:1.29.{layer}")
+        sums[f"shared_with_me_{layer}"] = (consumption_routes, f"1-65:1.29.{layer}")
+        sums[f"shared_{layer}"] = (production_routes, f"1-65:2.29.{layer}")
 
-    s_val = 0.0
-    for layer in SHARING_LAYERS:
-        s_val += await _fetch_sum(production_routes, f"1-65:2.29.{layer}")
+    peak_coordinator = _get_preferred_coordinator(hass, "consumption") or _get_first_coordinator(hass)
 
-    sc_val = max(0, p_val - e_val)
+    async def _peak_exceedance() -> dict[str, float]:
+        if not peak_coordinator:
+            return {"peak_power_kw": 0.0, "exceedance_kwh": 0.0}
+        return await _fetch_peak_and_exceedance(peak_coordinator, start_dt, end_dt, errors)
 
-    peak_coordinator = _get_preferred_coordinator(hass, "consumption") or _get_first_coordinator(hass)
-    peak_exceedance = await _fetch_peak_and_exceedance(peak_coordinator, start_dt, end_dt) if peak_coordinator else {
-        "peak_power_kw": 0.0,
-        "exceedance_kwh": 0.0,
-    }
+    *values, peak_exceedance = await asyncio.gather(
+        *[_fetch_sum(route_list, obis) for route_list, obis in sums.values()],
+        _peak_exceedance(),
+    )
+    totals = dict(zip(sums, values))
+
+    c_val = totals["consumption"]
+    p_val = totals["production"]
+    e_val = totals["exported"]
+    swm_val = sum(totals[f"shared_with_me_{layer}"] for layer in SHARING_LAYERS)
+    s_val = sum(totals[f"shared_{layer}"] for layer in SHARING_LAYERS)
+    sc_val = max(0, p_val - e_val)
 
     return {
         "consumption": round(c_val, 4),
@@ -542,12 +804,96 @@ async def _fetch_live_aggregated_data(hass: HomeAssistant, start_dt, end_dt):
         "self_consumed": round(sc_val, 4),
         "shared": round(s_val, 4),
         "shared_with_me": round(swm_val, 4),
-        "gas_energy": round(gas_energy, 4),
-        "gas_volume": round(gas_volume, 4),
+        "gas_energy": round(totals["gas_energy"], 4),
+        "gas_volume": round(totals["gas_volume"], 4),
         **peak_exceedance,
     }
 
 
+STREAM_CHUNK = timedelta(days=7)
+
+
+def _stream_windows(start_dt: datetime, end_dt: datetime, chunk: timedelta = STREAM_CHUNK):
+    """Yield consecutive ``(start, end)`` windows covering [start_dt, end_dt]."""
+    window_start = start_dt
+    while window_start <= end_dt:
+        window_end = min(window_start + chunk - timedelta(seconds=1), end_dt)
+        yield window_start, window_end
+        window_start = window_end + timedelta(seconds=1)
+
+
+async def _stream_timeseries(
+    request: web.Request, routes: list[dict[str, Any]], obis: str, start_dt: datetime, end_dt: datetime
+) -> web.StreamResponse:
+    """Write the merged timeseries as chunked JSON, one time window at a time.
+
+    Windows are fetched one ahead of the one being written, so at most two
+    windows of readings are held regardless of the range. The body has the
+    regular timeseries shape plus ``chunks`` and, when a window failed,
+    ``errors``; as the status is sent before the data, failures are only
+    reported there.
+    """
+    windows = list(_stream_windows(start_dt, end_dt))
+
+    def _fetch(window: tuple[datetime, datetime]) -> asyncio.Future:
+        return asyncio.ensure_future(asyncio.gather(*[
+            route["api_client"].async_get_metering_data(route["meter_id"], obis, *window)
+            for route in routes
+        ], return_exceptions=True))
+
+    stream = web.StreamResponse(headers={"Content-Type": "application/json"})
+    stream.enable_chunked_encoding()
+    if request.headers.get("Accept-Encoding"):
+        stream.enable_compression()
+
+    errors: list[str] = []
+    last_ts = ""
+    first_item = True
+    pending = _fetch(windows[0])
+    try:
+        for index in range(len(windows)):
+            results = await pending
+            pending = _fetch(windows[index + 1]) if index + 1 < len(windows) else None
+
+            merged: dict[str, float] = {}
+            unit, interval = None, None
+            for result in results:
+                if isinstance(result, dict):
+                    unit = unit or result.get("unit")
+                    interval = interval or result.get("intervalLength")
+                    for item in result.get("items", []):
+                        ts = item.get("startedAt", "")
+                        if ts > last_ts:  # windows may share a boundary reading
+                            merged[ts] = merged.get(ts, 0) + (item.get("value", 0) or 0)
+                elif isinstance(result, Exception):
+                    _LOGGER.error("Error streaming timeseries for %s: %s", obis, result)
+                    errors.append(f"{windows[index][0].isoformat()}: {result}")
+
+            if not stream.prepared:
+                await stream.prepare(request)
+                head = {"obis": obis, "unit": unit or "kW", "interval": interval or "PT15M"}
+                await stream.write(json.dumps(head)[:-1].encode() + b', "items": [')
+            if not merged:
+                continue
+            items = [
+                json.dumps({"value": merged[ts], "startedAt": ts, "type": "measured", "version": 1, "calculated": False})
+                for ts in sorted(merged)
+            ]
+            last_ts = max(merged)
+            await stream.write(("" if first_item else ", ").encode() + ", ".join(items).encode())
+            first_item = False
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+    tail = {"chunks": len(windows)}
+    if errors:
+        tail["errors"] = errors
+    await stream.write(b"], " + json.dumps(tail)[1:].encode())
+    await stream.write_eof()
+    return stream
+
+
 class LenedaTimeseriesView(HomeAssistantView):
     """Raw 15-min timeseries data for charts."""
 
@@ -555,6 +901,7 @@ class LenedaTimeseriesView(HomeAssistantView):
     name = "api:leneda:data:timeseries"
     requires_auth = True
 
+    @_compressible
     async def get(self, request: web.Request) -> web.Response:
         hass: HomeAssistant = request.app["hass"]
         obis = request.query.get("obis", "1-1:1.29.0")
@@ -584,6 +931,41 @@ class LenedaTimeseriesView(HomeAssistantView):
         if end_dt < start_dt:
             return self.json({"error": "Invalid date range"}, status_code=400)
 
+        try:
+            max_points, method = _parse_downsampling(request.query)
+            resolution = _parse_resolution(request.query)
+            fmt, dtype, with_flags = _parse_encoding(request.query)
+            stream = request.query.get("stream", "0").lower() in ("1", "true", "yes")
+            if stream and (max_points or resolution or fmt != "json"):
+                raise ValueError("stream cannot be combined with max_points, resolution or format")
+        except ValueError as exc:
+            return self.json({"error": str(exc)}, status_code=400)
+
+        if stream:
+            return await _stream_timeseries(request, routes, obis, start_dt, end_dt)
+
+        if resolution:
+            rollups = await _aio.gather(*[
+                _fetch_route_rollup(hass, route, obis, start_dt, end_dt, resolution) for route in routes
+            ], return_exceptions=True)
+            buckets: dict[str, float] = {}
+            unit, sources = "kWh", set()
+            for rollup in rollups:
+                if isinstance(rollup, Exception):
+                    _LOGGER.error("Error fetching %s rollup for %s: %s", resolution, obis, rollup)
+                    continue
+                unit = rollup["unit"]
+                sources.add(rollup["source"])
+                for item in rollup["items"]:
+                    buckets[item["startedAt"]] = buckets.get(item["startedAt"], 0.0) + item["value"]
+            return self.json({
+                "obis": obis,
+                "unit": unit,
+                "resolution": resolution,
+                "source": "+".join(sorted(sources)) or None,
+                "items": [{"startedAt": k, "value": round(v, 4)} for k, v in sorted(buckets.items())],
+            })
+
         try:
             all_results = await _aio.gather(*[
                 route["api_client"].async_get_metering_data(route["meter_id"], obis, start_dt, end_dt)
@@ -591,6 +973,7 @@ class LenedaTimeseriesView(HomeAssistantView):
             ], return_exceptions=True)
 
             merged: dict[str, float] = {}
+            flagged: set[str] = set()
             unit = "kW"
             interval = "PT15M"
             for result in all_results:
@@ -600,17 +983,43 @@ class LenedaTimeseriesView(HomeAssistantView):
                     for item in result.get("items", []):
                         ts = item.get("startedAt", "")
                         merged[ts] = merged.get(ts, 0) + (item.get("value", 0) or 0)
+                        if fmt != "json" and is_flagged(item):
+                            flagged.add(ts)
                 elif isinstance(result, Exception):
                     _LOGGER.error("Error fetching timeseries for %s: %s", obis, result)
 
+            if fmt != "json":
+                stamps = sorted(merged)
+                grid = to_grid(
+                    stamps, [merged[ts] for ts in stamps],
+                    round(interval_hours(interval) * 3600), [ts in flagged for ts in stamps],
+                )
+                if fmt == "binary":
+                    return web.Response(
+                        body=encode_binary(grid, dtype, with_flags),
+                        content_type=BINARY_CONTENT_TYPE,
+                        headers={"X-Leneda-Obis": obis, "X-Leneda-Unit": unit},
+                    )
+                return self.json({
+                    "obis": obis,
+                    "unit": unit,
+                    "interval": interval,
+                    "format": fmt,
+                    **encode_columnar(grid, with_flags),
+                })
+
             items = [{"value": v, "startedAt": k, "type": "measured", "version": 1, "calculated": False}
                      for k, v in sorted(merged.items())]
-            return self.json({
+            items, downsampled = downsample_items(items, max_points, method)
+            response = {
                 "obis": obis,
                 "unit": unit,
                 "interval": interval,
                 "items": items,
-            })
+            }
+            if downsampled:
+                response["downsampled"] = downsampled
+            return self.json(response)
         except Exception as e:
             _LOGGER.error("Error fetching timeseries: %s", e)
             return self.json({"error": str(e)}, status_code=500)
@@ -623,6 +1032,7 @@ class LenedaPerMeterTimeseriesView(HomeAssistantView):
     name = "api:leneda:data:timeseries:per_meter"
     requires_auth = True
 
+    @_compressible
     async def get(self, request: web.Request) -> web.Response:
         hass: HomeAssistant = request.app["hass"]
         obis = request.query.get("obis", "1-1:2.29.0")
@@ -648,6 +1058,25 @@ class LenedaPerMeterTimeseriesView(HomeAssistantView):
             start_dt = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
             end_dt = start_dt.replace(hour=23, minute=59, second=59)
 
+        try:
+            max_points, method = _parse_downsampling(request.query)
+            resolution = _parse_resolution(request.query)
+            fmt, _dtype, with_flags = _parse_encoding(request.query, allow_binary=False)
+        except ValueError as exc:
+            return self.json({"error": str(exc)}, status_code=400)
+
+        if resolution:
+            rollups = await _aio.gather(*[
+                _fetch_route_rollup(hass, route, obis, start_dt, end_dt, resolution) for route in routes
+            ], return_exceptions=True)
+            meters_data = []
+            for route, rollup in zip(routes, rollups):
+                if isinstance(rollup, Exception):
+                    _LOGGER.error("Error fetching %s rollup for %s: %s", resolution, route["meter_id"], rollup)
+                    rollup = {"unit": "kWh", "source": None, "items": []}
+                meters_data.append({"meter_id": route["meter_id"], "resolution": resolution, **rollup})
+            return self.json({"obis": obis, "resolution": resolution, "meters": meters_data})
+
         try:
             all_results = await _aio.gather(*[
                 route["api_client"].async_get_metering_data(route["meter_id"], obis, start_dt, end_dt)
@@ -657,13 +1086,27 @@ class LenedaPerMeterTimeseriesView(HomeAssistantView):
             meters_data = []
             for route, result in zip(routes, all_results):
                 mid = route["meter_id"]
-                if isinstance(result, dict):
+                if isinstance(result, dict) and fmt == "columnar":
+                    interval = result.get("intervalLength", "PT15M")
+                    grid = grid_from_items(result.get("items", []), round(interval_hours(interval) * 3600))
                     meters_data.append({
                         "meter_id": mid,
                         "unit": result.get("unit", "kW"),
-                        "interval": result.get("intervalLength", "PT15M"),
-                        "items": result.get("items", []),
+                        "interval": interval,
+                        "format": fmt,
+                        **encode_columnar(grid, with_flags),
                     })
+                elif isinstance(result, dict):
+                    items, downsampled = downsample_items(result.get("items", []), max_points, method)
+                    meter_data = {
+                        "meter_id": mid,
+                        "unit": result.get("unit", "kW"),
+                        "interval": result.get("intervalLength", "PT15M"),
+                        "items": items,
+                    }
+                    if downsampled:
+                        meter_data["downsampled"] = downsampled
+                    meters_data.append(meter_data)
                 elif isinstance(result, Exception):
                     _LOGGER.error("Error fetching per-meter timeseries for %s: %s", mid, result)
                     meters_data.append({"meter_id": mid, "unit": "kW", "interval": "PT15M", "items": []})
@@ -674,6 +1117,619 @@ class LenedaPerMeterTimeseriesView(HomeAssistantView):
             return self.json({"error": str(e)}, status_code=500)
 
 
+MAX_FRAME_COLUMNS = 16
+
+
+class LenedaFrameView(HomeAssistantView):
+    """Several OBIS series aligned on one time axis, with derived columns.
+
+    ``obis`` is a comma-separated list of codes and ``derived`` an optional
+    list of ``net_grid_draw`` / ``self_consumption``. Every (meter, OBIS)
+    series needed by the columns is fetched once, all concurrently.
+    """
+
+    url = "/leneda_api/data/frame"
+    name = "api:leneda:data:frame"
+    requires_auth = True
+
+    @_compressible
+    async def get(self, request: web.Request) -> web.Response:
+        hass: HomeAssistant = request.app["hass"]
+        parsed = _parse_iso_range(request.query.get("start"), request.query.get("end"))
+        if parsed is None:
+            return self.json({"error": "Missing or invalid start/end"}, status_code=400)
+        obis_codes = [c.strip() for c in request.query.get("obis", "1-1:1.29.0").split(",") if c.strip()]
+        derived = [d.strip() for d in request.query.get("derived", "").split(",") if d.strip()]
+        unknown = [c for c in obis_codes if c not in OBIS_CODES] + [d for d in derived if d not in DERIVED]
+        if unknown:
+            return self.json({"error": f"Unknown columns: {', '.join(unknown)}"}, status_code=400)
+        if not 0 < len(obis_codes) + len(derived) <= MAX_FRAME_COLUMNS:
+            return self.json({"error": f"Request 1-{MAX_FRAME_COLUMNS} columns"}, status_code=400)
+
+        start_dt, end_dt = parsed
+        needed = required_obis(obis_codes, derived)
+        fetches: dict[tuple[str, str], dict[str, Any]] = {}
+        for obis in needed:
+            for route in _routes_for_obis(hass, obis):
+                fetches.setdefault((route["meter_id"], obis), route)
+        if not fetches:
+            return self.json({"error": "no_data"}, status_code=503)
+
+        results = await asyncio.gather(*[
+            route["api_client"].async_get_metering_data(meter_id, obis, start_dt, end_dt)
+            for (meter_id, obis), route in fetches.items()
+        ], return_exceptions=True)
+
+        parts: dict[str, list[IntervalSeries]] = {obis: [] for obis in needed}
+        errors = []
+        interval = "PT15M"
+        for (meter_id, obis), result in zip(fetches, results):
+            if isinstance(result, dict):
+                interval = result.get("intervalLength") or interval
+                parts[obis].append(series_from_items(result.get("items", [])))
+            elif isinstance(result, Exception):
+                _LOGGER.error("Error fetching %s for %s: %s", obis, meter_id, result)
+                errors.append(f"{meter_id} {obis}: {result}")
+
+        axis, columns = align_frame({obis: merge_series(series) for obis, series in parts.items()})
+        columns = add_derived(columns, derived)
+        stamps = np.datetime_as_string(axis.astype("datetime64[s]"), unit="s")
+        response = {
+            "start": start_dt.isoformat(),
+            "end": end_dt.isoformat(),
+            "interval": interval,
+            "timestamps": [f"{stamp}Z" for stamp in stamps.tolist()],
+            "columns": {
+                name: [None if np.isnan(v) else v for v in np.round(columns[name], 4).tolist()]
+                for name in [*obis_codes, *derived]
+            },
+            "units": {
+                **{obis: OBIS_CODES[obis].get("unit") for obis in obis_codes},
+                **{name: "kW" for name in derived},
+            },
+        }
+        if errors:
+            response["errors"] = errors
+        return self.json(response)
+
+
+class LenedaCostView(HomeAssistantView):
+    """Time-of-use priced consumption for a period (per-window kWh and cost)."""
+
+    url = "/leneda_api/costs"
+    name = "api:leneda:costs"
+    requires_auth = True
+
+    @_compressible
+    async def get(self, request: web.Request) -> web.Response:
+        hass: HomeAssistant = request.app["hass"]
+        storage = hass.data.get(DOMAIN, {}).get("storage")
+        parsed = _parse_iso_range(request.query.get("start"), request.query.get("end"))
+        if parsed is None:
+            return self.json({"error": "Missing or invalid start/end"}, status_code=400)
+        if not storage or not _routes_for_obis(hass, "1-1:1.29.0"):
+            return self.json({"error": "no_data"}, status_code=503)
+
+        start_dt, end_dt = parsed
+        try:
+            series = await _fetch_merged_series(hass, "1-1:1.29.0", start_dt, end_dt)
+            result = price_consumption(storage.billing_config, series)
+        except Exception as exc:
+            _LOGGER.error("Error computing time-of-use costs: %s", exc)
+            return self.json({"error": str(exc)}, status_code=500)
+
+        return self.json({
+            "start": start_dt.isoformat(),
+            "end": end_dt.isoformat(),
+            "currency": storage.billing_config.currency,
+            "intervals": len(series),
+            **result,
+        })
+
+
+MAX_INVOICE_MONTHS = 24
+
+
+def _feed_in_sensor_values(hass: HomeAssistant, config: BillingConfig) -> dict[str, float | None]:
+    """Resolve the current state of every feed-in rate sensor."""
+    values: dict[str, float | None] = {}
+    for rate_entry in config.feed_in_rates or []:
+        if not isinstance(rate_entry, dict) or rate_entry.get("mode") != "sensor":
+            continue
+        entity_id = rate_entry.get("sensor_entity", "")
+        if not entity_id:
+            continue
+        state = hass.states.get(entity_id)
+        try:
+            values[entity_id] = float(state.state) if state else None
+        except (ValueError, TypeError):
+            values[entity_id] = None
+    return values
+
+
+def _feed_in_price_source(config: BillingConfig, meter_id: str) -> tuple[str, float]:
+    """Return (price entity or "", fallback tariff) for a production meter."""
+    rate = next(
+        (r for r in config.feed_in_rates or [] if isinstance(r, dict) and r.get("meter_id") == meter_id), {}
+    )
+    entity_id = rate.get("sensor_entity", "") if rate.get("mode") == "sensor" else ""
+    try:
+        fallback = float(rate.get("tariff", config.feed_in_tariff))
+    except (TypeError, ValueError):
+        fallback = float(config.feed_in_tariff)
+    return entity_id, fallback
+
+
+async def _no_price_steps() -> tuple[np.ndarray, np.ndarray]:
+    """Empty price history (fixed-rate meters)."""
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+
+async def _async_feed_in_days(
+    hass: HomeAssistant,
+    route: dict[str, Any],
+    config: BillingConfig,
+    days: list[date],
+    now: datetime,
+    errors: list[str],
+) -> tuple[dict[date, tuple[float, float]], int]:
+    """Return ``{day: (exported kWh, revenue)}`` for one production meter.
+
+    Exports are valued at the price in force at export time (recorder
+    history for sensor-mode rates). Closed days come from the per-day cache;
+    on a fetch failure the error is appended to *errors* and only cached
+    days are returned. Also returns the number of cached days used.
+    """
+    meter_id = route["meter_id"]
+    entity_id, fallback = _feed_in_price_source(config, meter_id)
+    source = f"{entity_id}|{fallback}"
+    cache: FeedInRevenueCache = hass.data[DOMAIN].setdefault(DATA_FEED_IN_CACHE, FeedInRevenueCache())
+
+    totals = {day: cache.get(meter_id, source, day) for day in days}
+    missing = cache.missing_days(meter_id, source, days)
+    if missing:
+        start_dt = day_start(missing[0])
+        end_dt = min(now, day_start(missing[-1] + timedelta(days=1)) - timedelta(seconds=1))
+        export_result, steps = await asyncio.gather(
+            route["api_client"].async_get_metering_data(meter_id, "1-65:2.29.9", start_dt, end_dt),
+            async_load_price_steps(hass, entity_id, start_dt, end_dt) if entity_id
+            else _no_price_steps(),
+            return_exceptions=True,
+        )
+        failure = next((r for r in (export_result, steps) if isinstance(r, Exception)), None)
+        if failure is not None:
+            # Serve what is cached; nothing is stored for a failed fetch
+            _LOGGER.error("Error fetching feed-in revenue data for %s: %s", meter_id, failure)
+            errors.append(f"{meter_id}: {failure}")
+        else:
+            items = export_result.get("items", []) if isinstance(export_result, dict) else []
+            fetched = daily_revenue(series_from_items(items), steps, fallback)
+            cache.store(meter_id, source, fetched, now.date())
+            totals.update({day: fetched.get(day, (0.0, 0.0)) for day in missing})
+    return {day: value for day, value in totals.items() if value is not None}, len(days) - len(missing)
+
+
+def _month_bounds(year: int, month: int, now: datetime) -> tuple[datetime, datetime, float, bool]:
+    """Return (start, end, proration, closed) for a calendar month in local time.
+
+    A past month only counts as closed once Leneda's revision window
+    (``SUMMARY_REVISION_DAYS``) after its last day has passed.
+    """
+    start = now.replace(year=year, month=month, day=1, hour=0, minute=0, second=0, microsecond=0)
+    next_month = (start + timedelta(days=32)).replace(day=1)
+    if next_month <= now:
+        closed = now >= next_month + timedelta(days=SUMMARY_REVISION_DAYS)
+        return start, next_month - timedelta(seconds=1), 1.0, closed
+    days_in_month = calendar.monthrange(year, month)[1]
+    return start, now, now.day / days_in_month, False
+
+
+class LenedaInvoiceView(HomeAssistantView):
+    """Full bill breakdown for one month, or a batch of past months.
+
+    Closed months are memoized under the billing-config hash, the meter set
+    and the feed-in price sources, so reloading a long history only fetches
+    the current month. Any config change yields a new hash and a fresh bill.
+    With sensor-priced feed-in rates, each month's export is valued at the
+    prices recorded during that month rather than the current price.
+    """
+
+    url = "/leneda_api/invoice"
+    name = "api:leneda:invoice"
+    requires_auth = True
+
+    @_compressible
+    async def get(self, request: web.Request) -> web.Response:
+        hass: HomeAssistant = request.app["hass"]
+        storage = hass.data.get(DOMAIN, {}).get("storage")
+        if not storage or not _get_coordinators(hass):
+            return self.json({"error": "no_data"}, status_code=503)
+
+        now = dt_util.now()
+        try:
+            month_str = request.query.get("month") or now.strftime("%Y-%m")
+            year, month = (int(part) for part in month_str.split("-", 1))
+            count = int(request.query.get("months", 1))
+            if not 1 <= month <= 12 or not 1 <= count <= MAX_INVOICE_MONTHS:
+                raise ValueError
+            if (year, month) > (now.year, now.month):
+                raise ValueError
+        except ValueError:
+            return self.json({"error": "Invalid month/months"}, status_code=400)
+
+        periods = []
+        for _ in range(count):
+            periods.append((year, month))
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+
+        config = storage.billing_config
+        production_routes = _get_meter_routes(hass)["production"]
+        production_ids = [route["meter_id"] for route in production_routes]
+        meter_ids = sorted(route["meter_id"] for routes in _get_meter_routes(hass).values() for route in routes)
+        price_sources = tuple(_feed_in_price_source(config, meter_id) for meter_id in production_ids)
+        history_priced = any(entity_id for entity_id, _fallback in price_sources)
+        # Fixed tariffs only; sensor-priced months use their recorded prices below
+        feed_in_rate = average_feed_in_rate(config, production_ids, {})
+        coordinator = _get_preferred_coordinator(hass, "consumption")
+        reference_kw = get_effective_reference_power(hass, getattr(coordinator, "entry", None))
+        cache: dict[tuple, dict[str, Any]] = hass.data[DOMAIN].setdefault(DATA_INVOICE_CACHE, {})
+        cache_key = (storage.config_hash, tuple(meter_ids), price_sources, reference_kw)
+        # Bills computed under a previous config can never be served again
+        for stale in [key for key in cache if key[1:] != cache_key]:
+            del cache[stale]
+
+        async def _invoice_for(period: tuple[int, int]) -> dict[str, Any]:
+            start_dt, end_dt, proration, closed = _month_bounds(*period, now)
+            key = (period, *cache_key)
+            if closed and key in cache:
+                return cache[key]
+            errors: list[str] = []
+
+            async def _recorded_feed_in_rate() -> float:
+                days = [day for day in local_days(start_dt, end_dt) if day <= now.date()]
+                per_meter = await asyncio.gather(*[
+                    _async_feed_in_days(hass, route, config, days, now, errors) for route in production_routes
+                ])
+                kwh = sum(kwh for totals, _cached in per_meter for kwh, _revenue in totals.values())
+                revenue = sum(revenue for totals, _cached in per_meter for _kwh, revenue in totals.values())
+                return revenue / kwh if kwh > 0 else feed_in_rate
+
+            if history_priced:
+                usage, month_feed_in_rate = await asyncio.gather(
+                    _fetch_live_aggregated_data(hass, start_dt, end_dt, errors), _recorded_feed_in_rate()
+                )
+            else:
+                usage = await _fetch_live_aggregated_data(hass, start_dt, end_dt, errors)
+                month_feed_in_rate = feed_in_rate
+            priced = None
+            if config.consumption_rate_windows:
+                series = await _fetch_merged_series(hass, "1-1:1.29.0", start_dt, end_dt, errors)
+                priced = price_consumption(config, series)
+            invoice = {
+                "month": f"{period[0]:04d}-{period[1]:02d}",
+                "start": start_dt.isoformat(),
+                "end": end_dt.isoformat(),
+                "closed": closed,
+                "usage": usage,
+                **compute_invoice(config, usage, proration, month_feed_in_rate, priced),
+            }
+            if errors:
+                invoice["errors"] = errors
+            elif closed:
+                cache[key] = invoice
+            return invoice
+
+        hits = sum(1 for period in periods if (period, *cache_key) in cache)
+        try:
+            invoices = await asyncio.gather(*[_invoice_for(p) for p in periods])
+        except Exception as exc:
+            _LOGGER.error("Error computing invoice: %s", exc)
+            return self.json({"error": str(exc)}, status_code=500)
+
+        _LOGGER.debug("Invoice request for %d month(s): %d served from cache", len(periods), hits)
+        return self.json({
+            "currency": config.currency,
+            "invoices": list(invoices),
+        })
+
+
+class LenedaReferencePowerOptimizeView(HomeAssistantView):
+    """Cost curve of candidate reference powers over a period's net grid draw.
+
+    Defaults to the last 365 days. ``capacity_rate`` is the charge per kW and
+    month; without it the configured power-reference fee is spread over the
+    current reference power.
+    """
+
+    url = "/leneda_api/reference-power/optimize"
+    name = "api:leneda:reference-power:optimize"
+    requires_auth = True
+
+    @_compressible
+    async def get(self, request: web.Request) -> web.Response:
+        hass: HomeAssistant = request.app["hass"]
+        storage = hass.data.get(DOMAIN, {}).get("storage")
+        coordinator = _get_preferred_coordinator(hass, "consumption")
+        if not storage or not coordinator or not _routes_for_obis(hass, "1-1:1.29.0"):
+            return self.json({"error": "no_data"}, status_code=503)
+
+        if request.query.get("start") or request.query.get("end"):
+            parsed = _parse_iso_range(request.query.get("start"), request.query.get("end"))
+            if parsed is None:
+                return self.json({"error": "Invalid start/end"}, status_code=400)
+            start_dt, end_dt = parsed
+        else:
+            end_dt = dt_util.now()
+            start_dt = end_dt - timedelta(days=365)
+
+        config = storage.billing_config
+        schedule = get_reference_schedule(hass, coordinator.entry)
+        try:
+            step_kw = float(request.query.get("step", 0.1))
+            if "capacity_rate" in request.query:
+                capacity_rate = float(request.query["capacity_rate"])
+            else:
+                capacity_rate = config.network_power_ref_rate / schedule.base_kw if schedule.base_kw else 0.0
+            if step_kw <= 0 or capacity_rate < 0:
+                raise ValueError
+        except ValueError:
+            return self.json({"error": "Invalid step/capacity_rate"}, status_code=400)
+
+        try:
+            consumption, production = await asyncio.gather(
+                _fetch_merged_series(hass, "1-1:1.29.0", start_dt, end_dt),
+                _fetch_merged_series(hass, "1-1:2.29.0", start_dt, end_dt),
+            )
+            net_draw = IntervalSeries(consumption.epoch, net_grid_draw(consumption, production))
+            result = await hass.async_add_executor_job(
+                optimize_reference_power,
+                net_draw,
+                schedule,
+                capacity_rate,
+                config.exceedance_rate,
+                step_kw,
+                dt_util.DEFAULT_TIME_ZONE,
+            )
+        except Exception as exc:
+            _LOGGER.error("Error optimizing reference power: %s", exc)
+            return self.json({"error": str(exc)}, status_code=500)
+
+        return self.json({
+            "start": start_dt.isoformat(),
+            "end": end_dt.isoformat(),
+            "currency": config.currency,
+            "capacity_rate": round(capacity_rate, 4),
+            "exceedance_rate": config.exceedance_rate,
+            **result,
+        })
+
+
+MAX_TARIFF_SCENARIOS = 20
+
+
+class LenedaTariffCompareView(HomeAssistantView):
+    """Rank the current billing config against alternative tariffs.
+
+    Each scenario's ``config`` holds ``BillingConfig`` overrides on top of the
+    current config. All scenarios are evaluated on the same fetched 15-min
+    data (last 365 days unless ``start``/``end`` are given).
+    """
+
+    url = "/leneda_api/tariffs/compare"
+    name = "api:leneda:tariffs:compare"
+    requires_auth = True
+
+    @_compressible
+    async def post(self, request: web.Request) -> web.Response:
+        hass: HomeAssistant = request.app["hass"]
+        storage = hass.data.get(DOMAIN, {}).get("storage")
+        coordinator = _get_preferred_coordinator(hass, "consumption")
+        if not storage or not coordinator or not _routes_for_obis(hass, "1-1:1.29.0"):
+            return self.json({"error": "no_data"}, status_code=503)
+
+        try:
+            body = await request.json()
+            if not isinstance(body, dict):
+                raise ValueError("body must be a JSON object")
+            raw_scenarios = body.get("scenarios") or []
+            if not isinstance(raw_scenarios, list) or len(raw_scenarios) > MAX_TARIFF_SCENARIOS:
+                raise ValueError(f"scenarios must be a list of at most {MAX_TARIFF_SCENARIOS}")
+        except ValueError as exc:
+            return self.json({"error": str(exc)}, status_code=400)
+
+        if body.get("start") or body.get("end"):
+            parsed = _parse_iso_range(body.get("start"), body.get("end"))
+            if parsed is None:
+                return self.json({"error": "Invalid start/end"}, status_code=400)
+            start_dt, end_dt = parsed
+        else:
+            end_dt = dt_util.now()
+            start_dt = end_dt - timedelta(days=365)
+
+        current = storage.billing_config
+        current_dict = current.to_dict()
+        production_ids = [route["meter_id"] for route in _get_meter_routes(hass)["production"]]
+        current_reference = get_effective_reference_power(hass, coordinator.entry)
+
+        def _scenario(name: str, config: BillingConfig, overrides: dict[str, Any]) -> TariffScenario:
+            reference_kw = float(overrides["reference_power_kw"]) if "reference_power_kw" in overrides else current_reference
+            feed_in = average_feed_in_rate(config, production_ids, _feed_in_sensor_values(hass, config))
+            return TariffScenario(name, config, reference_kw, feed_in)
+
+        scenarios = [_scenario("Current tariff", current, {})]
+        try:
+            for index, raw in enumerate(raw_scenarios):
+                overrides = raw.get("config") or {}
+                if not isinstance(overrides, dict):
+                    raise ValueError(f"scenario {index + 1}: config must be an object")
+                config = BillingConfig.from_dict({**current_dict, **overrides})
+                scenarios.append(_scenario(str(raw.get("name") or f"Scenario {index + 1}"), config, overrides))
+        except (AttributeError, TypeError, ValueError) as exc:
+            return self.json({"error": str(exc)}, status_code=400)
+
+        try:
+            consumption, production, exported = await asyncio.gather(
+                _fetch_merged_series(hass, "1-1:1.29.0", start_dt, end_dt),
+                _fetch_merged_series(hass, "1-1:2.29.0", start_dt, end_dt),
+                _fetch_merged_series(hass, "1-65:2.29.9", start_dt, end_dt),
+            )
+            produced_kwh = float(production.values.sum()) * INTERVAL_HOURS
+            exported_kwh = float(exported.values.sum()) * INTERVAL_HOURS
+            totals = {"exported": exported_kwh, "self_consumed": max(0.0, produced_kwh - exported_kwh)}
+            months = (end_dt - start_dt).total_seconds() / (365.25 / 12 * 86400)
+            results = await hass.async_add_executor_job(
+                compare_tariffs,
+                scenarios,
+                consumption,
+                consumption.values,  # metered draw, as the invoice's exceedance uses
+                totals,
+                months,
+                dt_util.DEFAULT_TIME_ZONE,
+            )
+        except Exception as exc:
+            _LOGGER.error("Error comparing tariffs: %s", exc)
+            return self.json({"error": str(exc)}, status_code=500)
+
+        return self.json({
+            "start": start_dt.isoformat(),
+            "end": end_dt.isoformat(),
+            "currency": current.currency,
+            "months": round(months, 3),
+            "intervals": len(consumption),
+            "scenarios": results,
+        })
+
+
+class LenedaFeedInRevenueView(HomeAssistantView):
+    """Feed-in revenue per production meter, valued at the price at export time.
+
+    Sensor-mode rates use the price entity's recorder history; fixed rates
+    use their tariff. The range is widened to whole local days so closed
+    days can be served from the per-day cache.
+    """
+
+    url = "/leneda_api/feed-in/revenue"
+    name = "api:leneda:feed-in:revenue"
+    requires_auth = True
+
+    @_compressible
+    async def get(self, request: web.Request) -> web.Response:
+        hass: HomeAssistant = request.app["hass"]
+        storage = hass.data.get(DOMAIN, {}).get("storage")
+        parsed = _parse_iso_range(request.query.get("start"), request.query.get("end"))
+        if parsed is None:
+            return self.json({"error": "Missing or invalid start/end"}, status_code=400)
+        routes = _get_meter_routes(hass)["production"]
+        if not storage or not routes:
+            return self.json({"error": "no_data"}, status_code=503)
+
+        now = dt_util.now()
+        today = now.date()
+        days = [day for day in local_days(*parsed) if day <= today]
+        if not days:
+            return self.json({"error": "Range is in the future"}, status_code=400)
+
+        config = storage.billing_config
+        errors: list[str] = []
+
+        async def _meter_revenue(route: dict[str, Any]) -> dict[str, Any]:
+            entity_id, fallback = _feed_in_price_source(config, route["meter_id"])
+            totals, cached_days = await _async_feed_in_days(hass, route, config, days, now, errors)
+            return {
+                "meter_id": route["meter_id"],
+                "mode": "sensor" if entity_id else "fixed",
+                "sensor_entity": entity_id or None,
+                "fallback_rate": fallback,
+                "cached_days": cached_days,
+                **summarize(days, totals),
+            }
+
+        try:
+            meters = await asyncio.gather(*[_meter_revenue(route) for route in routes])
+        except Exception as exc:
+            _LOGGER.error("Error computing feed-in revenue: %s", exc)
+            return self.json({"error": str(exc)}, status_code=500)
+
+        return self.json({
+            "start": day_start(days[0]).isoformat(),
+            "end": min(now, day_start(days[-1] + timedelta(days=1))).isoformat(),
+            "currency": config.currency,
+            "exported_kwh": round(sum(m["exported_kwh"] for m in meters), 4),
+            "revenue": round(sum(m["revenue"] for m in meters), 4),
+            "meters": list(meters),
+            **({"errors": errors} if errors else {}),
+        })
+
+
+class LenedaBatterySimulationView(HomeAssistantView):
+    """Simulate a home battery over the last year (or ``start``/``end``).
+
+    Returns grid import/export, peak, exceedance and bill with and without
+    the battery, using the active reference schedule and billing config.
+    """
+
+    url = "/leneda_api/battery/simulate"
+    name = "api:leneda:battery:simulate"
+    requires_auth = True
+
+    @_compressible
+    async def get(self, request: web.Request) -> web.Response:
+        hass: HomeAssistant = request.app["hass"]
+        storage = hass.data.get(DOMAIN, {}).get("storage")
+        coordinator = _get_preferred_coordinator(hass, "consumption")
+        if not storage or not coordinator or not _routes_for_obis(hass, "1-1:1.29.0"):
+            return self.json({"error": "no_data"}, status_code=503)
+
+        try:
+            model = BatteryModel.from_dict(dict(request.query))
+        except (KeyError, TypeError, ValueError) as exc:
+            return self.json({"error": f"Invalid battery parameters: {exc}"}, status_code=400)
+
+        if request.query.get("start") or request.query.get("end"):
+            parsed = _parse_iso_range(request.query.get("start"), request.query.get("end"))
+            if parsed is None:
+                return self.json({"error": "Invalid start/end"}, status_code=400)
+            start_dt, end_dt = parsed
+        else:
+            end_dt = dt_util.now()
+            start_dt = end_dt - timedelta(days=365)
+
+        config = storage.billing_config
+        production_ids = [route["meter_id"] for route in _get_meter_routes(hass)["production"]]
+        feed_in_rate = average_feed_in_rate(config, production_ids, _feed_in_sensor_values(hass, config))
+        schedule = get_reference_schedule(hass, coordinator.entry)
+        months = (end_dt - start_dt).total_seconds() / (365.25 / 12 * 86400)
+
+        try:
+            consumption, production = await asyncio.gather(
+                _fetch_merged_series(hass, "1-1:1.29.0", start_dt, end_dt),
+                _fetch_merged_series(hass, "1-1:2.29.0", start_dt, end_dt),
+            )
+            epoch = np.where(consumption.epoch >= 0, consumption.epoch, int(start_dt.timestamp()))
+            result = await hass.async_add_executor_job(
+                simulate_battery,
+                model,
+                config,
+                consumption,
+                production,
+                schedule.lookup(epoch),
+                months,
+                feed_in_rate,
+                dt_util.DEFAULT_TIME_ZONE,
+            )
+        except Exception as exc:
+            _LOGGER.error("Error simulating battery: %s", exc)
+            return self.json({"error": str(exc)}, status_code=500)
+
+        return self.json({
+            "start": start_dt.isoformat(),
+            "end": end_dt.isoformat(),
+            "currency": config.currency,
+            "intervals": len(consumption),
+            **result,
+        })
+
+
 # ─── Sensor overview ─────────────────────────────────────────────
 
 class LenedaSensorsView(HomeAssistantView):
@@ -683,6 +1739,7 @@ class LenedaSensorsView(HomeAssistantView):
     name = "api:leneda:sensors"
     requires_auth = True
 
+    @_compressible
     async def get(self, request: web.Request) -> web.Response:
         hass: HomeAssistant = request.app["hass"]
         coordinator = _get_preferred_coordinator(hass, "consumption") or _get_first_coordinator(hass)
@@ -691,24 +1748,15 @@ class LenedaSensorsView(HomeAssistantView):
         if not coordinator or not coordinators or not any(getattr(c, "data", None) for c in coordinators):
             return self.json({"sensors": []})
 
-        data = _combine_cached_data(coordinators)
-        sensors = []
-        for key, value in data.items():
-            if key.endswith("_peak_timestamp"):
-                continue
-            meta = OBIS_CODES.get(key, {})
-            sensors.append({
-                "key": key,
-                "value": value,
-                "name": meta.get("name", key),
-                "unit": meta.get("unit", "kWh"),
-                "peak_timestamp": data.get(f"{key}_peak_timestamp"),
-            })
+        metering_point = coordinator.metering_point_id if len(coordinators) == 1 else "multiple"
+        etag = _etag("sensors", _data_generations(coordinators), metering_point)
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
 
-        return self.json({
-            "sensors": sensors,
-            "metering_point": coordinator.metering_point_id if len(coordinators) == 1 else "multiple",
-        })
+        return _with_etag(request, self.json({
+            "sensors": _get_sensor_list(hass),
+            "metering_point": metering_point,
+        }), etag)
 
 
 # ─── Config endpoints ────────────────────────────────────────────
@@ -720,17 +1768,39 @@ class LenedaConfigView(HomeAssistantView):
     name = "api:leneda:config"
     requires_auth = True
 
+    @_compressible
     async def get(self, request: web.Request) -> web.Response:
         hass: HomeAssistant = request.app["hass"]
         storage = hass.data.get(DOMAIN, {}).get("storage")
         if not storage:
             return self.json({})
 
+        # Everything the payload derives from: stored config, entry meters,
+        # effective reference power and live feed-in sensor values. Entry
+        # data is reduced to meters and the gas flag so no credential is hashed.
+        entries = hass.config_entries.async_entries(DOMAIN)
+        etag = _etag(
+            "config",
+            storage.config_hash,
+            tuple(
+                (
+                    e.entry_id,
+                    tuple((m["id"], tuple(m.get("types", []))) for m in _iter_entry_meters(e)),
+                    bool(e.data.get(CONF_METER_HAS_GAS, False)),
+                    sorted((e.options or {}).items()),
+                )
+                for e in entries
+            ),
+            get_effective_reference_power(hass, entries[0] if entries else None),
+            sorted(_feed_in_sensor_values(hass, storage.billing_config).items()),
+        )
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+
         config_dict = storage.billing_config.to_dict()
         entry = None
 
         # Merge HA entry credentials (read-only) so the dashboard knows the meter config
-        entries = hass.config_entries.async_entries(DOMAIN)
         if entries:
             entry = entries[0]
             meters: list[dict[str, Any]] = []
@@ -776,7 +1846,7 @@ class LenedaConfigView(HomeAssistantView):
                         rate_entry["sensor_value"] = None
             config_dict["feed_in_rates"] = feed_in_rates
 
-        return self.json(config_dict)
+        return _with_etag(request, self.json(config_dict), etag)
 
     async def post(self, request: web.Request) -> web.Response:
         hass: HomeAssistant = request.app["hass"]
@@ -789,6 +1859,7 @@ class LenedaConfigView(HomeAssistantView):
             config = BillingConfig.from_dict(data)
             storage.billing_config = config
             await storage.async_save()
+            _recompute_coordinators(hass)
             return self.json({"status": "ok"})
         except Exception as e:
             _LOGGER.error("Error updating config: %s", e)
@@ -810,6 +1881,7 @@ class LenedaConfigResetView(HomeAssistantView):
 
         storage.billing_config = BillingConfig()
         await storage.async_save()
+        _recompute_coordinators(hass)
         return self.json({"status": "ok"})
 
 
@@ -843,6 +1915,134 @@ class LenedaHAEntitiesView(HomeAssistantView):
         return self.json({"entities": entities})
 
 
+# ─── Diagnostics ─────────────────────────────────────────────────
+
+class LenedaTimingsView(HomeAssistantView):
+    """Recent coordinator refresh timelines (phase durations and call counts)."""
+
+    url = "/leneda_api/diagnostics/timings"
+    name = "api:leneda:diagnostics:timings"
+    requires_auth = True
+
+    async def get(self, request: web.Request) -> web.Response:
+        hass: HomeAssistant = request.app["hass"]
+        return self.json({
+            "coordinators": [
+                {
+                    "metering_point": coordinator.metering_point_id,
+                    "timelines": list(getattr(coordinator, "timelines", [])),
+                }
+                for coordinator in _get_coordinators(hass)
+            ],
+            "response_cache": _get_response_cache(hass).stats(),
+            "compression": _get_compression_stats(hass).as_dict(),
+        })
+
+
+# ─── Batch endpoint ──────────────────────────────────────────────
+
+MAX_BATCH_QUERIES = 20
+# Each invoice month costs ~15 upstream calls, so invoices share one budget per batch
+MAX_BATCH_INVOICE_MONTHS = MAX_INVOICE_MONTHS
+
+
+class _BatchSubRequest:
+    """Minimal request stand-in used to run a read-only view inside a batch."""
+
+    def __init__(self, request: web.Request, params: dict[str, Any]) -> None:
+        self.app = request.app
+        self.headers: dict[str, str] = {}  # parts are never conditional
+        self.query = {str(key): str(value) for key, value in params.items()}
+
+
+class LenedaBatchView(HomeAssistantView):
+    """Run several read-only dashboard queries concurrently in one round trip.
+
+    Each query is ``{"id", "type", "params"}`` where ``type`` names one of the
+    GET endpoints in ``BATCH_QUERY_VIEWS`` and ``params`` are its query
+    parameters. Parts are returned as ``{"id", "type", "status", "body"}``;
+    sub-responses are embedded as already-encoded JSON rather than decoded
+    and re-serialized. With ``"stream": true`` the parts are written as
+    newline-delimited JSON in completion order.
+    """
+
+    url = "/leneda_api/batch"
+    name = "api:leneda:batch"
+    requires_auth = True
+
+    @_compressible
+    async def post(self, request: web.Request) -> web.StreamResponse:
+        try:
+            body = await request.json()
+            queries = body.get("queries") or []
+            if not isinstance(queries, list) or not 0 < len(queries) <= MAX_BATCH_QUERIES:
+                raise ValueError(f"queries must be a list of 1-{MAX_BATCH_QUERIES} items")
+            parts = []
+            invoice_months = 0
+            for index, query in enumerate(queries):
+                query_type = query.get("type")
+                if query_type not in BATCH_QUERY_VIEWS:
+                    raise ValueError(f"query {index + 1}: unknown type {query_type!r}")
+                params = query.get("params") or {}
+                if not isinstance(params, dict):
+                    raise ValueError(f"query {index + 1}: params must be an object")
+                if params.get("format") == "binary" or params.get("stream"):
+                    raise ValueError(f"query {index + 1}: format=binary and stream are not available in a batch")
+                if query_type == "invoice":
+                    invoice_months += max(1, int(params.get("months", 1)))
+                    if invoice_months > MAX_BATCH_INVOICE_MONTHS:
+                        raise ValueError(f"invoices in a batch may cover at most {MAX_BATCH_INVOICE_MONTHS} months in total")
+                parts.append((str(query.get("id", index)), query_type, params))
+        except (AttributeError, ValueError) as exc:
+            return self.json({"error": str(exc)}, status_code=400)
+
+        async def _run(part_id: str, query_type: str, params: dict[str, Any]) -> bytes:
+            try:
+                response = await BATCH_QUERY_VIEWS[query_type]().get(_BatchSubRequest(request, params))
+                status, payload = response.status, response.body
+            except Exception as exc:
+                _LOGGER.error("Batch query %s (%s) failed: %s", part_id, query_type, exc)
+                status, payload = 500, json.dumps({"error": str(exc)}).encode()
+            head = json.dumps({"id": part_id, "type": query_type, "status": status})
+            return head[:-1].encode() + b', "body": ' + payload + b"}"
+
+        tasks = [asyncio.ensure_future(_run(*part)) for part in parts]
+
+        if not body.get("stream"):
+            results = await asyncio.gather(*tasks)
+            return web.Response(
+                body=b'{"results": [' + b", ".join(results) + b"]}",
+                content_type="application/json",
+            )
+
+        stream = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await stream.prepare(request)
+        try:
+            for finished in asyncio.as_completed(tasks):
+                await stream.write(await finished + b"\n")
+        finally:
+            for task in tasks:
+                task.cancel()
+        await stream.write_eof()
+        return stream
+
+
+BATCH_QUERY_VIEWS: dict[str, type[HomeAssistantView]] = {
+    "mode": LenedaModeView,
+    "config": LenedaConfigView,
+    "sensors": LenedaSensorsView,
+    "data": LenedaDataView,
+    "custom": LenedaCustomDataView,
+    "timeseries": LenedaTimeseriesView,
+    "timeseries_per_meter": LenedaPerMeterTimeseriesView,
+    "frame": LenedaFrameView,
+    "costs": LenedaCostView,
+    "invoice": LenedaInvoiceView,
+    "feed_in_revenue": LenedaFeedInRevenueView,
+    "timings": LenedaTimingsView,
+}
+
+
 # ─── Registration helper ─────────────────────────────────────────
 
 def async_register_api_views(hass: HomeAssistant) -> None:
@@ -853,10 +2053,19 @@ def async_register_api_views(hass: HomeAssistant) -> None:
         LenedaCustomDataView(),
         LenedaTimeseriesView(),
         LenedaPerMeterTimeseriesView(),
+        LenedaFrameView(),
+        LenedaCostView(),
+        LenedaInvoiceView(),
+        LenedaReferencePowerOptimizeView(),
+        LenedaTariffCompareView(),
+        LenedaFeedInRevenueView(),
+        LenedaBatterySimulationView(),
         LenedaSensorsView(),
         LenedaConfigView(),
         LenedaConfigResetView(),
         LenedaHAEntitiesView(),
+        LenedaTimingsView(),
+        LenedaBatchView(),
     ]
     for view in views:
         hass.http.register_view(view)
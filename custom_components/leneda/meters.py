@@ -0,0 +1,130 @@
+"""Metering point registry for the Leneda integration.
+
+A config entry can describe meters in two places:
+- the fixed setup slots (``metering_point_id`` plus ``EXTRA_METER_SLOTS``)
+  collected by the config flow, and
+- an unbounded ``meters`` list in the entry options, managed through the
+  options flow, for installations with many more metering points.
+
+``MeterRegistry`` merges both into one de-duplicated, ordered list so the
+coordinator, sensors and HTTP API share a single view of the meters.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from .const import (
+    CONF_METERING_POINT_1_TYPES,
+    CONF_METERING_POINT_ID,
+    CONF_METERS,
+    EXTRA_METER_SLOTS,
+    METER_TYPE_CONSUMPTION,
+    METER_TYPE_GAS,
+    METER_TYPE_PRODUCTION,
+)
+
+
+@dataclass(frozen=True)
+class Meter:
+    """A configured metering point and what it measures."""
+
+    id: str
+    types: tuple[str, ...]
+
+
+def meter_type_for_obis(obis_code: str) -> str:
+    """Return the meter type that serves an OBIS code.
+
+    Production codes (1-1:2.*, 1-1:4.*, 1-65:2.*) → production meter
+    Gas codes (7-*) → gas meter
+    Everything else → consumption meter
+    """
+    if obis_code.startswith("7-"):
+        return METER_TYPE_GAS
+    if obis_code.startswith(("1-1:2.", "1-1:4.", "1-65:2.")):
+        return METER_TYPE_PRODUCTION
+    return METER_TYPE_CONSUMPTION
+
+
+def parse_meter_lines(text: str) -> list[dict[str, Any]]:
+    """Parse ``<meter id>: type[, type]`` lines from the options flow.
+
+    Raises ValueError for a line without a meter ID or with an unknown type.
+    """
+    meters: list[dict[str, Any]] = []
+    for raw in (text or "").splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        mid, _, types_part = line.partition(":")
+        mid = mid.strip()
+        if not mid:
+            raise ValueError(line)
+        types = [t.strip().lower() for t in types_part.split(",") if t.strip()]
+        if any(t not in ("consumption", "production", "gas") for t in types):
+            raise ValueError(line)
+        meters.append({"id": mid, "types": types or [METER_TYPE_CONSUMPTION]})
+    return meters
+
+
+def format_meter_lines(meters: list[dict[str, Any]]) -> str:
+    """Inverse of ``parse_meter_lines``."""
+    return "\n".join(f"{m['id']}: {', '.join(m.get('types', []))}" for m in meters)
+
+
+class MeterRegistry:
+    """Ordered, de-duplicated set of meters for one config entry."""
+
+    def __init__(self, meters: list[Meter]) -> None:
+        self._meters = meters
+        self._by_type: dict[str, list[str]] = {}
+        for meter in meters:
+            for meter_type in meter.types:
+                self._by_type.setdefault(meter_type, []).append(meter.id)
+
+    @classmethod
+    def from_entry(cls, entry: Any) -> MeterRegistry:
+        """Build the registry from setup slots and the options ``meters`` list."""
+        order: list[str] = []
+        types: dict[str, list[str]] = {}
+
+        def add(mid: Any, meter_types: Any) -> None:
+            mid = (mid or "").strip() if isinstance(mid, str) else ""
+            if not mid:
+                return
+            if mid not in types:
+                order.append(mid)
+                types[mid] = []
+            for meter_type in meter_types or []:
+                if meter_type not in types[mid]:
+                    types[mid].append(meter_type)
+
+        add(entry.data.get(CONF_METERING_POINT_ID), entry.data.get(CONF_METERING_POINT_1_TYPES, [METER_TYPE_CONSUMPTION]))
+        for id_key, types_key in EXTRA_METER_SLOTS:
+            add(entry.data.get(id_key), entry.data.get(types_key, []))
+
+        options = getattr(entry, "options", None) or {}
+        for meter in options.get(CONF_METERS, []) or []:
+            if isinstance(meter, dict):
+                add(meter.get("id"), meter.get("types"))
+
+        return cls([Meter(mid, tuple(types[mid])) for mid in order])
+
+    def __iter__(self) -> Iterator[Meter]:
+        return iter(self._meters)
+
+    def __len__(self) -> int:
+        return len(self._meters)
+
+    def ids(self, meter_type: str) -> list[str]:
+        """Return the IDs of all meters tagged with *meter_type*."""
+        return list(self._by_type.get(meter_type, []))
+
+    def as_tuples(self) -> list[tuple[str, list[str]]]:
+        """Return ``(id, types)`` pairs (the coordinator's ``meters`` format)."""
+        return [(m.id, list(m.types)) for m in self._meters]
+
+    def as_dicts(self) -> list[dict[str, Any]]:
+        """Return ``{"id", "types"}`` dicts (the dashboard config format)."""
+        return [{"id": m.id, "types": list(m.types)} for m in self._meters]
@@ -0,0 +1,112 @@
+"""Reference-power optimizer.
+
+Choosing ``reference_power_kw`` trades a capacity charge (per kW and month)
+against the exceedance surcharge (per kWh drawn above the reference). For a
+net-draw series the exceedance of every candidate threshold is evaluated in
+one sorted sweep (``exceedance.overage_curve``), so a year of 15-minute
+readings against hundreds of candidates costs a sort rather than a loop.
+
+The sweep is run for the whole period, for each local calendar month and
+for each scheduled reference-power window.
+"""
+from __future__ import annotations
+
+from datetime import tzinfo
+from typing import Any
+
+import numpy as np
+
+from .exceedance import IntervalSeries, overage_curve
+from .schedule import ReferenceSchedule, local_months
+
+MAX_CANDIDATES = 2000
+
+
+def candidate_grid(power_kw: np.ndarray, step_kw: float) -> np.ndarray:
+    """Return thresholds from 0 to just above the peak in *step_kw* steps."""
+    peak = float(np.nanmax(power_kw)) if len(power_kw) else 0.0
+    step_kw = max(step_kw, peak / MAX_CANDIDATES, 0.01)
+    return np.round(np.arange(0.0, peak + step_kw, step_kw), 4)
+
+
+def _curve(
+    power_kw: np.ndarray,
+    candidates: np.ndarray,
+    months: int,
+    capacity_rate: float,
+    exceedance_rate: float,
+    current_kw: float | None,
+) -> dict[str, Any]:
+    """Cost curve and optimum for one group of readings."""
+    exceedance = overage_curve(power_kw, candidates)
+    cost = candidates * capacity_rate * months + exceedance * exceedance_rate
+    best = int(np.argmin(cost))
+    result: dict[str, Any] = {
+        "intervals": int(len(power_kw)),
+        "months": months,
+        "peak_kw": round(float(power_kw.max()), 3) if len(power_kw) else 0.0,
+        "optimum_kw": float(candidates[best]),
+        "optimum_exceedance_kwh": round(float(exceedance[best]), 4),
+        "optimum_cost": round(float(cost[best]), 4),
+        "exceedance_kwh": np.round(exceedance, 4).tolist(),
+        "cost": np.round(cost, 4).tolist(),
+    }
+    if current_kw is not None and np.isfinite(current_kw):
+        current_exceedance = float(overage_curve(power_kw, np.array([current_kw]))[0])
+        current_cost = current_kw * capacity_rate * months + current_exceedance * exceedance_rate
+        result["current_kw"] = current_kw
+        result["current_exceedance_kwh"] = round(current_exceedance, 4)
+        result["current_cost"] = round(current_cost, 4)
+        result["savings"] = round(current_cost - float(cost[best]), 4)
+    return result
+
+
+def optimize_reference_power(
+    net_draw: IntervalSeries,
+    schedule: ReferenceSchedule,
+    capacity_rate: float,
+    exceedance_rate: float,
+    step_kw: float = 0.1,
+    tz: tzinfo | None = None,
+) -> dict[str, Any]:
+    """Sweep candidate reference powers over a net grid-draw series.
+
+    *capacity_rate* is the charge per kW of reference power per month. The
+    result holds the shared ``candidates_kw`` grid and, for the overall
+    period, each month and each window, the exceedance and cost curves plus
+    the cheapest threshold (and the current one for comparison).
+    """
+    known = net_draw.epoch >= 0
+    epoch = net_draw.epoch[known]
+    power = net_draw.values[known]
+    candidates = candidate_grid(power, step_kw)
+    if not len(power):
+        return {"candidates_kw": candidates.tolist(), "overall": None, "by_month": [], "by_window": []}
+
+    month_of = local_months(epoch, tz)
+    month_keys, month_inverse = np.unique(month_of, return_inverse=True)
+    total_months = len(month_keys)
+
+    overall = _curve(power, candidates, total_months, capacity_rate, exceedance_rate, schedule.base_kw)
+
+    by_month = []
+    for idx, month in enumerate(month_keys):
+        mask = month_inverse == idx
+        entry = _curve(power[mask], candidates, 1, capacity_rate, exceedance_rate, schedule.base_kw)
+        by_month.append({"month": str(month), **entry})
+
+    by_window = []
+    window_of = schedule.windows(epoch, tz)
+    for window in np.unique(window_of):
+        mask = window_of == window
+        label = "Base" if window < 0 else schedule.labels[window]
+        current = schedule.base_kw if window < 0 else float(np.nanmax(schedule.table[schedule.window_index == window]))
+        entry = _curve(power[mask], candidates, total_months, capacity_rate, exceedance_rate, current)
+        by_window.append({"window": int(window), "label": label, **entry})
+
+    return {
+        "candidates_kw": candidates.tolist(),
+        "overall": overall,
+        "by_month": by_month,
+        "by_window": by_window,
+    }
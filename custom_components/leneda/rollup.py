@@ -0,0 +1,134 @@
+"""Energy rollups (kWh per hour/day/week/month) on local-time boundaries.
+
+Two sources produce the same output:
+- raw readings (``IntervalSeries``) are converted to energy per interval
+  and summed into local buckets in one ``bincount`` pass;
+- Day-aggregated API responses (already kWh per day) are keyed to their
+  calendar day and summed into week/month buckets.
+
+Weeks start on Monday. Bucket labels are the local bucket start as an ISO
+timestamp with UTC offset.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Any
+
+import numpy as np
+
+from homeassistant.util import dt as dt_util
+
+from .exceedance import IntervalSeries
+from .schedule import local_epoch
+
+RESOLUTIONS = ("hour", "day", "week", "month")
+# Resolutions that can be built from Day-aggregated API data
+DAILY_RESOLUTIONS = ("day", "week", "month")
+_EPOCH_DAY = date(1970, 1, 1)
+
+
+def daily_totals(result: Any) -> dict[date, float]:
+    """Map the items of a Day-aggregated response to their calendar day.
+
+    Each item is keyed by the date 12 hours after its ``startedAt`` so the
+    mapping holds whether the API reports day starts at UTC or local midnight.
+    """
+    totals: dict[date, float] = {}
+    if not isinstance(result, dict):
+        return totals
+    for item in result.get("aggregatedTimeSeries") or []:
+        value = item.get("value")
+        started_at = item.get("startedAt")
+        if value is None or not started_at:
+            continue
+        try:
+            day = (datetime.fromisoformat(started_at.replace("Z", "+00:00")) + timedelta(hours=12)).date()
+        except (AttributeError, ValueError):
+            continue
+        totals[day] = totals.get(day, 0.0) + value
+    return totals
+
+
+def interval_hours(interval: str | None) -> float:
+    """Return the hours in an ISO-8601 interval such as ``PT15M`` or ``PT1H``."""
+    if not interval or not interval.startswith("PT"):
+        return 0.25
+    body = interval[2:]
+    try:
+        if body.endswith("M"):
+            return float(body[:-1]) / 60
+        if body.endswith("H"):
+            return float(body[:-1])
+    except ValueError:
+        pass
+    return 0.25
+
+
+def _bucket_of_day(day: date, resolution: str) -> date:
+    if resolution == "week":
+        return day - timedelta(days=day.weekday())
+    if resolution == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _label(epoch: int, tz: tzinfo) -> str:
+    """Return the local ISO label of a bucket starting at *epoch*."""
+    return datetime.fromtimestamp(epoch, tz).isoformat()
+
+
+def rollup_series(
+    series: IntervalSeries, resolution: str, energy_factor: float, tz: tzinfo | None = None
+) -> list[dict[str, Any]]:
+    """Sum readings into local buckets; *energy_factor* converts a reading to kWh.
+
+    Power readings (kW) use the interval length in hours, energy readings 1.
+    """
+    tz = tz or dt_util.DEFAULT_TIME_ZONE
+    known = series.epoch >= 0
+    if not known.any():
+        return []
+    epoch = series.epoch[known]
+    if resolution == "hour":
+        # UTC hours match local hours for whole-hour offsets and stay distinct
+        # across DST changes (the repeated autumn hour is two buckets)
+        starts, inverse = np.unique(epoch - epoch % 3600, return_inverse=True)
+    else:
+        local = local_epoch(epoch, tz)
+        day_number = local // 86400
+        if resolution == "week":
+            day_number = day_number - (day_number + 3) % 7  # 1970-01-01 was a Thursday
+        elif resolution == "month":
+            day_number = local.astype("datetime64[s]").astype("datetime64[M]").astype("datetime64[D]").astype(np.int64)
+        days, inverse = np.unique(day_number, return_inverse=True)
+        # Local midnight of each bucket back to epoch seconds (offset in force then)
+        starts = np.fromiter(
+            (datetime.combine(_EPOCH_DAY + timedelta(days=int(day)), time(), tz).timestamp() for day in days),
+            dtype=np.int64,
+            count=len(days),
+        )
+    sums = np.bincount(inverse, weights=series.values[known] * energy_factor, minlength=len(starts))
+    return [
+        {"startedAt": _label(int(start), tz), "value": round(float(total), 4)}
+        for start, total in zip(starts, sums)
+    ]
+
+
+def rollup_days(totals: dict[date, float], resolution: str, tz: tzinfo | None = None) -> list[dict[str, Any]]:
+    """Sum per-day kWh into day/week/month buckets."""
+    tz = tz or dt_util.DEFAULT_TIME_ZONE
+    buckets: dict[date, float] = {}
+    for day, value in totals.items():
+        key = _bucket_of_day(day, resolution)
+        buckets[key] = buckets.get(key, 0.0) + value
+    return [
+        {"startedAt": datetime(key.year, key.month, key.day, tzinfo=tz).isoformat(), "value": round(total, 4)}
+        for key, total in sorted(buckets.items())
+    ]
+
+
+def is_whole_days(start: datetime, end: datetime) -> bool:
+    """Return True when [start, end] spans whole local days."""
+    local_start = dt_util.as_local(start)
+    local_end = dt_util.as_local(end + timedelta(seconds=1))
+    return local_start.time() == local_end.time() == datetime.min.time()
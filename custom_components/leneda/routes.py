@@ -0,0 +1,108 @@
+"""Meter-route index shared by the HTTP API.
+
+A route is ``{"meter_id", "api_client", "coordinator"}``: which API client
+to ask for which metering point. The index is built once from the active
+coordinators and rebuilt only when a config entry is set up, unloaded or
+reloaded, so request handlers resolve coordinators and routes with plain
+dictionary lookups. OBIS codes are mapped to meter types by
+``meters.meter_type_for_obis``, the same rule the coordinator uses.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DATA_ROUTE_INDEX,
+    DOMAIN,
+    METER_TYPE_CONSUMPTION,
+    METER_TYPE_GAS,
+    METER_TYPE_PRODUCTION,
+    SHARED_DATA_KEYS,
+)
+from .meters import meter_type_for_obis
+
+METER_TYPES = (METER_TYPE_CONSUMPTION, METER_TYPE_PRODUCTION, METER_TYPE_GAS)
+
+
+class RouteIndex:
+    """Coordinators and de-duplicated meter routes, grouped by meter type."""
+
+    def __init__(self, coordinators: list[Any]) -> None:
+        self.coordinators = coordinators
+        self.routes: dict[str, list[dict[str, Any]]] = {meter_type: [] for meter_type in METER_TYPES}
+        self._preferred: dict[str, Any] = {}
+        seen: set[tuple[str, str]] = set()
+
+        for coordinator in coordinators:
+            for mid, types in getattr(coordinator, "meters", []):
+                meter_id = (mid or "").strip()
+                if not meter_id:
+                    continue
+                for meter_type in types or []:
+                    self._preferred.setdefault(meter_type, coordinator)
+                    if meter_type not in self.routes or (meter_type, meter_id) in seen:
+                        continue
+                    seen.add((meter_type, meter_id))
+                    self.routes[meter_type].append(
+                        {"meter_id": meter_id, "api_client": coordinator.api_client, "coordinator": coordinator}
+                    )
+
+        # Fall back to the first coordinator's per-type meter for empty types
+        first = self.first
+        if first:
+            fallbacks = {
+                METER_TYPE_CONSUMPTION: getattr(first, "consumption_meter", ""),
+                METER_TYPE_PRODUCTION: getattr(first, "production_meter", ""),
+                METER_TYPE_GAS: getattr(first, "gas_meter", "") if getattr(first, "has_gas", False) else "",
+            }
+            for meter_type, meter_id in fallbacks.items():
+                if not self.routes[meter_type] and meter_id:
+                    self.routes[meter_type].append(
+                        {"meter_id": meter_id, "api_client": first.api_client, "coordinator": first}
+                    )
+
+    @classmethod
+    def from_hass(cls, hass: HomeAssistant) -> RouteIndex:
+        """Build the index from the coordinators in ``hass.data``."""
+        return cls([
+            val
+            for key, val in hass.data.get(DOMAIN, {}).items()
+            if key not in SHARED_DATA_KEYS and hasattr(val, "data")
+        ])
+
+    @property
+    def first(self) -> Any | None:
+        """Return the first coordinator, or None."""
+        return self.coordinators[0] if self.coordinators else None
+
+    def preferred(self, meter_type: str | None = None) -> Any | None:
+        """Return a coordinator that has *meter_type*, or the first one."""
+        if meter_type is None:
+            return self.first
+        return self._preferred.get(meter_type, self.first)
+
+    def for_obis(self, obis: str) -> list[dict[str, Any]]:
+        """Return all routes that can serve *obis*."""
+        return self.routes[meter_type_for_obis(obis)]
+
+    def meter_ids(self) -> tuple[tuple[str, str], ...]:
+        """Return sorted ``(meter type, meter id)`` pairs (for cache keys)."""
+        return tuple(sorted(
+            (meter_type, route["meter_id"]) for meter_type, routes in self.routes.items() for route in routes
+        ))
+
+
+def get_route_index(hass: HomeAssistant) -> RouteIndex:
+    """Return the current route index, building it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    index = domain_data.get(DATA_ROUTE_INDEX)
+    if index is None:
+        index = domain_data[DATA_ROUTE_INDEX] = RouteIndex.from_hass(hass)
+    return index
+
+
+def invalidate_route_index(hass: HomeAssistant) -> None:
+    """Drop the route index (config entry set up, unloaded or reloaded)."""
+    hass.data.get(DOMAIN, {}).pop(DATA_ROUTE_INDEX, None)
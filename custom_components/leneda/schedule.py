@@ -0,0 +1,191 @@
+"""Compiled weekly schedules for time-window based billing settings.
+
+``BillingConfig`` windows (``reference_power_windows`` and later tariff
+windows) are defined by day group and a local ``HH:MM`` start/end. Rather
+than matching every 15-minute reading against every window, a schedule is
+compiled once into a 7×96 table (weekday × quarter-hour slot, local time)
+and readings are resolved with a single array index.
+
+Compiled tables are memoized on the window definitions and base value, so
+they are rebuilt only when the billing config or the reference-power
+source changes.
+"""
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .storage import get_effective_reference_power
+
+SLOTS_PER_DAY = 96
+SLOTS_PER_WEEK = 7 * SLOTS_PER_DAY
+SLOT_MINUTES = 15
+
+
+def _time_to_minutes(value: Any) -> int:
+    """Convert HH:MM to minutes since midnight."""
+    try:
+        hour, minute = value.split(":", 1)
+        return int(hour) * 60 + int(minute)
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+def _matches_day_group(weekday: int, day_group: str) -> bool:
+    """Return True when the weekday (Mon=0) matches the configured day group."""
+    if day_group == "weekdays":
+        return weekday < 5
+    if day_group == "weekends":
+        return weekday >= 5
+    return True
+
+
+def _matches_minutes(minute: int, start_minutes: int, end_minutes: int) -> bool:
+    """Return True when the minute of day falls within [start, end), wrapping midnight."""
+    if start_minutes == end_minutes:
+        return True
+    if start_minutes < end_minutes:
+        return start_minutes <= minute < end_minutes
+    return minute >= start_minutes or minute < end_minutes
+
+
+def windows_key(windows: Any, value_key: str) -> tuple:
+    """Return a hashable key describing *windows* (used for memoization)."""
+    if not isinstance(windows, list):
+        return ()
+    return tuple(
+        (
+            w.get("day_group", "all"),
+            w.get("start_time", "00:00"),
+            w.get("end_time", "00:00"),
+            str(w.get(value_key)),
+            str(w.get("label", "")),
+        )
+        for w in windows
+        if isinstance(w, dict)
+    )
+
+
+@lru_cache(maxsize=16)
+def compile_window_table(key: tuple, base_value: float | None) -> tuple[np.ndarray, np.ndarray]:
+    """Compile windows (as produced by ``windows_key``) into weekly slot tables.
+
+    Returns ``(values, window_index)``, both flat arrays of ``SLOTS_PER_WEEK``.
+    ``values`` holds the window value (NaN when no value applies) and
+    ``window_index`` the matching window position, or -1 for the base value.
+    The first matching window wins; a window with an invalid value resolves
+    to the base value.
+    """
+    base = np.nan if base_value is None else float(base_value)
+    values = np.full(SLOTS_PER_WEEK, base, dtype=np.float64)
+    window_index = np.full(SLOTS_PER_WEEK, -1, dtype=np.int16)
+
+    compiled = []
+    for day_group, start_time, end_time, raw_value, _label in key:
+        try:
+            value = float(raw_value)
+        except (TypeError, ValueError):
+            value = None
+        compiled.append((day_group, _time_to_minutes(start_time), _time_to_minutes(end_time), value))
+
+    for slot in range(SLOTS_PER_WEEK):
+        weekday, minute = divmod(slot, SLOTS_PER_DAY)
+        minute *= SLOT_MINUTES
+        for idx, (day_group, start_minutes, end_minutes, value) in enumerate(compiled):
+            if _matches_day_group(weekday, day_group) and _matches_minutes(minute, start_minutes, end_minutes):
+                if value is not None:
+                    values[slot] = value
+                    window_index[slot] = idx
+                break
+
+    values.flags.writeable = False
+    window_index.flags.writeable = False
+    return values, window_index
+
+
+def local_epoch(epoch: np.ndarray, tz: tzinfo | None = None) -> np.ndarray:
+    """Shift epoch seconds to local wall-clock seconds.
+
+    UTC offsets are resolved once per distinct hour, so DST transitions are
+    honoured without per-reading datetime conversions.
+    """
+    if not len(epoch):
+        return np.empty(0, dtype=np.int64)
+    tz = tz or dt_util.DEFAULT_TIME_ZONE
+    hours, inverse = np.unique(epoch // 3600, return_inverse=True)
+    offsets = np.fromiter(
+        (datetime.fromtimestamp(int(h) * 3600, tz).utcoffset().total_seconds() for h in hours),
+        dtype=np.int64,
+        count=len(hours),
+    )
+    return epoch + offsets[inverse]
+
+
+def local_months(epoch: np.ndarray, tz: tzinfo | None = None) -> np.ndarray:
+    """Return the local calendar month (``datetime64[M]``) of each epoch second."""
+    return local_epoch(epoch, tz).astype("datetime64[s]").astype("datetime64[M]")
+
+
+def week_slots(epoch: np.ndarray, tz: tzinfo | None = None) -> np.ndarray:
+    """Return the local weekday × quarter-hour slot for each epoch second."""
+    if not len(epoch):
+        return np.empty(0, dtype=np.int64)
+    local = local_epoch(epoch, tz)
+    # 1970-01-01 was a Thursday (weekday 3)
+    weekday = (local // 86400 + 3) % 7
+    return weekday * SLOTS_PER_DAY + (local % 86400) // (SLOT_MINUTES * 60)
+
+
+class ReferenceSchedule:
+    """Reference power (kW) per weekly slot; NaN where none applies."""
+
+    def __init__(
+        self,
+        table: np.ndarray,
+        base_kw: float | None,
+        window_index: np.ndarray | None = None,
+        labels: list[str] | None = None,
+    ) -> None:
+        self.table = table
+        self.base_kw = base_kw
+        self.window_index = window_index if window_index is not None else np.full(len(table), -1, dtype=np.int16)
+        self.labels = labels or []
+
+    @property
+    def is_constant(self) -> bool:
+        """True when no window deviates from the base reference power."""
+        return self.base_kw is not None and bool(np.all(self.table == self.base_kw))
+
+    @property
+    def fingerprint(self) -> str:
+        """Return a stable hash of the weekly table (for stored summaries)."""
+        return hashlib.sha1(self.table.tobytes()).hexdigest()[:16]
+
+    def lookup(self, epoch: np.ndarray, tz: tzinfo | None = None) -> np.ndarray:
+        """Return the reference power for each epoch second."""
+        return self.table[week_slots(epoch, tz)]
+
+    def windows(self, epoch: np.ndarray, tz: tzinfo | None = None) -> np.ndarray:
+        """Return the matching window position for each epoch second (-1 = base)."""
+        return self.window_index[week_slots(epoch, tz)]
+
+
+def get_reference_schedule(hass: HomeAssistant, entry: Any) -> ReferenceSchedule:
+    """Return the compiled reference-power schedule for the current config."""
+    base_kw = get_effective_reference_power(hass, entry)
+    storage = hass.data.get(DOMAIN, {}).get("storage")
+    windows = getattr(storage.billing_config, "reference_power_windows", []) if storage else []
+    table, window_index = compile_window_table(windows_key(windows, "reference_power_kw"), base_kw)
+    labels = [
+        str(w.get("label") or "").strip() or f"Window {i + 1}"
+        for i, w in enumerate(w for w in windows if isinstance(w, dict))
+    ]
+    return ReferenceSchedule(table, base_kw, window_index, labels)
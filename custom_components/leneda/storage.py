@@ -1,6 +1,8 @@
 """Storage for the Leneda integration."""
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from typing import Any
 
@@ -26,9 +28,28 @@ class LenedaStorage:
         """Initialize storage."""
         self.hass = hass
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
-        self.billing_config = BillingConfig()
+        self._billing_config = BillingConfig()
+        self._config_hash: str | None = None
         self.has_persisted_billing_config = False
 
+    @property
+    def billing_config(self) -> BillingConfig:
+        """Return the active billing configuration."""
+        return self._billing_config
+
+    @billing_config.setter
+    def billing_config(self, config: BillingConfig) -> None:
+        self._billing_config = config
+        self._config_hash = None
+
+    @property
+    def config_hash(self) -> str:
+        """Return a stable hash of the billing config (for cache keys)."""
+        if self._config_hash is None:
+            payload = json.dumps(self._billing_config.to_dict(), sort_keys=True, default=str)
+            self._config_hash = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+        return self._config_hash
+
     async def async_load(self) -> None:
         """Load data from storage."""
         data = await self._store.async_load()
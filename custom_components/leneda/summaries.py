@@ -0,0 +1,195 @@
+"""Materialized daily and monthly peak / exceedance summaries.
+
+Peak power and reference-power exceedance for long ranges used to require
+downloading every 15-minute consumption reading of the range. Instead, each
+closed local day is reduced once to ``(peak_kw, exceedance_kwh, intervals)``
+and stored per meter, tagged with the fingerprint of the reference schedule
+it was computed against. Once every day of a month is stored, the month is
+rolled up into a single row as well.
+
+A range query then reduces over at most one row per month or day, and only
+fetches raw data for days that are missing, incomplete, still inside the
+revision window, or were computed under a different schedule.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable
+
+import numpy as np
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SUMMARY_REVISION_DAYS
+from .exceedance import INTERVAL_HOURS, IntervalSeries
+from .schedule import ReferenceSchedule, local_epoch
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.peak_summaries"
+SAVE_DELAY = 30
+# A complete local day has 92-100 quarter-hours (DST); fewer means missing data
+MIN_DAY_INTERVALS = 92
+
+
+def day_summaries(
+    series: IntervalSeries, schedule: ReferenceSchedule, fallback_epoch: int
+) -> dict[date, tuple[float, float, int]]:
+    """Reduce a 15-min consumption series to ``{local day: (peak, exceedance, n)}``.
+
+    Readings without a timestamp are evaluated at *fallback_epoch*.
+    """
+    if not len(series):
+        return {}
+    epoch = np.where(series.epoch >= 0, series.epoch, fallback_epoch)
+    reference = schedule.lookup(epoch)
+    over = series.values - reference
+    over = np.where(over > 0, over, 0.0)  # NaN reference: no exceedance
+
+    day_number = local_epoch(epoch) // 86400
+    days, inverse = np.unique(day_number, return_inverse=True)
+    peaks = np.zeros(len(days), dtype=np.float64)
+    np.maximum.at(peaks, inverse, series.values)
+    exceedance = np.bincount(inverse, weights=over, minlength=len(days)) * INTERVAL_HOURS
+    counts = np.bincount(inverse, minlength=len(days))
+    epoch_date = date(1970, 1, 1)
+    return {
+        epoch_date + timedelta(days=int(day)): (float(peaks[i]), float(exceedance[i]), int(counts[i]))
+        for i, day in enumerate(days)
+    }
+
+
+class PeakSummaryStore:
+    """Persisted per-meter daily/monthly peak and exceedance rows."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        # "<meter>|<YYYY-MM-DD>" or "<meter>|<YYYY-MM>" -> [peak, exceedance, intervals, schedule]
+        self._rows: dict[str, list[Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load stored rows."""
+        data = await self._store.async_load()
+        if isinstance(data, dict):
+            self._rows = data.get("rows", {})
+        _LOGGER.debug("Loaded %d peak summary rows", len(self._rows))
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(lambda: {"rows": self._rows}, SAVE_DELAY)
+
+    def _fresh(self, key: str, fingerprint: str) -> tuple[float, float, int] | None:
+        row = self._rows.get(key)
+        if row is None or row[3] != fingerprint:
+            return None
+        return row[0], row[1], row[2]
+
+    def _store_days(
+        self, meter_id: str, fingerprint: str, days: dict[date, tuple[float, float, int]], closed_before: date
+    ) -> None:
+        changed = False
+        months: set[tuple[int, int]] = set()
+        for day, (peak, exceedance, count) in days.items():
+            if day >= closed_before or count < MIN_DAY_INTERVALS:
+                continue
+            self._rows[f"{meter_id}|{day.isoformat()}"] = [peak, exceedance, count, fingerprint]
+            months.add((day.year, day.month))
+            changed = True
+
+        for year, month in months:
+            first = date(year, month, 1)
+            last = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+            if last >= closed_before:
+                continue
+            rows = [self._fresh(f"{meter_id}|{d.isoformat()}", fingerprint) for d in _date_range(first, last)]
+            if all(rows):
+                self._rows[f"{meter_id}|{year:04d}-{month:02d}"] = [
+                    max(r[0] for r in rows), sum(r[1] for r in rows), sum(r[2] for r in rows), fingerprint,
+                ]
+        if changed:
+            self._schedule_save()
+
+    async def async_peak_and_exceedance(
+        self,
+        meter_id: str,
+        schedule: ReferenceSchedule,
+        start_dt: datetime,
+        end_dt: datetime,
+        fetch: Callable[[datetime, datetime], Awaitable[IntervalSeries]],
+    ) -> tuple[float, float]:
+        """Return (peak kW, exceedance kWh) for [start_dt, end_dt].
+
+        Whole closed days (or months) come from stored rows; *fetch* is
+        called once per contiguous run of the remaining days.
+        """
+        fingerprint = schedule.fingerprint
+        now = dt_util.now()
+        closed_before = now.date() - timedelta(days=SUMMARY_REVISION_DAYS)
+        first_day = dt_util.as_local(start_dt).date()
+        last_day = dt_util.as_local(end_dt).date()
+
+        def covered(first: date, last: date) -> bool:
+            return _day_start(first) >= start_dt and _day_start(last + timedelta(days=1)) - timedelta(seconds=1) <= end_dt
+
+        rows: list[tuple[float, float, int]] = []
+        missing: list[date] = []
+        whole_missing: set[date] = set()
+        day = first_day
+        while day <= last_day:
+            if day.day == 1:
+                month_last = (day + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+                month_row = covered(day, month_last) and self._fresh(
+                    f"{meter_id}|{day.year:04d}-{day.month:02d}", fingerprint
+                )
+                if month_row:
+                    rows.append(month_row)
+                    day = month_last + timedelta(days=1)
+                    continue
+            whole_day = covered(day, day)
+            day_row = whole_day and self._fresh(f"{meter_id}|{day.isoformat()}", fingerprint)
+            if day_row:
+                rows.append(day_row)
+            else:
+                missing.append(day)
+                if whole_day:
+                    whole_missing.add(day)
+            day += timedelta(days=1)
+
+        stored = len(rows)
+        runs: list[list[date]] = []
+        for day in missing:
+            if runs and runs[-1][-1] + timedelta(days=1) == day:
+                runs[-1].append(day)
+            else:
+                runs.append([day])
+
+        async def _fetch_run(run: list[date]) -> dict[date, tuple[float, float, int]]:
+            fetch_start = max(start_dt, _day_start(run[0]))
+            fetch_end = min(end_dt, _day_start(run[-1] + timedelta(days=1)) - timedelta(seconds=1))
+            series = await fetch(fetch_start, fetch_end)
+            return day_summaries(series, schedule, int(fetch_start.timestamp()))
+
+        missing_set = set(missing)
+        for computed in await asyncio.gather(*[_fetch_run(run) for run in runs]):
+            rows.extend(value for d, value in computed.items() if d in missing_set)
+            self._store_days(
+                meter_id, fingerprint, {d: v for d, v in computed.items() if d in whole_missing}, closed_before
+            )
+
+        _LOGGER.debug("Peak/exceedance for %s: %d stored row(s), %d day(s) fetched", meter_id, stored, len(missing))
+        if not rows:
+            return 0.0, 0.0
+        return max(0.0, max(r[0] for r in rows)), sum(r[1] for r in rows)
+
+
+def _day_start(day: date) -> datetime:
+    return dt_util.start_of_local_day(day)
+
+
+def _date_range(first: date, last: date) -> list[date]:
+    return [first + timedelta(days=i) for i in range((last - first).days + 1)]
@@ -0,0 +1,210 @@
+"""Debug tracing helpers for the Leneda integration.
+
+Leneda responses can be large (a month of 15-min data is ~3000 items per
+OBIS code), so debug logging never formats whole payloads. Instead a short
+summary is logged (byte size, item count, min/max/sum of values) and only
+when DEBUG is enabled for the calling logger.
+
+Each coordinator refresh also records a ``RefreshTimeline``: named phases
+with durations and API call counts, kept in memory for diagnostics.
+
+For troubleshooting, full payloads can additionally be captured to a JSONL
+file for a random sample of calls by setting the environment variable
+``LENEDA_PAYLOAD_CAPTURE`` to a sample rate between 0 and 1. The file is
+written next to Home Assistant's configuration (see ``async_setup_tracing``).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_ENV = "LENEDA_PAYLOAD_CAPTURE"
+CAPTURE_FILENAME = "leneda_payloads.jsonl"
+
+
+class _PayloadCapture:
+    """Sampled full-payload capture to a JSONL file."""
+
+    def __init__(self) -> None:
+        self.hass: HomeAssistant | None = None
+        self.path: str | None = None
+        self.sample_rate = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None and self.sample_rate > 0
+
+    def should_capture(self) -> bool:
+        return self.enabled and random.random() < self.sample_rate
+
+    def write(self, label: str, context: tuple[Any, ...], payload: Any) -> None:
+        """Append one payload record (runs in the executor).
+
+        Errors are logged here: the executor job is not awaited.
+        """
+        try:
+            record = {
+                "ts": dt_util.utcnow().isoformat(),
+                "label": label,
+                "context": [str(c) for c in context],
+                "payload": payload,
+            }
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, default=str) + "\n")
+        except Exception as err:
+            _LOGGER.warning("Could not write Leneda payload capture to %s: %s", self.path, err)
+
+
+_capture = _PayloadCapture()
+
+
+def async_setup_tracing(hass: HomeAssistant) -> None:
+    """Enable sampled payload capture if requested via the environment."""
+    raw = os.environ.get(CAPTURE_ENV, "").strip()
+    if not raw:
+        return
+    try:
+        rate = min(1.0, max(0.0, float(raw)))
+    except ValueError:
+        _LOGGER.warning("Ignoring invalid %s value: %s", CAPTURE_ENV, raw)
+        return
+    _capture.hass = hass
+    _capture.path = hass.config.path(CAPTURE_FILENAME)
+    _capture.sample_rate = rate
+    _LOGGER.info("Leneda payload capture enabled (rate=%s, file=%s)", rate, _capture.path)
+
+
+def summarize_payload(payload: Any, size: int | None = None) -> dict[str, Any]:
+    """Return a compact summary of a Leneda API payload."""
+    summary: dict[str, Any] = {}
+    if size is not None:
+        summary["bytes"] = size
+
+    if isinstance(payload, dict):
+        if "items" in payload:
+            series = payload.get("items") or []
+        elif "aggregatedTimeSeries" in payload:
+            series = payload.get("aggregatedTimeSeries") or []
+        else:
+            summary["keys"] = len(payload)
+            return summary
+    elif isinstance(payload, list):
+        series = payload
+    else:
+        summary["type"] = type(payload).__name__
+        return summary
+
+    summary["items"] = len(series)
+    values = [
+        item["value"] for item in series
+        if isinstance(item, dict) and isinstance(item.get("value"), (int, float))
+    ]
+    if values:
+        summary["min"] = min(values)
+        summary["max"] = max(values)
+        summary["sum"] = round(sum(values), 4)
+    if series and isinstance(series[0], dict):
+        first = series[0].get("startedAt") or series[0].get("startedAtUtc")
+        last = series[-1].get("startedAt") or series[-1].get("startedAtUtc")
+        if first:
+            summary["first"] = first
+            summary["last"] = last
+    return summary
+
+
+def trace_payload(
+    logger: logging.Logger,
+    label: str,
+    payload: Any,
+    *context: Any,
+    size: int | None = None,
+) -> None:
+    """Log a payload summary at DEBUG level, optionally capturing it in full.
+
+    Costs a single ``isEnabledFor`` check when debug logging is off.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    logger.debug("%s %s: %s", label, " ".join(str(c) for c in context), summarize_payload(payload, size))
+
+    if _capture.should_capture():
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            _capture.write(label, context, payload)
+        else:
+            # Tracked by Home Assistant (waited for on shutdown)
+            _capture.hass.async_add_executor_job(_capture.write, label, context, payload)
+
+
+class RefreshTimeline:
+    """Named timing spans for one coordinator refresh.
+
+    Sequential phases are opened with ``begin`` (which closes the previous
+    one); concurrent fetch groups are timed individually with ``gather``.
+    """
+
+    def __init__(self) -> None:
+        self.started_at = dt_util.utcnow()
+        self._t0 = time.perf_counter()
+        self._open: tuple[str, float] | None = None
+        self.spans: dict[str, dict[str, Any]] = {}
+        self.status = "running"
+        self.duration_ms: float | None = None
+
+    def _record(self, name: str, seconds: float, calls: int = 0) -> None:
+        span = self.spans.setdefault(name, {"ms": 0.0, "calls": 0, "count": 0})
+        span["ms"] += seconds * 1000
+        span["calls"] += calls
+        span["count"] += 1
+
+    def _close_open(self) -> None:
+        if self._open is not None:
+            name, t = self._open
+            self._record(name, time.perf_counter() - t)
+            self._open = None
+
+    def begin(self, name: str) -> None:
+        """Start a sequential phase, ending the previous one."""
+        self._close_open()
+        self._open = (name, time.perf_counter())
+
+    def add_calls(self, name: str, calls: int) -> None:
+        """Attribute API calls to a span."""
+        self.spans.setdefault(name, {"ms": 0.0, "calls": 0, "count": 0})["calls"] += calls
+
+    async def gather(self, name: str, coros: list[Any]) -> list[Any]:
+        """Gather *coros* (exceptions returned) and record the wall time."""
+        t = time.perf_counter()
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        self._record(name, time.perf_counter() - t, len(coros))
+        return results
+
+    def finish(self, status: str = "ok") -> None:
+        """Close the timeline."""
+        self._close_open()
+        self.status = status
+        self.duration_ms = (time.perf_counter() - self._t0) * 1000
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {
+            "started_at": self.started_at.isoformat(),
+            "status": self.status,
+            "duration_ms": round(self.duration_ms, 1) if self.duration_ms is not None else None,
+            "spans": {
+                name: {"ms": round(span["ms"], 1), "calls": span["calls"], "count": span["count"]}
+                for name, span in self.spans.items()
+            },
+        }